@@ -0,0 +1,231 @@
+import math
+import random
+from functools import partial
+
+import numpy as np
+
+
+# Nombre de valeurs tirees a chaque remplissage d'un flux
+TAILLE_BLOC = 1024
+# Plus grand flottant strictement inferieur a 1, borne des uniformes complementaires 1 - U
+UNIFORME_MAX = math.nextafter(1.0, 0.0)
+
+
+class Variables:
+    """La classe Variables fournit les variables aleatoires d'une simulation sous forme de quatre flux: les temps
+    entre arrivees, les temps de service, les cadis et les tolerances. Les valeurs sont standardisees (exponentielles
+    de parametre 1 et uniformes sur [0, 1[) et mises a l'echelle par la simulation, les flux ne dependent donc pas des
+    parametres du magasin. Avec une graine NumPy, chaque flux a son propre generateur et est tire par blocs de
+    taille_bloc valeurs; avec un random.Random, les quatre flux tirent une valeur a la fois dans ce generateur, dans
+    l'ordre ou la simulation les demande.
+
+    Pour les paires antithetiques, toutes les valeurs sont obtenues par inversion d'uniformes U (une exponentielle
+    vaut -log(1 - U)), et le second membre de la paire utilise les uniformes complementaires 1 - U.
+
+    Attributs:
+    ---------
+    arrivee: renvoie la prochaine exponentielle standard des temps entre arrivees
+            :type: callable
+    service: renvoie la prochaine exponentielle standard des temps de service
+            :type: callable
+    cadi: renvoie la prochaine uniforme standard des montants de cadi
+            :type: callable
+    tolerance: renvoie la prochaine exponentielle standard des temps d'attente maximum
+            :type: callable
+    flux: l'etat des quatre flux tires par blocs, None avec un random.Random
+            :type: tuple
+    generateur: le random.Random dont sont tires les flux, None avec une graine NumPy
+            :type: random.Random
+    antithetique: None hors paire antithetique, sinon le membre de la paire
+            :type: bool
+
+    Une instance de Variables peut etre copiee ou serialisee par pickle: la copie reprend les flux la ou ils en
+    sont, et tire ensuite les memes valeurs que l'original.
+    """
+
+    def __init__(self, graine=None, taille_bloc=TAILLE_BLOC, antithetique=None):
+        """Constructeur de la classe Variables.
+
+        :param graine: un entier, une numpy.random.SeedSequence, un numpy.random.Generator ou un random.Random.
+                       None donne des flux initialises par le systeme. Un entier ou une SeedSequence donne toujours
+                       les memes flux; un Generator ou un random.Random avance a chaque construction, comme pour
+                       des tirages successifs, et des Variables construites avec le meme sont independantes.
+        :type graine: int or numpy.random.SeedSequence or numpy.random.Generator or random.Random
+        :param taille_bloc: le nombre de valeurs tirees a chaque remplissage d'un flux
+        :type taille_bloc: int
+        :param antithetique: None hors paire antithetique, False pour le premier membre d'une paire et True pour le
+                             second, qui utilise les uniformes complementaires 1 - U. Les deux membres d'une
+                             paire se construisent avec le meme entier ou la meme SeedSequence.
+        :type antithetique: bool
+        :raise ValueError: si une paire antithetique est construite avec un numpy.random.Generator
+        """
+        if antithetique is not None and isinstance(graine, np.random.Generator):
+            raise ValueError("Les membres d'une paire antithetique se construisent avec le meme entier ou la meme "
+                             "SeedSequence, un Generator donnerait des flux differents a chacun")
+        self.antithetique = antithetique
+        if isinstance(graine, random.Random):
+            self.generateur = graine
+            self.flux = None
+        elif antithetique is None:
+            arrivee, service, cadi, tolerance = _generateurs(graine, 4)
+            self.generateur = None
+            self.flux = (Flux(arrivee.standard_exponential, taille_bloc),
+                         Flux(service.standard_exponential, taille_bloc), Flux(cadi.random, taille_bloc),
+                         Flux(tolerance.standard_exponential, taille_bloc))
+        else:
+            arrivee, service, cadi, tolerance = _generateurs(graine, 4)
+            self.generateur = None
+            self.flux = (Flux(partial(_exponentielles, arrivee, antithetique), taille_bloc),
+                         Flux(partial(_exponentielles, service, antithetique), taille_bloc),
+                         Flux(partial(_uniformes, cadi, antithetique), taille_bloc),
+                         Flux(partial(_exponentielles, tolerance, antithetique), taille_bloc))
+        self._relie()
+
+    def _relie(self):
+        """Construit les fonctions arrivee, service, cadi et tolerance a partir de l'etat des flux.
+        """
+        if self.flux is None:
+            # random.Random.expovariate tire deja ses exponentielles par inversion
+            if self.antithetique:
+                uniforme = partial(_complement, self.generateur.random)
+                exponentielle = partial(_exponentielle, uniforme)
+            else:
+                uniforme = self.generateur.random
+                exponentielle = partial(self.generateur.expovariate, 1)
+            self.arrivee = exponentielle
+            self.service = exponentielle
+            self.cadi = uniforme
+            self.tolerance = exponentielle
+        else:
+            self.arrivee, self.service, self.cadi, self.tolerance = (_flux(flux).__next__ for flux in self.flux)
+
+    def __getstate__(self):
+        return {'flux': self.flux, 'generateur': self.generateur, 'antithetique': self.antithetique}
+
+    def __setstate__(self, etat):
+        self.__dict__.update(etat)
+        self._relie()
+
+
+class Flux:
+    """La classe Flux represente l'etat d'un flux de valeurs tirees par blocs: le tirage d'un bloc et les valeurs
+    restantes du bloc en cours.
+
+    Attributs:
+    ---------
+    tirage: la methode du generateur NumPy qui tire un bloc de valeurs
+            :type: callable
+    taille_bloc: le nombre de valeurs tirees a la fois
+            :type: int
+    valeurs: l'iterateur sur les valeurs du bloc en cours
+            :type: iterator
+    """
+
+    __slots__ = ('tirage', 'taille_bloc', 'valeurs')
+
+    def __init__(self, tirage, taille_bloc):
+        """Constructeur de la classe Flux. Le premier bloc n'est tire qu'a la premiere valeur demandee.
+
+        :param tirage: la methode du generateur NumPy qui tire un bloc de valeurs
+        :type tirage: callable
+        :param taille_bloc: le nombre de valeurs tirees a la fois
+        :type taille_bloc: int
+        """
+        self.tirage = tirage
+        self.taille_bloc = taille_bloc
+        self.valeurs = iter(())
+
+
+def _generateurs(graine, nombre):
+    """Renvoie les generateurs NumPy independants des flux d'une graine. Un entier ou une SeedSequence n'est pas
+    modifie: la meme SeedSequence donne toujours les memes flux, comme un entier. Un Generator engendre ses
+    generateurs par Generator.spawn, qui l'avance: chaque appel avec le meme Generator donne d'autres flux,
+    independants des precedents.
+
+    :param graine: un entier, une numpy.random.SeedSequence, un numpy.random.Generator ou None
+    :type graine: int or numpy.random.SeedSequence or numpy.random.Generator
+    :param nombre: le nombre de generateurs
+    :type nombre: int
+    :return: les generateurs, derives des enfants 0 a nombre - 1 de la SeedSequence de la graine, ou engendres par
+             le Generator
+    :rtype: list
+    """
+    if isinstance(graine, np.random.Generator):
+        return graine.spawn(nombre)
+    sequence = graine if isinstance(graine, np.random.SeedSequence) else np.random.SeedSequence(graine)
+    return [np.random.Generator(np.random.PCG64(np.random.SeedSequence(sequence.entropy,
+                                                                       spawn_key=sequence.spawn_key + (i,),
+                                                                       pool_size=sequence.pool_size)))
+            for i in range(nombre)]
+
+
+def _flux(flux):
+    """Generateur infini des valeurs d'un Flux, qui tient l'etat du flux a jour.
+
+    :param flux: l'etat du flux
+    :type flux: Flux
+    """
+    while True:
+        yield from flux.valeurs
+        flux.valeurs = iter(flux.tirage(flux.taille_bloc).tolist())
+
+
+def _uniformes(generateur, antithetique, taille):
+    """Tire un bloc d'uniformes U sur [0, 1[, ou leurs complementaires 1 - U bornes par UNIFORME_MAX.
+
+    :param generateur: le generateur NumPy du flux
+    :type generateur: numpy.random.Generator
+    :param antithetique: si vrai, renvoie les uniformes complementaires
+    :type antithetique: bool
+    :param taille: le nombre de valeurs a tirer
+    :type taille: int
+    :return: les uniformes
+    :rtype: numpy.ndarray
+    """
+    uniformes = generateur.random(taille)
+    if antithetique:
+        return np.minimum(1.0 - uniformes, UNIFORME_MAX)
+    return uniformes
+
+
+def _exponentielles(generateur, antithetique, taille):
+    """Tire un bloc d'exponentielles standard par inversion des uniformes de _uniformes.
+    """
+    return -np.log1p(-_uniformes(generateur, antithetique, taille))
+
+
+def _complement(uniforme):
+    return min(1.0 - uniforme(), UNIFORME_MAX)
+
+
+def _exponentielle(uniforme):
+    return -math.log(1.0 - uniforme())
+
+
+def graine_replication(graine_maitre, *cle):
+    """Derive de la graine maitre d'un balayage la graine d'une replication. Les graines obtenues pour des cles
+    differentes donnent des suites aleatoires independantes, quel que soit l'ordre ou le processus dans lequel les
+    replications sont executees.
+
+    :param graine_maitre: la graine du balayage
+    :type graine_maitre: int
+    :param cle: les entiers identifiant la replication, par exemple le nombre de serveurs et le numero de replication
+    :type cle: int
+    :return: la graine de la replication
+    :rtype: numpy.random.SeedSequence
+    """
+    return np.random.SeedSequence(graine_maitre, spawn_key=cle)
+
+
+def graine_maitre(graine=None):
+    """Renvoie la graine maitre d'un balayage, tiree du systeme si aucune n'est donnee afin que le balayage puisse
+    etre rejoue.
+
+    :param graine: la graine maitre choisie, ou None
+    :type graine: int
+    :return: la graine maitre
+    :rtype: int
+    """
+    if graine is None:
+        return np.random.SeedSequence().entropy
+    return graine
@@ -0,0 +1,178 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from aleatoire import graine_replication
+from extension import SimulationOriginale
+from load_config import load_config, parametres_simulation
+from main import Simulation
+
+# Classes de simulation mesurees, par nom
+CLASSES = {'Simulation': Simulation, 'SimulationOriginale': SimulationOriginale}
+
+
+def mesure(classe, parametres, nbre_serveurs, lam, temps_simulation, nb_replications, graine=0):
+    """Mesure la vitesse d'une classe de simulation pour un point de la grille. Les replications sont d'abord
+    chronometrees sans suivi de la memoire, puis une replication supplementaire est simulee sous tracemalloc pour
+    le pic de memoire. Les evenements d'une replication sont ceux que le moteur retire de l'echeancier, abandons
+    perimes compris: ils sont comptes par une Instrumentation lors d'une seconde simulation, non chronometree, avec
+    la meme graine.
+
+    :param classe: la classe de simulation a mesurer (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple (x, y, z, w, lam, mu, alpha, beta, temps_simulation) renvoye par
+                       parametres_simulation, dont lam et temps_simulation sont remplaces
+    :type parametres: tuple
+    :param nbre_serveurs: le nombre de serveurs
+    :type nbre_serveurs: int
+    :param lam: le taux d'arrivee
+    :type lam: float
+    :param temps_simulation: la duree de chaque replication
+    :type temps_simulation: float
+    :param nb_replications: le nombre de replications chronometrees
+    :type nb_replications: int
+    :param graine: la graine maitre des replications, la meme graine donne les memes evenements
+    :type graine: int
+    :return: le point de la grille et ses mesures: evenements par seconde, temps par replication en secondes et
+             pic de memoire en octets
+    :rtype: dict
+    """
+    x, y, z, w, _, mu, alpha, beta, _ = parametres
+    nb_evenements = 0
+    duree = 0.0
+    for i in range(nb_replications):
+        simulation = classe(x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation,
+                            graine_replication(graine, i))
+        debut = time.perf_counter()
+        simulation.simulation_magasin()
+        duree += time.perf_counter() - debut
+        simulation = classe(x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation,
+                            graine_replication(graine, i), instrumente=True)
+        simulation.simulation_magasin()
+        nb_evenements += sum(simulation.instrumentation.nb_evenements)
+
+    simulation = classe(x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation,
+                        graine_replication(graine, nb_replications))
+    tracemalloc.start()
+    try:
+        simulation.simulation_magasin()
+        pic_memoire = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {'classe': classe.__name__, 'nbre_serveurs': nbre_serveurs, 'lambda': lam,
+            'temps_simulation': temps_simulation, 'replications': nb_replications,
+            'evenements_par_seconde': nb_evenements / duree if duree > 0 else 0.0,
+            'temps_replication': duree / nb_replications, 'pic_memoire': pic_memoire}
+
+
+def banc_essai(classes, parametres, nbre_serveurs, lambdas, horizons, nb_replications, graine=0):
+    """Mesure chaque classe de simulation sur la grille des nombres de serveurs, des taux d'arrivee et des durees
+    de simulation (voir mesure).
+
+    :param classes: les classes de simulation a mesurer
+    :type classes: list
+    :param parametres: le tuple renvoye par parametres_simulation
+    :type parametres: tuple
+    :param nbre_serveurs: les nombres de serveurs de la grille
+    :type nbre_serveurs: list
+    :param lambdas: les taux d'arrivee de la grille
+    :type lambdas: list
+    :param horizons: les durees de simulation de la grille
+    :type horizons: list
+    :param nb_replications: le nombre de replications chronometrees par point
+    :type nb_replications: int
+    :param graine: la graine maitre des replications
+    :type graine: int
+    :return: les mesures de chaque point, dans l'ordre de la grille
+    :rtype: list
+    """
+    return [mesure(classe, parametres, a, lam, temps_simulation, nb_replications, graine)
+            for classe in classes for a in nbre_serveurs for lam in lambdas for temps_simulation in horizons]
+
+
+def compare_reference(resultats, reference, seuil):
+    """Compare des mesures a celles d'une reference. Un point regresse si son debit d'evenements baisse, ou si son
+    pic de memoire augmente, de plus de la fraction seuil de la valeur de reference. Les points absents de la
+    reference sont ignores.
+
+    :param resultats: les mesures renvoyees par banc_essai
+    :type resultats: list
+    :param reference: les mesures de reference, au meme format
+    :type reference: list
+    :param seuil: l'ecart relatif tolere
+    :type seuil: float
+    :return: un message par regression constatee
+    :rtype: list
+    """
+    references = {_cle(point): point for point in reference}
+    regressions = []
+    for point in resultats:
+        ancien = references.get(_cle(point))
+        if ancien is None:
+            continue
+        if point['evenements_par_seconde'] < (1 - seuil) * ancien['evenements_par_seconde']:
+            regressions.append("%s C=%d lambda=%s temps=%s: %.0f evenements/s au lieu de %.0f"
+                               % (_cle(point) + (point['evenements_par_seconde'],
+                                                 ancien['evenements_par_seconde'])))
+        if point['pic_memoire'] > (1 + seuil) * ancien['pic_memoire']:
+            regressions.append("%s C=%d lambda=%s temps=%s: pic de memoire de %d octets au lieu de %d"
+                               % (_cle(point) + (point['pic_memoire'], ancien['pic_memoire'])))
+    return regressions
+
+
+def _cle(point):
+    return point['classe'], point['nbre_serveurs'], point['lambda'], point['temps_simulation']
+
+
+def options_banc(config):
+    """Renvoie la grille et les parametres de la section BANC de config.ini.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :return: le tuple (nbre_serveurs, lambdas, horizons, nb_replications, seuil)
+    :rtype: tuple
+    """
+    section = config['BANC'] if config.has_section('BANC') else {}
+    return ([int(a) for a in section.get('nombres_serveurs', '5, 12, 25').split(',')],
+            [float(lam) for lam in section.get('lambdas', '0.6, 1.2, 2.4').split(',')],
+            [float(temps) for temps in section.get('temps_simulation', '600, 6000').split(',')],
+            int(section.get('replications', 5)), float(section.get('seuil', 0.2)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mesure la vitesse de Simulation et SimulationOriginale selon la "
+                                                 "section BANC de config.ini.")
+    parser.add_argument('--sortie', default='banc_essai.json', help="le fichier JSON des mesures")
+    parser.add_argument('--reference', help="un fichier JSON de mesures de reference a comparer")
+    parser.add_argument('--seuil', type=float, help="l'ecart relatif tolere, celui de config.ini par defaut")
+    parser.add_argument('--classe', choices=sorted(CLASSES), action='append', help="la classe a mesurer, "
+                                                                                 "toutes par defaut")
+    arguments = parser.parse_args()
+
+    CONFIG = load_config()
+    nbre_serveurs, lambdas, horizons, nb_replications, seuil = options_banc(CONFIG)
+    if arguments.seuil is not None:
+        seuil = arguments.seuil
+    classes = [CLASSES[nom] for nom in arguments.classe or sorted(CLASSES)]
+    resultats = banc_essai(classes, parametres_simulation(CONFIG), nbre_serveurs, lambdas, horizons,
+                           nb_replications)
+    for point in resultats:
+        print("%s C=%d lambda=%s temps=%s: %.0f evenements/s, %.4f s par replication, pic de %d octets"
+              % (_cle(point) + (point['evenements_par_seconde'], point['temps_replication'],
+                                point['pic_memoire'])))
+    with open(arguments.sortie, 'w') as fichier:
+        json.dump({'python': platform.python_version(), 'machine': platform.machine(), 'mesures': resultats},
+                  fichier, indent=2)
+
+    if arguments.reference:
+        with open(arguments.reference) as fichier:
+            regressions = compare_reference(resultats, json.load(fichier)['mesures'], seuil)
+        if regressions:
+            print("\n%d regressions de plus de %d%%:" % (len(regressions), round(100 * seuil)), file=sys.stderr)
+            for regression in regressions:
+                print("\t" + regression, file=sys.stderr)
+            sys.exit(1)
@@ -0,0 +1,130 @@
+import hashlib
+import sqlite3
+
+from parallele import CHAMPS_RESUME
+
+# Version du modele simule, a incrementer lorsqu'une modification du moteur change les resultats d'une graine afin
+# que les resultats deja en cache ne soient plus utilises
+VERSION_MODELE = 1
+
+
+class CacheResultats:
+    """La classe CacheResultats conserve sur disque, dans une base SQLite, le resume de chaque replication simulee
+    (voir parallele.resume_cellule). Une replication est designee par l'empreinte de tout ce qui determine son
+    resultat: la classe de simulation, les parametres X, Y, Z, W, lambda, mu, alpha, le nombre de serveurs, la duree
+    de la simulation et sa graine. Le cache ne depasse pas taille_max replications: au-dela, les replications lues
+    ou ecrites le moins recemment sont supprimees.
+
+    Attributs:
+    ---------
+    chemin: le chemin de la base SQLite
+            :type: str
+    taille_max: le nombre maximum de replications conservees
+            :type: int
+    connexion: la connexion a la base
+            :type: sqlite3.Connection
+    acces: le numero du dernier acces, qui date les lectures et ecritures
+            :type: int
+    """
+
+    def __init__(self, chemin, taille_max=100000):
+        """Constructeur de la classe CacheResultats. La base est creee si elle n'existe pas.
+
+        :param chemin: le chemin de la base SQLite
+        :type chemin: str
+        :param taille_max: le nombre maximum de replications conservees
+        :type taille_max: int
+        """
+        self.chemin = chemin
+        self.taille_max = taille_max
+        self.connexion = sqlite3.connect(chemin)
+        self.connexion.execute("CREATE TABLE IF NOT EXISTS resultats (cle TEXT PRIMARY KEY, acces INTEGER, %s)"
+                               % ", ".join("%s REAL" % champ for champ in CHAMPS_RESUME))
+        self.connexion.execute("CREATE INDEX IF NOT EXISTS resultats_acces ON resultats (acces)")
+        self.acces = self.connexion.execute("SELECT COALESCE(MAX(acces), 0) FROM resultats").fetchone()[0]
+
+    @staticmethod
+    def cle(classe, parametres, nbre_serveurs, graine, cle_replication, antithetique=None):
+        """Calcule l'empreinte d'une replication.
+
+        :param classe: la classe de simulation
+        :type classe: type
+        :param parametres: le tuple (x, y, z, w, lam, mu, alpha, beta, temps_simulation) renvoye par
+                           parametres_simulation, beta n'intervient pas
+        :type parametres: tuple
+        :param nbre_serveurs: le nombre de serveurs
+        :type nbre_serveurs: int
+        :param graine: la graine maitre du balayage
+        :type graine: int
+        :param cle_replication: les entiers dont la graine de la replication est derivee (voir
+                                aleatoire.graine_replication)
+        :type cle_replication: tuple
+        :param antithetique: None hors paire antithetique, sinon le membre de la paire
+        :type antithetique: bool
+        :return: l'empreinte de la replication
+        :rtype: str
+        """
+        x, y, z, w, lam, mu, alpha, beta, temps_simulation = parametres
+        contenu = (VERSION_MODELE, classe.__name__, x, y, z, w, lam, mu, alpha, nbre_serveurs, temps_simulation,
+                   graine, tuple(cle_replication), antithetique)
+        return hashlib.sha256(repr(contenu).encode()).hexdigest()
+
+    def lit(self, cles):
+        """Renvoie les resumes en cache d'une liste de replications et date leur acces.
+
+        :param cles: les empreintes des replications
+        :type cles: list
+        :return: le resume de chaque replication presente dans le cache, indexe par son empreinte
+        :rtype: dict
+        """
+        resumes = {}
+        cles = list(cles)
+        for debut in range(0, len(cles), 500):
+            paquet = cles[debut:debut + 500]
+            lignes = self.connexion.execute("SELECT cle, %s FROM resultats WHERE cle IN (%s)"
+                                            % (", ".join(CHAMPS_RESUME), ", ".join("?" * len(paquet))), paquet)
+            for ligne in lignes:
+                resumes[ligne[0]] = tuple(ligne[1:])
+        if resumes:
+            self.acces += 1
+            self.connexion.executemany("UPDATE resultats SET acces = ? WHERE cle = ?",
+                                       [(self.acces, cle) for cle in resumes])
+            self.connexion.commit()
+        return resumes
+
+    def ecrit(self, resumes):
+        """Ajoute des resumes au cache, puis supprime les replications les plus anciennes si le cache depasse
+        taille_max replications.
+
+        :param resumes: le resume de chaque replication, indexe par son empreinte
+        :type resumes: dict
+        """
+        if not resumes:
+            return
+        self.acces += 1
+        self.connexion.executemany("INSERT OR REPLACE INTO resultats VALUES (?, ?, %s)"
+                                   % ", ".join("?" * len(CHAMPS_RESUME)),
+                                   [(cle, self.acces) + tuple(resume) for cle, resume in resumes.items()])
+        excedent = len(self) - self.taille_max
+        if excedent > 0:
+            self.connexion.execute("DELETE FROM resultats WHERE cle IN "
+                                   "(SELECT cle FROM resultats ORDER BY acces LIMIT ?)", (excedent,))
+        self.connexion.commit()
+
+    def ferme(self):
+        self.connexion.close()
+
+    def __len__(self):
+        return self.connexion.execute("SELECT COUNT(*) FROM resultats").fetchone()[0]
+
+
+def options_cache(config):
+    """Renvoie le chemin et la taille maximum du cache definis dans la section CACHE de config.ini.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :return: le couple (chemin, taille_max)
+    :rtype: tuple
+    """
+    section = config['CACHE'] if config.has_section('CACHE') else {}
+    return section.get('chemin', 'cache_resultats.sqlite'), int(section.get('taille_max', 100000))
@@ -0,0 +1,68 @@
+import heapq
+
+
+class CaissesLibres:
+    """La classe CaissesLibres represente l'index des caisses libres d'un magasin. Elle est tenue a jour par
+    Caisse.change_occupation et permet de trouver la caisse libre de plus petit numero, ou de savoir qu'il n'y en a
+    aucune, sans parcourir toutes les caisses.
+
+    Attributs:
+    ---------
+    tas: le tas des numeros de caisses, une entree peut etre perimee si la caisse a ete occupee depuis
+            :type: list
+    presents: les numeros ayant une entree dans le tas
+            :type: set
+    libres: les numeros des caisses actuellement libres
+            :type: set
+    caisses: la correspondance entre les numeros et les caisses indexees
+            :type: dict
+    """
+
+    def __init__(self):
+        """Constructeur de la classe CaissesLibres. L'index est vide a sa creation.
+        """
+        self.tas = []
+        self.presents = set()
+        self.libres = set()
+        self.caisses = {}
+
+    def ajoute(self, caisse):
+        """Marque une caisse comme libre.
+
+        :param caisse: la caisse qui vient de se liberer
+        :type caisse: Caisse
+        """
+        numero = caisse.num_caisse
+        self.caisses[numero] = caisse
+        self.libres.add(numero)
+        if numero not in self.presents:
+            self.presents.add(numero)
+            heapq.heappush(self.tas, numero)
+
+    def retire(self, caisse):
+        """Marque une caisse comme occupee. L'entree du tas est supprimee paresseusement, sauf si la caisse est
+        en tete du tas, ce qui est le cas lorsqu'elle vient d'etre renvoyee par premiere().
+
+        :param caisse: la caisse qui vient d'etre occupee
+        :type caisse: Caisse
+        """
+        numero = caisse.num_caisse
+        self.libres.discard(numero)
+        if self.tas and self.tas[0] == numero:
+            heapq.heappop(self.tas)
+            self.presents.discard(numero)
+
+    def premiere(self):
+        """Renvoie la caisse libre de plus petit numero.
+
+        :return: la premiere caisse libre, None si toutes les caisses sont occupees
+        :rtype: Caisse
+        """
+        if not self.libres:
+            return None
+        while self.tas[0] not in self.libres:
+            self.presents.discard(heapq.heappop(self.tas))
+        return self.caisses[self.tas[0]]
+
+    def __len__(self):
+        return len(self.libres)
@@ -0,0 +1,221 @@
+import math
+
+
+class DistributionLongueur:
+    """La classe DistributionLongueur represente la distribution ponderee par le temps de la longueur d'une file: le
+    temps passe avec chaque longueur, dans une liste indexee par la longueur et allongee au besoin. Elle est tenue a
+    jour a chaque evenement par MoteurMagasin.simule, sans conserver la trajectoire de la file, et les distributions
+    de plusieurs replications se fusionnent en additionnant leurs durees.
+
+    Attributs:
+    ---------
+    durees: le temps passe avec une file de chaque longueur
+            :type: list
+    """
+
+    def __init__(self):
+        """Constructeur de la classe DistributionLongueur. Aucun temps n'est compte a sa creation.
+        """
+        self.durees = [0.0]
+
+    def ajoute(self, longueur, duree):
+        """Compte le temps passe avec une file d'une longueur donnee.
+
+        :param longueur: la longueur de la file
+        :type longueur: int
+        :param duree: le temps passe avec cette longueur
+        :type duree: float
+        """
+        if longueur >= len(self.durees):
+            self.durees.extend([0.0] * (longueur + 1 - len(self.durees)))
+        self.durees[longueur] += duree
+
+    def fusionne(self, autre):
+        """Ajoute a cette distribution les durees d'une autre.
+
+        :param autre: la distribution a fusionner
+        :type autre: DistributionLongueur
+        """
+        if len(autre.durees) > len(self.durees):
+            self.durees.extend([0.0] * (len(autre.durees) - len(self.durees)))
+        for longueur, duree in enumerate(autre.durees):
+            self.durees[longueur] += duree
+
+    def duree_totale(self):
+        return sum(self.durees)
+
+    def probabilites(self):
+        """Renvoie la proportion du temps passee avec une file de chaque longueur.
+
+        :return: les probabilites, indexees par la longueur de la file
+        :rtype: list
+        """
+        total = self.duree_totale()
+        return [duree / total if total else 0.0 for duree in self.durees]
+
+    def probabilite_depasse(self, k):
+        """Renvoie la proportion du temps ou la file compte plus de k clients.
+
+        :param k: la longueur seuil
+        :type k: int
+        :rtype: float
+        """
+        total = self.duree_totale()
+        return sum(self.durees[k + 1:]) / total if total else 0.0
+
+    def moyenne(self):
+        total = self.duree_totale()
+        return sum(longueur * duree for longueur, duree in enumerate(self.durees)) / total if total else 0.0
+
+    def quantile(self, probabilite):
+        """Renvoie la plus petite longueur de file qui n'est pas depassee pendant une proportion probabilite du temps.
+
+        :param probabilite: la proportion du temps, entre 0 et 1
+        :type probabilite: float
+        :rtype: int
+        """
+        seuil = probabilite * self.duree_totale()
+        cumul = 0.0
+        for longueur, duree in enumerate(self.durees):
+            cumul += duree
+            if cumul >= seuil:
+                return longueur
+        return len(self.durees) - 1
+
+    def resume(self):
+        """Renvoie la longueur moyenne, les quantiles a 90 et 99% et la distribution de la longueur de la file.
+
+        :return: le resume de la distribution
+        :rtype: dict
+        """
+        return {'moyenne': self.moyenne(), 'p90': self.quantile(0.9), 'p99': self.quantile(0.99),
+                'maximum': len(self.durees) - 1, 'probabilites': self.probabilites()}
+
+
+class HistogrammeAttente:
+    """La classe HistogrammeAttente represente un histogramme de memoire fixe des temps d'attente: les classes sont
+    de largeur logarithmique, classes_par_decade par puissance de 10 entre minimum et maximum, ce qui borne l'erreur
+    relative des quantiles quelle que soit l'echelle des attentes. La premiere classe compte les attentes inferieures
+    a minimum, dont les attentes nulles, et la derniere celles qui atteignent maximum. Les histogrammes de memes
+    classes se fusionnent en additionnant leurs comptes.
+
+    Attributs:
+    ---------
+    minimum: la borne inferieure de la premiere classe logarithmique
+            :type: float
+    maximum: la borne superieure de la derniere classe logarithmique
+            :type: float
+    classes_par_decade: le nombre de classes par puissance de 10
+            :type: int
+    nb_classes: le nombre de classes logarithmiques
+            :type: int
+    comptes: le nombre d'attentes de chaque classe, de longueur nb_classes + 2
+            :type: list
+    """
+
+    def __init__(self, minimum=1e-3, maximum=1e4, classes_par_decade=50):
+        """Constructeur de la classe HistogrammeAttente. L'histogramme est vide a sa creation.
+
+        :param minimum: la borne inferieure de la premiere classe logarithmique, en minutes
+        :type minimum: float
+        :param maximum: la borne superieure de la derniere classe logarithmique, en minutes
+        :type maximum: float
+        :param classes_par_decade: le nombre de classes par puissance de 10
+        :type classes_par_decade: int
+        """
+        if not 0 < minimum < maximum:
+            raise ValueError("Il faut 0 < minimum < maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.classes_par_decade = classes_par_decade
+        self.nb_classes = int(math.ceil(math.log10(maximum / minimum) * classes_par_decade - 1e-9))
+        self._facteur = classes_par_decade / math.log(10)
+        self.comptes = [0] * (self.nb_classes + 2)
+
+    def ajoute(self, valeur):
+        """Compte un temps d'attente.
+
+        :param valeur: le temps d'attente
+        :type valeur: float
+        """
+        if valeur < self.minimum:
+            self.comptes[0] += 1
+        elif valeur >= self.maximum:
+            self.comptes[-1] += 1
+        else:
+            self.comptes[min(int(math.log(valeur / self.minimum) * self._facteur) + 1, self.nb_classes)] += 1
+
+    def fusionne(self, autre):
+        """Ajoute a cet histogramme les comptes d'un autre, de memes classes.
+
+        :param autre: l'histogramme a fusionner
+        :type autre: HistogrammeAttente
+        """
+        if (autre.minimum, autre.maximum, autre.classes_par_decade) != (
+                self.minimum, self.maximum, self.classes_par_decade):
+            raise ValueError("Les histogrammes n'ont pas les memes classes")
+        for indice, compte in enumerate(autre.comptes):
+            self.comptes[indice] += compte
+
+    def borne(self, indice):
+        """Renvoie la borne inferieure d'une classe logarithmique.
+
+        :param indice: l'indice de la classe, de 1 a nb_classes + 1
+        :type indice: int
+        :rtype: float
+        """
+        return self.minimum * 10 ** ((indice - 1) / self.classes_par_decade)
+
+    def quantile(self, probabilite):
+        """Renvoie le quantile des temps d'attente, interpole geometriquement dans sa classe. Les attentes inferieures
+        a minimum comptent comme nulles, celles qui atteignent maximum comme egales a maximum.
+
+        :param probabilite: la probabilite du quantile, entre 0 et 1
+        :type probabilite: float
+        :return: le quantile, 0.0 si l'histogramme est vide
+        :rtype: float
+        """
+        rang = probabilite * len(self)
+        cumul = 0
+        for indice, compte in enumerate(self.comptes):
+            if compte and cumul + compte >= rang:
+                if indice == 0:
+                    return 0.0
+                if indice > self.nb_classes:
+                    return self.maximum
+                return self.borne(indice) * 10 ** (((rang - cumul) / compte) / self.classes_par_decade)
+            cumul += compte
+        return 0.0
+
+    def probabilite_depasse(self, seuil):
+        """Renvoie la proportion des attentes superieures a seuil, interpolee dans la classe de seuil. Au-dela de
+        maximum, c'est la proportion des attentes qui atteignent maximum.
+
+        :param seuil: le temps d'attente seuil
+        :type seuil: float
+        :rtype: float
+        """
+        total = len(self)
+        if not total:
+            return 0.0
+        if seuil < 0:
+            return 1.0
+        if seuil < self.minimum:
+            return (total - self.comptes[0]) / total
+        if seuil >= self.maximum:
+            return self.comptes[-1] / total
+        position = math.log(seuil / self.minimum) * self._facteur
+        indice = min(int(position) + 1, self.nb_classes)
+        return (sum(self.comptes[indice + 1:]) + self.comptes[indice] * (indice - position)) / total
+
+    def resume(self):
+        """Renvoie le nombre d'attentes, leur mediane et leurs quantiles a 90 et 99%.
+
+        :return: le resume de l'histogramme
+        :rtype: dict
+        """
+        return {'nombre': len(self), 'p50': self.quantile(0.5), 'p90': self.quantile(0.9),
+                'p99': self.quantile(0.99)}
+
+    def __len__(self):
+        return sum(self.comptes)
@@ -0,0 +1,51 @@
+import heapq
+
+# Types d'evenements. A temps egal, une arrivee est traitee avant une fin de service, comme dans la boucle
+# d'origine qui comparait temps_prochaine_arrivee <= temps_prochain_service.
+ARRIVEE = 0
+FIN_SERVICE = 1
+ABANDON = 2
+OUVERTURE = 3
+CHANGEMENT_CAISSES = 4
+
+
+class Echeancier:
+    """La classe Echeancier represente le calendrier des evenements futurs d'une simulation a evenements discrets.
+    Les evenements sont ranges dans un tas binaire, ce qui rend la planification et le retrait du prochain
+    evenement en O(log n).
+
+    Attributs:
+    ---------
+    evenements: le tas des evenements planifies, sous forme de tuples (temps, type_evenement, identifiant)
+            :type: list
+    """
+
+    def __init__(self):
+        """Constructeur de la classe Echeancier. Le calendrier est vide a sa creation.
+        """
+        self.evenements = []
+
+    def planifie(self, temps, type_evenement, identifiant=0):
+        """Ajoute un evenement au calendrier.
+
+        :param temps: le moment ou l'evenement aura lieu
+        :type temps: float
+        :param type_evenement: le type de l'evenement (ARRIVEE, FIN_SERVICE, ABANDON, OUVERTURE ou
+                               CHANGEMENT_CAISSES)
+        :type type_evenement: int
+        :param identifiant: l'objet concerne par l'evenement (numero de caisse, numero de client...). A temps et
+                            type egaux, le plus petit identifiant passe en premier.
+        :type identifiant: int
+        """
+        heapq.heappush(self.evenements, (temps, type_evenement, identifiant))
+
+    def prochain(self):
+        """Retire et renvoie le prochain evenement du calendrier.
+
+        :return: le tuple (temps, type_evenement, identifiant) de l'evenement le plus proche
+        :rtype: tuple
+        """
+        return heapq.heappop(self.evenements)
+
+    def __len__(self):
+        return len(self.evenements)
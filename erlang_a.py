@@ -0,0 +1,187 @@
+from load_config import parametres_simulation
+
+# Precision relative a laquelle la somme des probabilites stationnaires est tronquee
+PRECISION = 1e-15
+# Facteur de remise a l'echelle des probabilites non normalisees, pour eviter les depassements
+ECHELLE = 1e250
+
+
+def evalue(lam, mu, alpha, nbre_serveurs):
+    """Calcule le regime stationnaire de la file M/M/c+M (modele d'Erlang-A) simulee par Simulation: arrivees de
+    taux lam, services de taux mu sur nbre_serveurs caisses et abandons de taux alpha pour chaque client en attente.
+    Les probabilites stationnaires du processus de naissance et de mort sont sommees jusqu'a ce que le reste soit
+    negligeable.
+
+    Un client arrive qui trouve j clients en attente devant lui est servi, dans l'ordre d'arrivee, s'il ne part pas
+    avant que ces j clients soient servis ou partis puis qu'une caisse se libere: chaque etape m = j, ..., 0 dure
+    une exponentielle de taux nbre_serveurs * mu + (m + 1) * alpha et se termine par son abandon avec probabilite
+    alpha / (nbre_serveurs * mu + (m + 1) * alpha), d'ou sa probabilite d'etre servi et son attente esperee
+    lorsqu'il l'est.
+
+    :param lam: le taux des arrivees
+    :type lam: float
+    :param mu: le taux de service d'une caisse
+    :type mu: float
+    :param alpha: le taux d'abandon d'un client en attente
+    :type alpha: float
+    :param nbre_serveurs: le nombre de caisses
+    :type nbre_serveurs: int
+    :return: le dictionnaire des mesures stationnaires: probabilite_attente, probabilite_abandon,
+             probabilite_servi_apres_attente, clients_file, clients_systeme, attente_moyenne et sejour_moyen (par
+             client arrive), attente_servis (l'attente par client arrive, comptee pour les seuls clients servis),
+             debit_servis et debit_abandons
+    :rtype: dict
+    """
+    if alpha <= 0 and lam >= nbre_serveurs * mu:
+        raise ValueError("La file sans abandon est instable pour lam >= nbre_serveurs * mu")
+    terme = 1.0
+    somme = somme_clients = somme_file = somme_attente = somme_servis = somme_attente_servis = 0.0
+    # probabilite d'etre servi et somme des inverses des taux des etapes d'un client arrive avec n - nbre_serveurs
+    # clients en attente devant lui
+    probabilite_servi = 1.0
+    inverses = 0.0
+    n = 0
+    while True:
+        somme += terme
+        somme_clients += n * terme
+        if n >= nbre_serveurs:
+            etape = nbre_serveurs * mu + (n - nbre_serveurs + 1) * alpha
+            probabilite_servi *= (etape - alpha) / etape
+            inverses += 1 / etape
+            somme_attente += terme
+            somme_file += (n - nbre_serveurs) * terme
+            somme_servis += probabilite_servi * terme
+            somme_attente_servis += probabilite_servi * inverses * terme
+        taux_depart = min(n + 1, nbre_serveurs) * mu + max(n + 1 - nbre_serveurs, 0) * alpha
+        if n >= nbre_serveurs and taux_depart > lam and terme < PRECISION * somme:
+            break
+        terme *= lam / taux_depart
+        n += 1
+        if terme > ECHELLE:
+            terme /= ECHELLE
+            somme /= ECHELLE
+            somme_clients /= ECHELLE
+            somme_file /= ECHELLE
+            somme_attente /= ECHELLE
+            somme_servis /= ECHELLE
+            somme_attente_servis /= ECHELLE
+
+    clients_file = somme_file / somme
+    clients_systeme = somme_clients / somme
+    debit_abandons = alpha * clients_file
+    return {'probabilite_attente': somme_attente / somme,
+            'probabilite_abandon': debit_abandons / lam,
+            'probabilite_servi_apres_attente': somme_servis / somme,
+            'clients_file': clients_file,
+            'clients_systeme': clients_systeme,
+            'attente_moyenne': clients_file / lam,
+            'sejour_moyen': clients_systeme / lam,
+            'attente_servis': somme_attente_servis / somme,
+            'debit_servis': lam - debit_abandons,
+            'debit_abandons': debit_abandons}
+
+
+def recette_esperee(x, y, z, w, lam, mu, alpha, nbre_serveurs, temps_simulation):
+    """Calcule la recette esperee d'un magasin en regime stationnaire, avec les memes conventions que
+    Simulation.recette: le benefice sur les cadis servis (cadi moyen x / 2), moins le cout de chaque client parti et
+    le cout des caisses.
+
+    :param x: la valeur maximal que peut prendre un cadi
+    :type x: float
+    :param y: le pourcentage de benefice qui sera pris par cadi
+    :type y: float
+    :param z: le cout fixe que coute au magasin le depart d'un client
+    :type z: float
+    :param w: le cout d'une caisse pour une minute de fonctionnement
+    :type w: float
+    :param lam: le taux des arrivees
+    :type lam: float
+    :param mu: le taux de service d'une caisse
+    :type mu: float
+    :param alpha: le taux d'abandon d'un client en attente
+    :type alpha: float
+    :param nbre_serveurs: le nombre de caisses
+    :type nbre_serveurs: int
+    :param temps_simulation: la duree consideree
+    :type temps_simulation: float
+    :return: la recette esperee
+    :rtype: float
+    """
+    mesures = evalue(lam, mu, alpha, nbre_serveurs)
+    return (mesures['debit_servis'] * y * x / 2 - mesures['debit_abandons'] * z - nbre_serveurs * w) * temps_simulation
+
+
+def recettes_config(config, nbre_serveurs=range(10, 36)):
+    """Calcule la recette esperee pour chaque nombre de serveurs avec les parametres de config.ini.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :param nbre_serveurs: les nombres de serveurs a evaluer
+    :type nbre_serveurs: list
+    :return: le dictionnaire {nombre de serveurs: recette esperee}
+    :rtype: dict
+    """
+    x, y, z, w, lam, mu, alpha, beta, temps_simulation = parametres_simulation(config)
+    return {a: recette_esperee(x, y, z, w, lam, mu, alpha, a, temps_simulation) for a in nbre_serveurs}
+
+
+def serveurs_candidats(config, nbre_serveurs=range(10, 36), ecart_relatif=0.05):
+    """Elimine les nombres de serveurs dont la recette esperee est nettement inferieure a la meilleure, afin de ne
+    simuler que les autres.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :param nbre_serveurs: les nombres de serveurs a evaluer
+    :type nbre_serveurs: list
+    :param ecart_relatif: l'ecart a la meilleure recette esperee, relativement a sa valeur absolue, au dela duquel
+                          un nombre de serveurs est elimine
+    :type ecart_relatif: float
+    :return: les nombres de serveurs conserves, dans l'ordre croissant
+    :rtype: list
+    """
+    recettes = recettes_config(config, nbre_serveurs)
+    meilleure = max(recettes.values())
+    seuil = meilleure - ecart_relatif * abs(meilleure)
+    return sorted(a for a, recette in recettes.items() if recette >= seuil)
+
+
+def esperances_stationnaires(lam, mu, alpha, nbre_serveurs, temps_simulation):
+    """Renvoie les valeurs stationnaires attendues des quatre cumuls de MoteurMagasin.donne_esperances sur
+    temps_simulation, pour les lam * temps_simulation clients attendus. Chaque cumul est calcule selon sa
+    definition dans MoteurMagasin.simule, qui n'est pas toujours la mesure usuelle de la file (voir evalue):
+
+    - esperance_client_magasin: l'aire sous le compteur de clients du magasin, qui n'est decremente que par les
+      clients servis apres avoir attendu et par les abandons, plus la duree de service de chaque client servi apres
+      avoir attendu. Le compteur croit au rythme des clients servis des leur arrivee, l'aire est donc
+      lam * (1 - probabilite_attente) * temps_simulation^2 / 2 + clients_file * temps_simulation, plus
+      lam * temps_simulation * probabilite_servi_apres_attente / mu.
+    - esperance_client_file: l'aire sous le nombre de clients en attente, clients_file * temps_simulation.
+    - esperance_temps_magasin: la somme des durees de service des seuls clients servis des leur arrivee.
+    - esperance_temps_file: la somme des attentes des seuls clients servis, les attentes des clients partis n'y
+      sont pas comptees.
+
+    Le magasin simule part vide: l'ecart avec ces valeurs stationnaires diminue relativement lorsque
+    temps_simulation augmente.
+
+    :param lam: le taux des arrivees
+    :type lam: float
+    :param mu: le taux de service d'une caisse
+    :type mu: float
+    :param alpha: le taux d'abandon d'un client en attente
+    :type alpha: float
+    :param nbre_serveurs: le nombre de caisses
+    :type nbre_serveurs: int
+    :param temps_simulation: la duree consideree
+    :type temps_simulation: float
+    :return: la liste des quatre esperances
+    :rtype: list
+    """
+    mesures = evalue(lam, mu, alpha, nbre_serveurs)
+    nb_clients = lam * temps_simulation
+    servis_immediatement = 1 - mesures['probabilite_attente']
+    return [(lam * servis_immediatement * temps_simulation ** 2 / 2 + mesures['clients_file'] * temps_simulation
+             + nb_clients * mesures['probabilite_servi_apres_attente'] / mu),
+            mesures['clients_file'] * temps_simulation,
+            nb_clients * servis_immediatement / mu,
+            nb_clients * mesures['attente_servis']]
+
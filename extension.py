@@ -1,5 +1,10 @@
 import math
-import random
+
+from aleatoire import TAILLE_BLOC, Variables
+from instantane import Instantane
+from instrumentation import Instrumentation
+from moteur import Caisse, MoteurMagasin
+from registre_clients import Client
 
 
 class SimulationOriginale:
@@ -31,12 +36,26 @@ class SimulationOriginale:
             :type: float
     magasin: une instance de Magasin consideree pour la simulation
             :type: Magasin
-
-
+    variables: les flux de variables aleatoires propres a cette simulation
+            :type: Variables
+    instrumentation: les compteurs et temps de traitement des evenements de la simulation, None si elle n'est pas
+                     instrumentee
+            :type: Instrumentation
+
+    Le taux d'arrivee et le nombre de caisses peuvent varier au cours de la simulation (voir horaires.ProfilArrivees
+    et programme_serveurs); nbre_serveurs et lam sont alors ceux du debut de la simulation.
+
+    Le magasin suit le modele a deux groupes de caisses de moteur.MoteurMagasin, qui differe de la version
+    d'origine: un client attend dans la file du plus petit groupe qui accepte son cadi, et une caisse qui se libere
+    sert le plus ancien client de sa file et des files des groupes de montant inferieur, dans l'ordre d'arrivee.
+    La version d'origine servait sa file unique dans l'ordre inverse d'arrivee et ne donnait jamais de client
+    attendant aux caisses reservees aux petits cadis; ses recettes ne sont donc pas reproduites.
     """
 
-    def __init__(self, x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation):
-        """Constructeur de la classe Simulation. Instancie tous les attributs.
+    def __init__(self, x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation, graine=None,
+                 taille_bloc=TAILLE_BLOC, conserve_clients=True, antithetique=None, instrumente=False,
+                 profil_arrivees=None, planning_serveurs=None):
+        """Constructeur de la classe SimulationOriginale. Instancie tous les attributs.
 
         :param x: la valeur maximal que peut prendre un cadi lors de cette simulation
         :type x: float
@@ -59,6 +78,24 @@ class SimulationOriginale:
         :type nbre_serveurs: int
         :param temps_simulation: la duree de la simulation
         :type temps_simulation: float
+        :param graine: la graine ou le generateur aleatoire de la simulation (voir aleatoire.Variables)
+        :type graine: int or numpy.random.SeedSequence or numpy.random.Generator or random.Random
+        :param taille_bloc: le nombre de variables aleatoires tirees a la fois
+        :type taille_bloc: int
+        :param conserve_clients: si faux, la simulation ne conserve aucune trace des clients partis et ne tient que
+                                 des compteurs et les moyennes et variances des temps d'attente et de sejour
+        :type conserve_clients: bool
+        :param antithetique: None hors paire antithetique, False pour le premier membre d'une paire et True pour le
+                             second (voir aleatoire.Variables)
+        :type antithetique: bool
+        :param instrumente: si vrai, les evenements de la simulation sont comptes et chronometres dans
+                            instrumentation (voir moteur.MoteurMagasin.simule)
+        :type instrumente: bool
+        :param profil_arrivees: le taux d'arrivee au cours de la simulation, lam avant son premier segment
+        :type profil_arrivees: horaires.ProfilArrivees
+        :param planning_serveurs: les couples (moment, nombre de serveurs) des changements du nombre de caisses
+                                  ouvertes (voir programme_serveurs)
+        :type planning_serveurs: list
         """
         self.cadi_max = x
         self.benefice_cadi = y
@@ -70,20 +107,65 @@ class SimulationOriginale:
         self.beta = beta
         self.nbre_serveurs = nbre_serveurs
         self.temps_simulation = temps_simulation
-        self.magasin = self.Magasin(self.nbre_serveurs, self.cadi_max)
+        self.magasin = self.Magasin(self.nbre_serveurs, self.cadi_max, conserve_clients)
         self.recette = 0
-
-    def simulation_magasin(self):
-        """Simule le fonctionnement d'un magasin avec des clients impatients.
+        self.variables = Variables(graine, taille_bloc, antithetique)
+        self.instrumentation = Instrumentation() if instrumente else None
+        self.magasin.profil_arrivees = profil_arrivees
+        if planning_serveurs:
+            self.programme_serveurs(planning_serveurs)
+
+    def simulation_magasin(self, arret=None):
+        """Simule le fonctionnement d'un magasin avec des clients impatients. La recette n'est calculee qu'a la fin
+        de la simulation: une simulation interrompue reprend au prochain appel.
+
+        :param arret: si donne, la simulation s'interrompt au premier evenement a partir de ce moment (voir
+                      moteur.MoteurMagasin.simule)
+        :type arret: float
+        :return: vrai si la simulation est terminee
+        :rtype: bool
         """
-        self.magasin.simule(self.variable_arrivee, self.variable_temps_service, self.temps_simulation,
-                            self.benefice_cadi, self.cadi_max, self.couts_rearrangement, self.variable_attente_max)
+        if not self.magasin.simule(self.variable_arrivee, self.variable_temps_service, self.temps_simulation,
+                                   self.benefice_cadi, self.cadi_max, self.couts_rearrangement,
+                                   self.variable_attente_max, self.variables, instrumentation=self.instrumentation,
+                                   arret=math.inf if arret is None else arret):
+            return False
         # Décommenter pour afficher les messages dans la console
         # print(self.magasin.donne_info_magasin())
         #print(self.donne_info_simulation())
 
         self.recette = self.magasin.benefice - self.magasin.couts_rearrangement - (
-                self.nbre_serveurs * self.cout_caisse * self.temps_simulation)
+                self.magasin.nb_caisses_initial * self.cout_caisse * self.temps_simulation
+                + self.cout_caisse * self.magasin.ecart_caisses(self.temps_simulation))
+        return True
+
+    def change_nombre_serveurs(self, nbre_serveurs):
+        """Change le nombre de caisses ouvertes au moment ou la simulation a ete interrompue (voir
+        moteur.MoteurMagasin.ajuste_caisses). La recette compte le cout de chaque caisse pendant qu'elle est ouverte.
+
+        :param nbre_serveurs: le nombre de caisses ouvertes a partir de ce moment
+        :type nbre_serveurs: int
+        """
+        self.magasin.ajuste_caisses(self.magasin.repartition(nbre_serveurs))
+        self.nbre_serveurs = nbre_serveurs
+
+    def programme_serveurs(self, planning):
+        """Programme des changements du nombre de caisses ouvertes au cours de la simulation. Une caisse fermee
+        termine le service de son client; la recette compte le cout de chaque caisse pendant qu'elle est ouverte.
+
+        :param planning: les couples (moment, nombre de serveurs)
+        :type planning: list
+        """
+        self.magasin.programme_caisses([(moment, self.magasin.repartition(nbre_serveurs))
+                                        for moment, nbre_serveurs in planning])
+
+    def instantane(self):
+        """Fige l'etat de la simulation, pour en reprendre des copies (voir instantane.Instantane).
+
+        :return: l'instantane de la simulation
+        :rtype: Instantane
+        """
+        return Instantane(self)
 
     def donne_info_simulation(self):
         """Renvoie l'ensemble des informations statistiques produites lors de la simulation.
@@ -115,311 +197,48 @@ class SimulationOriginale:
                      self.magasin.nb_clients_total, self.magasin.nb_clients_traites, self.magasin.nb_clients_partis)
         return texte
 
-    class Client:
-        """La classe des clients represente la presence d'un client dans la simulation
-
-        Attributs:
-        ---------
-        moment_arrivee: le moment ou le client arrive dans le magasin
-                :type: float
-        temps_service: le moment ou le client a ete servi
-                :type: float
-        cadi: le montant du cadi du client
-                :type: float
-        tolerance: le temps maximum que le client peut attendre dans la file
-        """
-
-        def __init__(self, arrivee, cadi_max, variable_attente_max):
-            """Constructeur de la méthode
-            :param arrivee: le moment ou le client est arrive dans le magasin
-            :type arrivee: float
-            :param cadi_max: le montant maximum que peut prendre un cadi
-            :type cadi_max: float
-            :param variable_attente_max: la variable aleatoire de type exponentielle negative
-            :type variable_attente_max: float
-            """
-            self.moment_arrivee = arrivee
-            self.temps_service = math.inf
-            self.cadi = random.uniform(0, cadi_max)
-            self.tolerance = random.expovariate(variable_attente_max)
-
-        def donne_arrivee(self):
-            """Donne le moment ou le client est arrive dans le magasin.
-
-            :return: Le moment ou le client est arrive
-            :rtype str
-            """
-
-            return str(self.moment_arrivee)
-
-        def donne_temps_attente(self):
-            """Donne le temps que le client a du attendre dans la file avant d'être à une caisse. En se basant sur la
-            différence entre le moment où il a été servi et le moment où il est entré dans le magasin.
-
-            :return: le temps que le client a attendu
-            :rtype: float
-            """
-            return float(self.temps_service - self.moment_arrivee)
-
-    class Caisse:
-        """La classe caisse represente la presence d'une caisse au sein du magasin lors d'une simulation.
-
-        Attributs:
-        ---------
-        num_caisse: le numero qui sert a identifier la caisse
-                :type: int
-        prochain_service:
-                :type: float
-        libre: L'etat de la caisse, occupee ou libre
-                :type: bool
-        clients_servis: La liste des clients qui ont ete servis durant la simulation par cette caisse
-                :type: list
-        montant_max: La valeur maximale du cadi d'un client que la caisse peut traiter.
-                :type: float
-        """
-
-        def __init__(self, identification, montant_max):
-            """Constructeur de la méthode
-
-            :param identification: le numéro d'identification de la caisse
-            :type identification: int
-            :param montant_max: La valeur maximale du cadi d'un client que la caisse peut traiter.
-            :type montant_max: float
-            """
-            self.num_caisse = identification
-            self.prochain_service = math.inf
-            self.libre = True
-            self.clients_servis = []
-            self.montant_max = montant_max
-
-        def est_libre(self):
-            return self.libre
+    # Les clients sont conserves dans le RegistreClients du magasin, Client n'en est qu'une vue
+    Client = Client
 
-        def change_occupation(self, valeur):
-            self.libre = valeur
+    # Les caisses et le fonctionnement du magasin sont ceux du moteur commun a toutes les simulations
+    Caisse = Caisse
 
-        def change_prochain_service(self, temps):
-            self.prochain_service = temps
-
-        def traiter_nouveau_client(self, client):
-            self.clients_servis.append(client)
-
-        def donne_info(self):
-            info_caisse = "La caisse numero " + str(self.num_caisse) + " a servi ces clients:\n"
-            for client in self.clients_servis:
-                info_caisse += "\t%s\n" % client.donne_arrivee()
-            info_caisse += "\nLa caisse numero %d a donc servi un total de %d clients" \
-                           % (self.num_caisse, len(self.clients_servis))
-            return info_caisse
-
-    class Magasin:
-        """La classe Magasin represente le fonctionnement d'un magasin pour la simulation.
+    class Magasin(MoteurMagasin):
+        """La classe Magasin represente le fonctionnement d'un magasin pour la simulation: un MoteurMagasin dont un
+        sixieme des caisses forme un groupe reserve aux cadis d'au plus un dixieme du montant maximum, qui servent
+        deux fois plus vite.
         Attributs:
         ---------
-        caisses: la liste contenant l'ensemble des caisses du magasin
-                :type: list
-        file: la liste des clients dans la file en attente d'etre traite
-                :type: list
-        clients: la liste des clients dans le magasin.
+        caisses_petit_montant: la liste des caisses reservees aux petits cadis
                 :type: list
-        nb_clients_total: le nombre de clients presents lors de la simulation
-                :type: int
-        nb_clients_traites: le nombre de clients qui ont ete traites.
-                :type: int
-        nb_clients_partis: le nombre de clients qui n'ont pas pu etre traites;
-                :type: int
-        benefice: le benefice que le magasin se fait de part son activite
+        cadi_max: la valeur maximale que les cadis des clients pourront avoir
                 :type: float
-        manque_gagner: le manque d'argent engendré par le depart de client
-                :type: float
-        couts_rearrangements: les couts que le magasin doit payer pour rearranger
-                :type: float
-        esperance_client_magasin: esperance du nombre de clients dans le magasin
-                :type: float
-        esperance_client_file: esperance du nombre de clients dans la file
-                :type: float
-        esperance_temps_magasin: esperance du temps de sejour dans le magasin
-                :type: float
-        esperance_temps_file: esperance du temps d'attente dans la file
-                :type: float
-
         """
 
-        def __init__(self, nbre_caisses, cadi_max):
+        def __init__(self, nbre_caisses, cadi_max, conserve_clients=True):
             """Instancie les attributs de classe de Magasin en initialisant un certains nombre de Caisse.
 
             :param nbre_caisses: le nombre de caisses ouvertes durant la simulation
             :type nbre_caisses: int
             :param cadi_max: la valeur maximale que les cadis des clients pourront avoir
+            :param conserve_clients: si faux, le magasin ne conserve aucune trace des clients partis
+            :type conserve_clients: bool
             """
-            self.caisses = []
-            self.caisses_petit_montant = []
-            self.file = []
-            self.clients = []
             self.cadi_max = cadi_max
-            self.nb_clients_total = 0
-            self.nb_clients_traites = 0
-            self.nb_clients_partis = 0
-            self.benefice = 0
-            self.manque_gagner = 0
-            self.couts_rearrangement = 0
-            self.esperance_client_magasin = 0
-            self.esperance_client_file = 0
-            self.esperance_temps_magasin = 0
-            self.esperance_temps_file = 0
-            nbre_caisses_petit_montant = int(math.floor(nbre_caisses / 6.0))
-            if nbre_caisses > 1:
-                for numero in range(nbre_caisses - nbre_caisses_petit_montant):
-                    self.caisses.append(SimulationOriginale.Caisse(numero, self.cadi_max))
-                for numero in range(nbre_caisses - nbre_caisses_petit_montant, nbre_caisses):
-                    self.caisses_petit_montant.append(SimulationOriginale.Caisse(numero, self.cadi_max / 10))
-            else:
-                self.caisses.append(SimulationOriginale.Caisse(0, self.cadi_max))
-
-        def simule(self, variable_arrivee, variable_temps_service, temps_simulation, benefice_cadi, cadi_max,
-                   couts_rearrangement, variable_attente_max):
-            """Simule le processus de files M/M/C au sein du magasin selon differente variable.
-
-            :param variable_arrivee: la variable aleatoire de type exponentielle pour le temps d'arrivee
-            :type variable_arrivee: float
-            :param variable_temps_service: la variable aleatoire de type exponentielle pour le temps de service
-            :type variable_temps_service: float
-            :param temps_simulation: le temps en minutes de la simulation
-            :type temps_simulation: float
-            :param benefice_cadi: le pourcentage de benefice que se fait le magasin sur la valeur du cadi d'un client
-            :type benefice_cadi: float
-            :param cadi_max: le montant maximum que peut prendre un cadi
-            :type cadi_max: float
-            :param couts_rearrangement: le cout fixe que le magasin paye pour rearranger un cadi de client
-            :type couts_rearrangement: float
-            :param variable_attente_max: la variable aleatoire de type exponentielle negative
-            :type variable_attente_max: float
-            """
-            # Initialisation
-            nb_clients = 0
-            temps = 0
-            temps_prochaine_arrivee = random.expovariate(variable_arrivee)
-            # Simulation
-            while temps < temps_simulation:
-                prochaine_caisse = self.donne_prochaine_caisse()
-                if prochaine_caisse[0].prochain_service < prochaine_caisse[1].prochain_service:
-                    temps_prochain_service = prochaine_caisse[0].prochain_service
-                else:
-                    temps_prochain_service = prochaine_caisse[1].prochain_service
-                if temps_prochaine_arrivee <= temps_prochain_service:
-                    temps_prochain_evenement = temps_prochaine_arrivee
-                    client_arrive = True
-                else:
-                    temps_prochain_evenement = temps_prochain_service
-                    client_arrive = False
-
-                if temps_prochain_evenement < temps_simulation:
-                    self.esperance_client_magasin += nb_clients * (temps_prochain_evenement - temps)
-                    self.esperance_client_file += len(self.file) * (temps_prochain_evenement - temps)
-
-                temps = temps_prochain_evenement  # On passe au moment du prochain evenement
-                caisse_libre = self.donne_caisse_libre()
-
-                if client_arrive and temps < temps_simulation:
-                    client = SimulationOriginale.Client(temps, cadi_max, variable_attente_max)
-                    nb_clients += 1
-                    self.nb_clients_total += 1
-
-                    # On genere la prochaine arrivee et on verifie qu'elle ne depasse pas le temps de la simulation
-                    temps_prochaine_arrivee = temps + random.expovariate(variable_arrivee)
+            nbre_caisses_normales, nbre_caisses_petit_montant = self.repartition(nbre_caisses)
+            MoteurMagasin.__init__(self, [(nbre_caisses_normales, cadi_max, 1.0),
+                                          (nbre_caisses_petit_montant, cadi_max / 10, 2.0)], conserve_clients)
+            self.caisses_petit_montant = self.groupes[1].caisses
 
-                    if temps_prochaine_arrivee < temps_simulation:
-                        if caisse_libre:  # le client est traite par la caisse libre
-                            caisse_libre.traiter_nouveau_client(client)
-                            caisse_libre.change_occupation(False)
-                            caisse_libre.change_prochain_service(temps +
-                                                                 random.expovariate(variable_temps_service))
-                            client.temps_service = caisse_libre.prochain_service
-                            self.nb_clients_traites += 1
-                            self.benefice += (client.cadi * benefice_cadi)
-                            self.esperance_temps_magasin += (caisse_libre.prochain_service - temps)
-
-                        else:  # le client doit attendre dans la file
-                            self.file.append(client)
-                    else:  # la prochaine arrivee est indeterminee
-                        temps_prochaine_arrivee = math.inf
-
-                elif not client_arrive:  # On va traiter un client
-                    if len(self.file) != 0:  # Il y a des clients a traiter
-                        client = self.file.pop()
-                        client.temps_service = temps
-                        if client.tolerance >= client.donne_temps_attente():  # le client est reste dans la file
-                            # pas trop longtemps
-                            # Le client peut il utiliser la caisse petit cadi
-                            if client.cadi <= prochaine_caisse[1].montant_max:
-                                prochaine_caisse_client = min(prochaine_caisse, key=lambda caisse: caisse.prochain_service)
-                                prochaine_caisse_client.change_prochain_service(temps +
-                                                                                (random.expovariate(
-                                                                                    variable_temps_service) / 2))
-                                prochaine_caisse_client.traiter_nouveau_client(client)
-                            else:
-                                prochaine_caisse_client = prochaine_caisse[0]
-                                prochaine_caisse_client.change_prochain_service(temps +
-                                                                                random.expovariate(
-                                                                                    variable_temps_service))
-                                prochaine_caisse_client.traiter_nouveau_client(client)
-                            self.nb_clients_traites += 1
-                            self.benefice += (client.cadi * benefice_cadi)
-                            self.esperance_temps_file += client.donne_temps_attente()
-                            self.esperance_client_magasin += (prochaine_caisse_client.prochain_service - temps)
-                        else:  # le client a quitte la file
-                            self.manque_gagner += (client.cadi * benefice_cadi)
-                            self.couts_rearrangement += couts_rearrangement
-                            self.nb_clients_partis += 1
-                        nb_clients -= 1
-                    else:  # Il n'y a aucun client a traiter
-                        prochaine_caisse = self.donne_prochaine_caisse()
-                        prochaine_caisse[0].change_occupation(True)
-                        prochaine_caisse[0].change_prochain_service(math.inf)
-                        prochaine_caisse[1].change_occupation(True)
-                        prochaine_caisse[1].change_prochain_service(math.inf)
-
-        def donne_prochaine_caisse(self):
-            """Renvoie la caisse qui peut traiter un client le plus rapidement parmi l'ensemble des caisses.
-
-            :return: les 2 types de caisse dont le temps avant le prochain service est le plus petit
-            :rtype: list of Caisse
-            """
-            return [min(self.caisses, key=lambda caisse: caisse.prochain_service),
-                    min(self.caisses, key=lambda caisse: caisse.prochain_service)]
+        @staticmethod
+        def repartition(nbre_caisses):
+            """Renvoie le nombre de caisses de chaque groupe d'un magasin de nbre_caisses caisses: un sixieme des
+            caisses, arrondi vers le bas, est reserve aux petits cadis.
 
-        def donne_caisse_libre(self):
-            """Renvoie la premiere caisse libre parmi la liste des caisses
-
-            :return: renvoie la premiere caisse parmi la liste des caisses si pas renvoie None
-            :rtype: Caisse
-            """
-            for caisse in self.caisses:
-                if caisse.est_libre():
-                    return caisse
-            for caisse in self.caisses_petit_montant:
-                if caisse.est_libre():
-                    return caisse
-            return None
-
-        def donne_esperances(self):
-            """Construit une liste des différentes esperances calculees pendant la simulation
-
-            :return: La liste des différentes esperances (float) calculees pendant simule()
-            :rtype : list
-            """
-            return [self.esperance_client_magasin, self.esperance_client_file,
-                    self.esperance_temps_magasin, self.esperance_temps_file]
-
-        def donne_info_magasin(self):
-            """ Construit une variable string contenant toutes les informations du magasin et la renvoie.
-
-            :return texte: Les informations des differentes caisses du magasin
-            :rtype texte: str
+            :param nbre_caisses: le nombre de caisses du magasin
+            :type nbre_caisses: int
+            :return: les nombres de caisses normales et de caisses reservees aux petits cadis
+            :rtype: list
             """
-
-            texte = "Informations des differentes caisses du magasin.\n" + "________________________________________\n"
-            for caisse in self.caisses:
-                texte += caisse.donne_info()
-                texte += "\n----------------------------------------\n"
-            return texte
+            nbre_caisses_petit_montant = int(math.floor(nbre_caisses / 6.0)) if nbre_caisses > 1 else 0
+            return [nbre_caisses - nbre_caisses_petit_montant, nbre_caisses_petit_montant]
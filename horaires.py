@@ -0,0 +1,104 @@
+import bisect
+import math
+
+
+class ProfilArrivees:
+    """La classe ProfilArrivees represente un taux d'arrivee des clients constant par morceaux au cours de la
+    journee. Les arrivees forment un processus de Poisson non homogene, tire par inversion exacte de l'intensite
+    cumulee: chaque arrivee consomme une seule exponentielle standard, sans rejet, et les simulations qui partagent
+    leurs nombres aleatoires restent synchronisees quel que soit le profil.
+
+    Attributs:
+    ---------
+    debuts: les moments, croissants, ou commence chaque segment
+            :type: list
+    taux: le taux d'arrivee de chaque segment, qui vaut jusqu'au debut du suivant; un taux nul ferme le magasin
+          aux nouveaux clients
+            :type: list
+    """
+
+    def __init__(self, segments):
+        """Constructeur de la classe ProfilArrivees. Avant le debut du premier segment, le taux d'arrivee est celui
+        de la simulation.
+
+        :param segments: les couples (debut, taux) des segments
+        :type segments: list
+        """
+        segments = sorted(segments)
+        if any(taux < 0 for debut, taux in segments):
+            raise ValueError("Un taux d'arrivee ne peut pas etre negatif")
+        self.debuts = [float(debut) for debut, taux in segments]
+        self.taux = [float(taux) for debut, taux in segments]
+
+    def prochaine(self, temps, exponentielle, taux_initial):
+        """Renvoie le moment de la prochaine arrivee: celui ou l'intensite cumulee depuis temps atteint
+        l'exponentielle standard tiree. Le segment courant est trouve en O(log S), puis les segments sont parcourus
+        jusqu'a l'arrivee.
+
+        :param temps: le moment de la derniere arrivee
+        :type temps: float
+        :param exponentielle: une variable exponentielle de parametre 1
+        :type exponentielle: float
+        :param taux_initial: le taux d'arrivee avant le premier segment
+        :type taux_initial: float
+        :return: le moment de la prochaine arrivee, math.inf si plus aucun client n'arrive
+        :rtype: float
+        """
+        indice = bisect.bisect_right(self.debuts, temps) - 1
+        while True:
+            taux = self.taux[indice] if indice >= 0 else taux_initial
+            fin = self.debuts[indice + 1] if indice + 1 < len(self.debuts) else math.inf
+            if taux > 0:
+                if exponentielle <= taux * (fin - temps):
+                    return temps + exponentielle / taux
+                exponentielle -= taux * (fin - temps)
+            elif fin == math.inf:
+                return math.inf
+            temps = fin
+            indice += 1
+
+    def taux_moyen(self, taux_initial, duree):
+        """Renvoie le taux d'arrivee moyen sur [0, duree].
+
+        :param taux_initial: le taux d'arrivee avant le premier segment
+        :type taux_initial: float
+        :param duree: la duree de la simulation
+        :type duree: float
+        :rtype: float
+        """
+        bornes = [0.0] + [min(max(debut, 0.0), duree) for debut in self.debuts] + [duree]
+        taux = [taux_initial] + self.taux
+        return sum(t * (fin - debut) for t, debut, fin in zip(taux, bornes, bornes[1:])) / duree
+
+
+def lit_horaire(texte, conversion=float):
+    """Lit un horaire ecrit sous la forme "moment:valeur, moment:valeur, ...".
+
+    :param texte: l'horaire
+    :type texte: str
+    :param conversion: la conversion appliquee aux valeurs
+    :type conversion: callable
+    :return: les couples (moment, valeur), par moment croissant
+    :rtype: list
+    """
+    horaire = []
+    for element in texte.split(','):
+        if element.strip():
+            moment, valeur = element.split(':')
+            horaire.append((float(moment), conversion(valeur)))
+    return sorted(horaire)
+
+
+def options_horaires(config):
+    """Renvoie le profil des arrivees et le planning des caisses definis dans la section HORAIRES de config.ini, par
+    exemple lambdas = 0:0.6, 240:2.4, 360:1.2 et serveurs = 0:8, 240:20, 360:12.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :return: le couple (profil, planning): le ProfilArrivees, None si la section ne donne pas de lambdas, et les
+             couples (moment, nombre de serveurs)
+    :rtype: tuple
+    """
+    section = config['HORAIRES'] if config.has_section('HORAIRES') else {}
+    lambdas = lit_horaire(section.get('lambdas', ''))
+    return (ProfilArrivees(lambdas) if lambdas else None), lit_horaire(section.get('serveurs', ''), int)
@@ -0,0 +1,85 @@
+import pickle
+
+
+class Instantane:
+    """La classe Instantane fige l'etat complet d'une simulation interrompue (voir MoteurMagasin.simule): horloge,
+    caisses, files, echeancier, cumuls et etat des flux de variables aleatoires. L'etat est serialise une fois par
+    pickle; les clients y sont des colonnes de flottants (voir registre_clients.RegistreClients), sa taille ne
+    depend donc pas du nombre d'objets de la simulation. Chaque fourche en est une copie independante, qui reprend
+    la simulation ou elle a ete interrompue, eventuellement avec d'autres parametres: explorer plusieurs
+    alternatives ne coute que la simulation de leur suite.
+
+    Toutes les fourches tirent les memes nombres aleatoires a partir de l'instantane: leurs ecarts ne viennent que
+    de leurs parametres.
+
+    Attributs:
+    ---------
+    temps: le moment ou la simulation figee a ete interrompue, celui de son dernier evenement si elle ne l'a pas ete
+            :type: float
+    etat: la simulation serialisee
+            :type: bytes
+    """
+
+    def __init__(self, simulation):
+        """Constructeur de la classe Instantane.
+
+        :param simulation: la simulation a figer, Simulation ou SimulationOriginale
+        :type simulation: Simulation
+        """
+        magasin = simulation.magasin
+        self.temps = magasin.temps if magasin.arret is None else magasin.arret
+        self.etat = pickle.dumps(simulation, pickle.HIGHEST_PROTOCOL)
+
+    def restaure(self):
+        """Renvoie une copie de la simulation figee.
+
+        :return: la copie, qui reprend ou la simulation a ete interrompue au prochain appel de simulation_magasin
+        :rtype: Simulation
+        """
+        return pickle.loads(self.etat)
+
+    def fourche(self, nbre_serveurs=None, lam=None, mu=None, alpha=None, planning_serveurs=None):
+        """Renvoie une copie de la simulation figee dont la suite est simulee avec d'autres parametres. Tous les
+        changements ont lieu au moment temps de l'instantane: le nombre de caisses y change comme par un planning
+        (voir MoteurMagasin.ajuste_caisses), et les taux s'appliquent aussi aux arrivees, services et abandons deja
+        planifies, dont la duree restante est mise a l'echelle (voir MoteurMagasin.change_taux). Le taux d'arrivee
+        d'une simulation qui suit un profil d'arrivees ne peut pas etre change.
+
+        :param nbre_serveurs: le nombre de caisses ouvertes a partir de l'instantane, inchange si None
+        :type nbre_serveurs: int
+        :param lam: le taux d'arrivee des clients, inchange si None
+        :type lam: float
+        :param mu: le taux de service des caisses, inchange si None
+        :type mu: float
+        :param alpha: le taux d'abandon des clients en attente, inchange si None
+        :type alpha: float
+        :param planning_serveurs: les couples (moment, nombre de serveurs) des changements de caisses a programmer
+                                  pour la suite de la simulation (voir Simulation.programme_serveurs)
+        :type planning_serveurs: list
+        :return: la copie
+        :rtype: Simulation
+        """
+        simulation = self.restaure()
+        facteur_arrivee = facteur_service = facteur_abandon = 1.0
+        if lam is not None:
+            if simulation.magasin.profil_arrivees is not None:
+                raise ValueError("Le taux d'arrivee d'une simulation qui suit un profil d'arrivees ne peut pas etre "
+                                 "change")
+            facteur_arrivee = simulation.variable_arrivee / lam
+            simulation.variable_arrivee = lam
+        if mu is not None:
+            facteur_service = simulation.variable_temps_service / mu
+            simulation.variable_temps_service = mu
+        if alpha is not None:
+            facteur_abandon = simulation.variable_attente_max / alpha
+            simulation.variable_attente_max = alpha
+        simulation.magasin.change_taux(self.temps, simulation.temps_simulation, facteur_arrivee, facteur_service,
+                                       facteur_abandon)
+        if nbre_serveurs is not None:
+            simulation.change_nombre_serveurs(nbre_serveurs)
+        if planning_serveurs:
+            simulation.programme_serveurs(planning_serveurs)
+        return simulation
+
+    def __len__(self):
+        return len(self.etat)
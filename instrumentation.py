@@ -0,0 +1,91 @@
+from statistiques import Accumulateur
+
+# Branches du traitement d'un evenement par MoteurMagasin.simule
+BRANCHE_ARRIVEE_SERVIE = 0  # le client arrive est servi par une caisse libre
+BRANCHE_ARRIVEE_FILE = 1  # le client arrive attend dans la file
+BRANCHE_ARRIVEE_PERDUE = 2  # le client arrive n'est ni servi ni mis en file, ou l'arrivee depasse la simulation
+BRANCHE_FIN_SERVICE = 3  # la caisse qui termine un service sert le client suivant de la file
+BRANCHE_PASSAGE_LIBRE = 4  # la caisse qui termine un service devient libre
+BRANCHE_ABANDON = 5  # un client quitte la file a l'echeance de sa tolerance
+BRANCHE_ABANDON_PERIME = 6  # l'evenement d'abandon concerne un client deja servi
+BRANCHE_FERMETURE = 7  # la caisse qui termine un service ferme
+BRANCHE_OUVERTURE = 8  # une caisse ouverte pendant la simulation sert le premier client des files, s'il y en a un
+BRANCHE_CHANGEMENT_CAISSES = 9  # le planning change le nombre de caisses ouvertes
+NOMS_BRANCHES = ('arrivee_servie', 'arrivee_file', 'arrivee_perdue', 'fin_service', 'passage_libre', 'abandon',
+                 'abandon_perime', 'fermeture', 'ouverture', 'changement_caisses')
+
+
+class Instrumentation:
+    """La classe Instrumentation collecte les compteurs et les temps de traitement des evenements d'une ou plusieurs
+    simulations: le nombre d'evenements et le temps cumule, mesure par time.perf_counter_ns, de chaque branche du
+    traitement, ainsi que la longueur de la file apres chaque evenement. Les instrumentations de plusieurs
+    replications se fusionnent.
+
+    Attributs:
+    ---------
+    nb_replications: le nombre de simulations instrumentees
+            :type: int
+    nb_evenements: le nombre d'evenements traites par chaque branche, indexe par les constantes de branche
+            :type: list
+    temps_ns: le temps cumule en nanosecondes passe dans chaque branche
+            :type: list
+    longueur_file: les statistiques de la longueur de la file apres chaque evenement
+            :type: Accumulateur
+    longueur_file_max: la plus grande longueur de file observee
+            :type: int
+    """
+
+    def __init__(self):
+        """Constructeur de la classe Instrumentation. Tous les compteurs sont nuls a sa creation.
+        """
+        self.nb_replications = 0
+        self.nb_evenements = [0] * len(NOMS_BRANCHES)
+        self.temps_ns = [0] * len(NOMS_BRANCHES)
+        self.longueur_file = Accumulateur()
+        self.longueur_file_max = 0
+
+    def enregistre(self, branche, duree_ns, longueur_file):
+        """Enregistre le traitement d'un evenement.
+
+        :param branche: la branche par laquelle l'evenement a ete traite
+        :type branche: int
+        :param duree_ns: le temps de traitement en nanosecondes
+        :type duree_ns: int
+        :param longueur_file: la longueur de la file apres l'evenement
+        :type longueur_file: int
+        """
+        self.nb_evenements[branche] += 1
+        self.temps_ns[branche] += duree_ns
+        self.longueur_file.ajoute(longueur_file)
+        if longueur_file > self.longueur_file_max:
+            self.longueur_file_max = longueur_file
+
+    def fusionne(self, autre):
+        """Ajoute a cette instrumentation les compteurs d'une autre.
+
+        :param autre: l'instrumentation a fusionner
+        :type autre: Instrumentation
+        """
+        self.nb_replications += autre.nb_replications
+        for branche in range(len(NOMS_BRANCHES)):
+            self.nb_evenements[branche] += autre.nb_evenements[branche]
+            self.temps_ns[branche] += autre.temps_ns[branche]
+        self.longueur_file.fusionne(autre.longueur_file)
+        self.longueur_file_max = max(self.longueur_file_max, autre.longueur_file_max)
+
+    def resume(self):
+        """Renvoie les compteurs sous forme de dictionnaire: pour chaque branche, le nombre d'evenements, le temps
+        cumule et le temps moyen par evenement en nanosecondes, puis le total et la longueur de la file.
+
+        :return: le resume de l'instrumentation
+        :rtype: dict
+        """
+        resume = {'replications': self.nb_replications}
+        for nom, nb_evenements, temps_ns in zip(NOMS_BRANCHES, self.nb_evenements, self.temps_ns):
+            resume[nom] = {'evenements': nb_evenements, 'temps_ns': temps_ns,
+                           'temps_moyen_ns': temps_ns / nb_evenements if nb_evenements else 0.0}
+        resume['total'] = {'evenements': sum(self.nb_evenements), 'temps_ns': sum(self.temps_ns)}
+        resume['longueur_file'] = {'moyenne': self.longueur_file.moyenne,
+                                   'ecart_type': self.longueur_file.ecart_type(),
+                                   'maximum': self.longueur_file_max}
+        return resume
@@ -5,3 +5,18 @@ def load_config():
     config = configparser.ConfigParser()
     config.read('config.ini')
     return config
+
+
+def parametres_simulation(config):
+    """Renvoie les parametres communs a toutes les simulations d'un balayage, dans l'ordre du constructeur de
+    Simulation sans le nombre de serveurs.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :return: le tuple (x, y, z, w, lam, mu, alpha, beta, temps_simulation)
+    :rtype: tuple
+    """
+    return (float(config['CONSTANTE']['X']), float(config['CONSTANTE']['Y']), float(config['CONSTANTE']['Z']),
+            float(config['CONSTANTE']['W']), float(config['VARIABLE']['lambda']), float(config['VARIABLE']['mu']),
+            float(config['VARIABLE']['alpha']), float(config['VARIABLE']['beta']),
+            float(config['SIMULATION']['temps_simulation']))
@@ -1,10 +1,29 @@
 # modules
 import csv
 import math
-import random
+import os
+from functools import partial
 
+from aleatoire import TAILLE_BLOC, Variables, graine_maitre
+from cache_resultats import CacheResultats, options_cache
+from erlang_a import serveurs_candidats
 from extension import SimulationOriginale
-from load_config import load_config
+from horaires import options_horaires
+from instantane import Instantane
+from instrumentation import Instrumentation
+from load_config import load_config, parametres_simulation
+from moteur import Caisse, MoteurMagasin
+from optimiseur import course_serveurs, options_optimisation
+from distributions import DistributionLongueur, HistogrammeAttente
+from parallele import (CHAMPS_RESUME, distribue_cellule, distribue_cellules, instrumente_cellule, instrumente_cellules,
+                       options_parallele, resume_cellule, resume_cellules, resume_partage, simule_cellule,
+                       simule_cellules)
+from regime_stationnaire import estime_regime, options_stationnaire
+from registre_clients import Client
+from replications import options_adaptatives, recettes_adaptatives
+from simulation_lot import simulation_lot
+from stockage import StockageBinaire, manifeste_balayage, options_stockage
+from statistiques import facteur_antithetique
 
 
 class Simulation:
@@ -36,11 +55,21 @@ class Simulation:
             :type: float
     magasin: une instance de Magasin consideree pour la simulation
             :type: Magasin
+    variables: les flux de variables aleatoires propres a cette simulation
+            :type: Variables
+    instrumentation: les compteurs et temps de traitement des evenements de la simulation, None si elle n'est pas
+                     instrumentee
+            :type: Instrumentation
+
+    Le taux d'arrivee et le nombre de caisses peuvent varier au cours de la simulation (voir horaires.ProfilArrivees
+    et programme_serveurs); nbre_serveurs et lam sont alors ceux du debut de la simulation.
 
 
     """
 
-    def __init__(self, x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation):
+    def __init__(self, x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation, graine=None,
+                 taille_bloc=TAILLE_BLOC, conserve_clients=True, antithetique=None, instrumente=False,
+                 profil_arrivees=None, planning_serveurs=None):
         """Constructeur de la classe Simulation. Instancie tous les attributs.
 
         :param x: la valeur maximal que peut prendre un cadi lors de cette simulation
@@ -64,6 +93,24 @@ class Simulation:
         :type nbre_serveurs: int
         :param temps_simulation: la duree de la simulation
         :type temps_simulation: float
+        :param graine: la graine ou le generateur aleatoire de la simulation (voir aleatoire.Variables)
+        :type graine: int or numpy.random.SeedSequence or numpy.random.Generator or random.Random
+        :param taille_bloc: le nombre de variables aleatoires tirees a la fois
+        :type taille_bloc: int
+        :param conserve_clients: si faux, la simulation ne conserve aucune trace des clients partis et ne tient que
+                                 des compteurs et les moyennes et variances des temps d'attente et de sejour
+        :type conserve_clients: bool
+        :param antithetique: None hors paire antithetique, False pour le premier membre d'une paire et True pour le
+                             second (voir aleatoire.Variables)
+        :type antithetique: bool
+        :param instrumente: si vrai, les evenements de la simulation sont comptes et chronometres dans
+                            instrumentation (voir moteur.MoteurMagasin.simule)
+        :type instrumente: bool
+        :param profil_arrivees: le taux d'arrivee au cours de la simulation, lam avant son premier segment
+        :type profil_arrivees: horaires.ProfilArrivees
+        :param planning_serveurs: les couples (moment, nombre de serveurs) des changements du nombre de caisses
+                                  ouvertes (voir programme_serveurs)
+        :type planning_serveurs: list
         """
         self.cadi_max = x
         self.benefice_cadi = y
@@ -75,20 +122,82 @@ class Simulation:
         self.beta = beta
         self.nbre_serveurs = nbre_serveurs
         self.temps_simulation = temps_simulation
-        self.magasin = self.Magasin(self.nbre_serveurs)
+        self.magasin = self.Magasin(self.nbre_serveurs, conserve_clients)
         self.recette = 0
-
-    def simulation_magasin(self):
-        """Simule le fonctionnement d'un magasin avec des clients impatients.
+        self.variables = Variables(graine, taille_bloc, antithetique)
+        self.instrumentation = Instrumentation() if instrumente else None
+        self.magasin.profil_arrivees = profil_arrivees
+        if planning_serveurs:
+            self.programme_serveurs(planning_serveurs)
+
+    def simulation_magasin(self, recursion=False, pas_releve=None, arret=None):
+        """Simule le fonctionnement d'un magasin avec des clients impatients. La recette n'est calculee qu'a la fin
+        de la simulation: une simulation interrompue reprend au prochain appel.
+
+        :param recursion: si vrai, le magasin est simule sans echeancier par moteur.MoteurMagasin.simule_recursion
+        :type recursion: bool
+        :param pas_releve: si donne, les cumuls du magasin sont releves toutes les pas_releve minutes dans
+                           Magasin.releves (voir Magasin.releve)
+        :type pas_releve: float
+        :param arret: si donne, la simulation s'interrompt au premier evenement a partir de ce moment (voir
+                      moteur.MoteurMagasin.simule)
+        :type arret: float
+        :return: vrai si la simulation est terminee
+        :rtype: bool
         """
-        self.magasin.simule(self.variable_arrivee, self.variable_temps_service, self.temps_simulation,
-                            self.benefice_cadi, self.cadi_max, self.couts_rearrangement, self.variable_attente_max)
+        if recursion:
+            if arret is not None:
+                raise ValueError("L'interruption n'est disponible qu'avec l'echeancier")
+            if self.magasin.profil_arrivees is not None or self.magasin.planning_caisses:
+                raise ValueError("Les horaires ne sont disponibles qu'avec l'echeancier")
+            if pas_releve:
+                raise ValueError("Les releves ne sont disponibles qu'avec l'echeancier")
+            if self.instrumentation is not None:
+                raise ValueError("L'instrumentation n'est disponible qu'avec l'echeancier")
+            self.magasin.simule_recursion(self.variable_arrivee, self.variable_temps_service, self.temps_simulation,
+                                          self.benefice_cadi, self.cadi_max, self.couts_rearrangement,
+                                          self.variable_attente_max, self.variables)
+        elif not self.magasin.simule(self.variable_arrivee, self.variable_temps_service, self.temps_simulation,
+                                     self.benefice_cadi, self.cadi_max, self.couts_rearrangement,
+                                     self.variable_attente_max, self.variables, pas_releve, self.instrumentation,
+                                     math.inf if arret is None else arret):
+            return False
         # Décommenter pour afficher les messages dans la console
         # print(self.magasin.donne_info_magasin())
         #print(self.donne_info_simulation())
 
         self.recette = self.magasin.benefice - self.magasin.couts_rearrangement - (
-                self.nbre_serveurs * self.cout_caisse * self.temps_simulation)
+                self.magasin.nb_caisses_initial * self.cout_caisse * self.temps_simulation
+                + self.cout_caisse * self.magasin.ecart_caisses(self.temps_simulation))
+        return True
+
+    def change_nombre_serveurs(self, nbre_serveurs):
+        """Change le nombre de caisses ouvertes au moment ou la simulation a ete interrompue (voir
+        moteur.MoteurMagasin.ajuste_caisses). La recette compte le cout de chaque caisse pendant qu'elle est ouverte.
+
+        :param nbre_serveurs: le nombre de caisses ouvertes a partir de ce moment
+        :type nbre_serveurs: int
+        """
+        self.magasin.ajuste_caisses(self.magasin.repartition(nbre_serveurs))
+        self.nbre_serveurs = nbre_serveurs
+
+    def programme_serveurs(self, planning):
+        """Programme des changements du nombre de caisses ouvertes au cours de la simulation. Une caisse fermee
+        termine le service de son client; la recette compte le cout de chaque caisse pendant qu'elle est ouverte.
+
+        :param planning: les couples (moment, nombre de serveurs)
+        :type planning: list
+        """
+        self.magasin.programme_caisses([(moment, self.magasin.repartition(nbre_serveurs))
+                                        for moment, nbre_serveurs in planning])
+
+    def instantane(self):
+        """Fige l'etat de la simulation, pour en reprendre des copies (voir instantane.Instantane).
+
+        :return: l'instantane de la simulation
+        :rtype: Instantane
+        """
+        return Instantane(self)
 
     def donne_info_simulation(self):
         """Renvoie l'ensemble des informations statistiques produites lors de la simulation.
@@ -120,327 +229,629 @@ class Simulation:
                      self.magasin.nb_clients_total, self.magasin.nb_clients_traites, self.magasin.nb_clients_partis)
         return texte
 
-    class Client:
-        """La classe des clients represente la presence d'un client dans la simulation
-
-        Attributs:
-        ---------
-        moment_arrivee: le moment ou le client arrive dans le magasin
-                :type: float
-        temps_service: le moment ou le client a ete servi
-                :type: float
-        cadi: le montant du cadi du client
-                :type: float
-        tolerance: le temps maximum que le client peut attendre dans la file
-        """
-
-        def __init__(self, arrivee, cadi_max, variable_attente_max):
-            """Constructeur de la méthode
-            :param arrivee: le moment ou le client est arrive dans le magasin
-            :type arrivee: float
-            :param cadi_max: le montant maximum que peut prendre un cadi
-            :type cadi_max: float
-            :param variable_attente_max: la variable aleatoire de type exponentielle negative
-            :type variable_attente_max: float
-            """
-            self.moment_arrivee = arrivee
-            self.temps_service = math.inf
-            self.cadi = random.uniform(0, cadi_max)
-            self.tolerance = random.expovariate(variable_attente_max)
-
-        def donne_arrivee(self):
-            """Donne le moment ou le client est arrive dans le magasin.
-
-            :return: Le moment ou le client est arrive
-            :rtype str
-            """
-
-            return str(self.moment_arrivee)
-
-        def donne_temps_attente(self):
-            """Donne le temps que le client a du attendre dans la file avant d'être à une caisse. En se basant sur la
-            différence entre le moment où il a été servi et le moment où il est entré dans le magasin.
-
-            :return: le temps que le client a attendu
-            :rtype: float
-            """
-            return float(self.temps_service - self.moment_arrivee)
-
-    class Caisse:
-        """La classe caisse represente la presence d'une caisse au sein du magasin lors d'une simulation.
-
-        Attributs:
-        ---------
-        num_caisse: le numero qui sert a identifier la caisse
-                :type: int
-        prochain_service:
-                :type: float
-        libre: L'etat de la caisse, occupee ou libre
-                :type: bool
-        clients_servis: La liste des clients qui ont ete servis durant la simulation par cette caisse
-                :type: list
-        """
-
-        def __init__(self, identification):
-            """Constructeur de la méthode
+    # Les clients sont conserves dans le RegistreClients du magasin, Client n'en est qu'une vue
+    Client = Client
 
-            :param identification: le numéro d'identification de la caisse
-            :type identification: int
-            """
-            self.num_caisse = identification
-            self.prochain_service = math.inf
-            self.libre = True
-            self.clients_servis = []
-
-        def est_libre(self):
-            return self.libre
-
-        def change_occupation(self, valeur):
-            self.libre = valeur
-
-        def change_prochain_service(self, temps):
-            self.prochain_service = temps
-
-        def traiter_nouveau_client(self, client):
-            self.clients_servis.append(client)
-
-        def donne_info(self):
-            info_caisse = "La caisse numero " + str(self.num_caisse) + " a servi ces clients:\n"
-            for client in self.clients_servis:
-                info_caisse += "\t%s\n" % client.donne_arrivee()
-            info_caisse += "\nLa caisse numero %d a donc servi un total de %d clients" \
-                           % (self.num_caisse, len(self.clients_servis))
-            return info_caisse
-
-    class Magasin:
-        """La classe Magasin represente le fonctionnement d'un magasin pour la simulation.
-        Attributs:
-        ---------
-        caisses: la liste contenant l'ensemble des caisses du magasin
-                :type: list
-        file: la liste des clients dans la file en attente d'etre traite
-                :type: list
-        clients: la liste des clients dans le magasin.
-                :type: list
-        nb_clients_total: le nombre de clients presents lors de la simulation
-                :type: int
-        nb_clients_traites: le nombre de clients qui ont ete traites.
-                :type: int
-        nb_clients_partis: le nombre de clients qui n'ont pas pu etre traites;
-                :type: int
-        benefice: le benefice que le magasin se fait de part son activite
-                :type: float
-        manque_gagner: le manque d'argent engendré par le depart de client
-                :type: float
-        couts_rearrangements: les couts que le magasin doit payer pour rearranger
-                :type: float
-        esperance_client_magasin: esperance du nombre de clients dans le magasin
-                :type: float
-        esperance_client_file: esperance du nombre de clients dans la file
-                :type: float
-        esperance_temps_magasin: esperance du temps de sejour dans le magasin
-                :type: float
-        esperance_temps_file: esperance du temps d'attente dans la file
-                :type: float
+    # Les caisses et le fonctionnement du magasin sont ceux du moteur commun a toutes les simulations
+    Caisse = Caisse
 
+    class Magasin(MoteurMagasin):
+        """La classe Magasin represente le fonctionnement d'un magasin pour la simulation: un MoteurMagasin dont
+        toutes les caisses forment un seul groupe, sans montant maximum.
         """
 
-        def __init__(self, nbre_caisses):
+        def __init__(self, nbre_caisses, conserve_clients=True):
             """Instancie les attributs de classe de Magasin en initialisant un certains nombre de Caisse.
 
             :param nbre_caisses: le nombre de caisses ouvertes durant la simulation
             :type nbre_caisses: int
+            :param conserve_clients: si faux, le magasin ne conserve aucune trace des clients partis
+            :type conserve_clients: bool
             """
-            self.caisses = []
-            self.file = []
-            self.clients = []
-            self.nb_clients_total = 0
-            self.nb_clients_traites = 0
-            self.nb_clients_partis = 0
-            self.benefice = 0
-            self.manque_gagner = 0
-            self.couts_rearrangement = 0
-            self.esperance_client_magasin = 0
-            self.esperance_client_file = 0
-            self.esperance_temps_magasin = 0
-            self.esperance_temps_file = 0
-            for numero in range(nbre_caisses):
-                self.caisses.append(Simulation.Caisse(numero))
-
-        def simule(self, variable_arrivee, variable_temps_service, temps_simulation, benefice_cadi, cadi_max,
-                   couts_rearrangement, variable_attente_max):
-            """Simule le processus de files M/M/C au sein du magasin selon differente variable.
-
-            :param variable_arrivee: la variable aleatoire de type exponentielle pour le temps d'arrivee
-            :type variable_arrivee: float
-            :param variable_temps_service: la variable aleatoire de type exponentielle pour le temps de service
-            :type variable_temps_service: float
-            :param temps_simulation: le temps en minutes de la simulation
-            :type temps_simulation: float
-            :param benefice_cadi: le pourcentage de benefice que se fait le magasin sur la valeur du cadi d'un client
-            :type benefice_cadi: float
-            :param cadi_max: le montant maximum que peut prendre un cadi
-            :type cadi_max: float
-            :param couts_rearrangement: le cout fixe que le magasin paye pour rearranger un cadi de client
-            :type couts_rearrangement: float
-            :param variable_attente_max: la variable aleatoire de type exponentielle negative
-            :type variable_attente_max: float
-            """
-            # Initialisation
-            nb_clients = 0
-            temps = 0
-            temps_prochaine_arrivee = random.expovariate(variable_arrivee)
-            # Simulation
-            while temps < temps_simulation:
-                prochaine_caisse = self.donne_prochaine_caisse()
-                temps_prochain_service = prochaine_caisse.prochain_service
-                if temps_prochaine_arrivee <= temps_prochain_service:
-                    temps_prochain_evenement = temps_prochaine_arrivee
-                    client_arrive = True
-                else:
-                    temps_prochain_evenement = temps_prochain_service
-                    client_arrive = False
-
-                if temps_prochain_evenement < temps_simulation:
-                    self.esperance_client_magasin += nb_clients * (temps_prochain_evenement - temps)
-                    self.esperance_client_file += len(self.file) * (temps_prochain_evenement - temps)
-
-                temps = temps_prochain_evenement  # On passe au moment du prochain evenement
-                caisse_libre = self.donne_caisse_libre()
-
-                if client_arrive and temps < temps_simulation:
-                    client = Simulation.Client(temps, cadi_max, variable_attente_max)
-                    nb_clients += 1
-                    self.nb_clients_total += 1
-
-                    # On genere la prochaine arrivee et on verifie qu'elle ne depasse pas le temps de la simulation
-                    temps_prochaine_arrivee = temps + random.expovariate(variable_arrivee)
-
-                    if temps_prochaine_arrivee < temps_simulation:
-                        if caisse_libre:  # le client est traite par la caisse libre
-                            caisse_libre.traiter_nouveau_client(client)
-                            caisse_libre.change_occupation(False)
-                            caisse_libre.change_prochain_service(temps +
-                                                                 random.expovariate(variable_temps_service))
-                            client.temps_service = caisse_libre.prochain_service
-                            self.nb_clients_traites += 1
-                            self.benefice += (client.cadi * benefice_cadi)
-                            self.esperance_temps_magasin += (caisse_libre.prochain_service - temps)
-
-                        else:  # le client doit attendre dans la file
-                            self.file.append(client)
-                    else:  # la prochaine arrivee est indeterminee
-                        temps_prochaine_arrivee = math.inf
-
-                elif not client_arrive:  # On va traiter un client
-                    if len(self.file) != 0:  # Il y a des clients a traiter
-                        client = self.file.pop()
-                        client.temps_service = temps
-                        if client.tolerance >= client.donne_temps_attente():  # le client est reste dans la file
-                            # trop longtemps
-                            prochaine_caisse.change_prochain_service(temps +
-                                                                     random.expovariate(variable_temps_service))
-                            prochaine_caisse.traiter_nouveau_client(client)
-                            self.nb_clients_traites += 1
-                            self.benefice += (client.cadi * benefice_cadi)
-                            self.esperance_temps_file += client.donne_temps_attente()
-                            self.esperance_client_magasin += (prochaine_caisse.prochain_service - temps)
-                        else:  # le client a quitte la file
-                            self.manque_gagner += (client.cadi * benefice_cadi)
-                            self.couts_rearrangement += couts_rearrangement
-                            self.nb_clients_partis += 1
-                        nb_clients -= 1
-                    else:  # Il n'y a aucun client a traiter
-                        prochaine_caisse = self.donne_prochaine_caisse()
-                        prochaine_caisse.change_occupation(True)
-                        prochaine_caisse.change_prochain_service(math.inf)
-
-        def donne_prochaine_caisse(self):
-            """Renvoie la caisse qui peut traiter un client le plus rapidement parmi l'ensemble des caisses.
-
-            :return: la caisse dont le temps avant le prochain service est le plus petit
-            :rtype: Caisse
-            """
-            return min(self.caisses, key=lambda caisse: caisse.prochain_service)
+            MoteurMagasin.__init__(self, [(nbre_caisses, math.inf, 1.0)], conserve_clients)
 
-        def donne_caisse_libre(self):
-            """Renvoie la premiere caisse libre parmi la liste des caisses
+        @staticmethod
+        def repartition(nbre_caisses):
+            """Renvoie le nombre de caisses de chaque groupe d'un magasin de nbre_caisses caisses.
 
-            :return: renvoie la premiere caisse parmi la liste des caisses si pas renvoie None
-            :rtype: Caisse
-            """
-            for caisse in self.caisses:
-                if caisse.est_libre():
-                    return caisse
-            return None
-
-        def donne_esperances(self):
-            """Construit une liste des différentes esperances calculees pendant la simulation
-
-            :return: La liste des différentes esperances (float) calculees pendant simule()
-            :rtype : list
-            """
-            return [self.esperance_client_magasin, self.esperance_client_file,
-                    self.esperance_temps_magasin, self.esperance_temps_file]
-
-        def donne_info_magasin(self):
-            """ Construit une variable string contenant toutes les informations du magasin et la renvoie.
-
-            :return texte: Les informations des differentes caisses du magasin
-            :rtype texte: str
+            :param nbre_caisses: le nombre de caisses du magasin
+            :type nbre_caisses: int
+            :return: le nombre de caisses de l'unique groupe
+            :rtype: list
             """
-
-            texte = "Informations des differentes caisses du magasin.\n" + "________________________________________\n"
-            for caisse in self.caisses:
-                texte += caisse.donne_info()
-                texte += "\n----------------------------------------\n"
-            return texte
+            return [nbre_caisses]
+
+
+def recettes_cellules(classe, config, cellules, parallele, graine, communs=False, antithetique=False, cache=None):
+    """Simule une liste de couples (nombre de serveurs, numero de replication). La replication i avec a serveurs
+    utilise toujours la graine graine_replication(graine, a, i), ou graine_replication(graine, i) en mode communs, le
+    resultat ne depend donc pas du mode d'execution.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :param cellules: les couples (nombre de serveurs, numero de replication) a simuler
+    :type cellules: list
+    :param parallele: si vrai, les replications sont reparties sur plusieurs processus selon la section PARALLELE
+                      de config.ini
+    :type parallele: bool
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+                    (voir parallele.simule_cellule)
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est simulee par une paire antithetique et represente par le
+                         couple des recettes de ses deux membres
+    :type antithetique: bool
+    :param cache: si donne, seules les cellules absentes du cache sont simulees, et leurs resumes y sont ajoutes
+    :type cache: CacheResultats
+    :return: la recette de chaque cellule, dans l'ordre de cellules
+    :rtype: list
+    """
+    if cache is not None:
+        return recettes_cache(classe, config, cellules, parallele, graine, communs, antithetique, cache)
+    parametres = parametres_simulation(config)
+    if parallele:
+        nb_processus, taille_paquet = options_parallele(config)
+        return simule_cellules(classe, parametres, graine, cellules, nb_processus, taille_paquet, communs,
+                               antithetique)
+    return [simule_cellule(classe, parametres, graine, cellule, communs, antithetique) for cellule in cellules]
+
+
+def recettes_cache(classe, config, cellules, parallele, graine, communs, antithetique, cache):
+    """Renvoie les recettes d'une liste de cellules comme recettes_cellules, en lisant dans le cache celles qui y
+    sont deja. Les cellules manquantes sont simulees par parallele.resume_cellule et leurs resumes sont ajoutes au
+    cache. Une paire antithetique n'est lue du cache que si ses deux membres y sont.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :param cellules: les couples (nombre de serveurs, numero de replication) a simuler
+    :type cellules: list
+    :param parallele: si vrai, les cellules manquantes sont reparties sur plusieurs processus
+    :type parallele: bool
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est simulee par une paire antithetique
+    :type antithetique: bool
+    :param cache: le cache des resultats
+    :type cache: CacheResultats
+    :return: la recette de chaque cellule, dans l'ordre de cellules
+    :rtype: list
+    """
+    parametres = parametres_simulation(config)
+    membres = (False, True) if antithetique else (None,)
+    cles = [[cache.cle(classe, parametres, a, graine, (i,) if communs else (a, i), membre) for membre in membres]
+            for a, i in cellules]
+    connus = cache.lit(cle for cles_cellule in cles for cle in cles_cellule)
+    manquantes = [k for k, cles_cellule in enumerate(cles) if any(cle not in connus for cle in cles_cellule)]
+    cellules_manquantes = [cellules[k] for k in manquantes]
+    if parallele:
+        nb_processus, taille_paquet = options_parallele(config)
+        resumes = resume_cellules(classe, parametres, graine, cellules_manquantes, nb_processus, taille_paquet,
+                                  communs, antithetique)
+    else:
+        resumes = [resume_cellule(classe, parametres, graine, cellule, communs, antithetique)
+                   for cellule in cellules_manquantes]
+    nouveaux = {}
+    for k, resume in zip(manquantes, resumes):
+        nouveaux.update(zip(cles[k], resume if antithetique else (resume,)))
+    cache.ecrit(nouveaux)
+    connus.update(nouveaux)
+    if antithetique:
+        return [tuple(connus[cle][0] for cle in cles_cellule) for cles_cellule in cles]
+    return [connus[cles_cellule[0]][0] for cles_cellule in cles]
+
+
+def moyennes_antithetiques(classe, config, cellules, parallele, graine, communs=False, cache=None):
+    """Simule chaque cellule par une paire antithetique et renvoie la moyenne des recettes de chaque paire, qui
+    compte comme une seule observation.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :param cellules: les couples (nombre de serveurs, numero de replication) a simuler
+    :type cellules: list
+    :param parallele: si vrai, les replications sont reparties sur plusieurs processus
+    :type parallele: bool
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+    :type communs: bool
+    :param cache: le cache des resultats a utiliser, aucun si None
+    :type cache: CacheResultats
+    :return: la recette moyenne de chaque paire, dans l'ordre de cellules
+    :rtype: list
+    """
+    return [(recette + recette_antithetique) / 2 for recette, recette_antithetique
+            in recettes_cellules(classe, config, cellules, parallele, graine, communs, True, cache)]
+
+
+def recettes_masse(classe, config, nbre_serveurs, nb_replications, parallele, graine, communs=False,
+                   antithetique=False, cache=None):
+    """Simule nb_replications magasins pour chaque nombre de serveurs.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :param nbre_serveurs: les nombres de serveurs a simuler
+    :type nbre_serveurs: list
+    :param nb_replications: le nombre de replications par nombre de serveurs
+    :type nb_replications: int
+    :param parallele: si vrai, les replications sont reparties sur plusieurs processus selon la section PARALLELE
+                      de config.ini
+    :type parallele: bool
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+                    (voir parallele.simule_cellule)
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est simulee par une paire antithetique et represente par le
+                         couple des recettes de ses deux membres
+    :type antithetique: bool
+    :param cache: le cache des resultats a utiliser, aucun si None
+    :type cache: CacheResultats
+    :return: une liste de recettes par nombre de serveurs
+    :rtype: list
+    """
+    nbre_serveurs = list(nbre_serveurs)
+    cellules = [(a, i) for a in nbre_serveurs for i in range(nb_replications)]
+    recettes = recettes_cellules(classe, config, cellules, parallele, graine, communs, antithetique, cache)
+    return [recettes[k * nb_replications:(k + 1) * nb_replications] for k in range(len(nbre_serveurs))]
+
+
+def ecrit_balayage(classe, nom_fichier, config, parallele, graine, adaptatif, communs=False, antithetique=False,
+                   cache=None, partage=False):
+    """Simule les nombres de serveurs de 10 a 35 et ecrit une ligne de recettes par nombre de serveurs dans
+    nom_fichier. En mode adaptatif, le nombre de replications de chaque ligne est choisi selon la section ADAPTATIF de
+    config.ini et la precision obtenue est ecrite dans un second fichier, suffixe par _precision, avec une ligne
+    (nombre de serveurs, replications, recette moyenne, demi-largeur de l'intervalle de confiance) par nombre de
+    serveurs. En mode antithetique, chaque recette ecrite est la moyenne d'une paire antithetique; hors mode
+    adaptatif, le facteur de reduction de variance obtenu pour chaque nombre de serveurs est ecrit dans un fichier
+    suffixe par _antithetique.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param nom_fichier: le nom du fichier csv des recettes
+    :type nom_fichier: str
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :param parallele: si vrai, les replications sont reparties sur plusieurs processus
+    :type parallele: bool
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param adaptatif: si vrai, le nombre de replications est adapte a la precision visee
+    :type adaptatif: bool
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+                    (voir parallele.simule_cellule)
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est simulee par une paire antithetique
+    :type antithetique: bool
+    :param cache: le cache des resultats a utiliser, aucun si None
+    :type cache: CacheResultats
+    :param partage: si vrai, les replications sont reparties sur plusieurs processus qui ecrivent leurs resultats en
+                    memoire partagee (voir ecrit_balayage_partage)
+    :type partage: bool
+    """
+    if partage:
+        if adaptatif or cache is not None:
+            raise ValueError("La memoire partagee ne permet ni le mode adaptatif ni le cache")
+        ecrit_balayage_partage(classe, nom_fichier, config, graine, communs, antithetique)
+        return
+    nbre_serveurs = range(10, 36)
+    racine, extension = os.path.splitext(nom_fichier)
+    with open(nom_fichier, 'w') as myfile:
+        wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
+        if not adaptatif:
+            lignes = recettes_masse(classe, config, nbre_serveurs, 100, parallele, graine, communs, antithetique,
+                                    cache)
+            for ligne in lignes:
+                wr.writerow([sum(paire) / 2 for paire in ligne] if antithetique else ligne)
+        else:
+            demi_largeur, niveau, minimum, maximum = options_adaptatives(config)
+            simule = moyennes_antithetiques if antithetique else recettes_cellules
+            resultats = recettes_adaptatives(partial(simule, classe, config, parallele=parallele, graine=graine,
+                                                     communs=communs, cache=cache),
+                                             nbre_serveurs, demi_largeur, niveau, minimum, maximum)
+            for recettes, accumulateur in resultats:
+                wr.writerow(recettes)
+    if adaptatif:
+        with open(racine + '_precision' + extension, 'w') as myfile:
+            wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
+            for a, (recettes, accumulateur) in zip(nbre_serveurs, resultats):
+                wr.writerow([a, accumulateur.n, accumulateur.moyenne, accumulateur.demi_largeur(niveau)])
+    elif antithetique:
+        with open(racine + '_antithetique' + extension, 'w') as myfile:
+            wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
+            for a, paires in zip(nbre_serveurs, lignes):
+                wr.writerow([a, facteur_antithetique(paires)])
+
+
+def ecrit_balayage_partage(classe, nom_fichier, config, graine, communs=False, antithetique=False):
+    """Simule 100 replications pour chaque nombre de serveurs de 10 a 35 sur les processus de la section PARALLELE
+    de config.ini, qui ecrivent le resume de chaque replication dans une matrice en memoire partagee (voir
+    parallele.resume_partage). Les fichiers sont ensuite ecrits a partir de cette matrice par ecrit_resumes.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param nom_fichier: le nom du fichier csv des recettes
+    :type nom_fichier: str
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est simulee par une paire antithetique
+    :type antithetique: bool
+    """
+    nbre_serveurs = range(10, 36)
+    nb_processus, taille_paquet = options_parallele(config)
+    with resume_partage(classe, parametres_simulation(config), graine, nbre_serveurs, 100, nb_processus,
+                        taille_paquet, communs, antithetique) as matrice:
+        ecrit_resumes(nom_fichier, nbre_serveurs, matrice.tableau, antithetique)
+
+
+def ecrit_balayage_binaire(classe, nom_fichier, config, parallele, graine, communs=False, antithetique=False):
+    """Simule 100 replications pour chaque nombre de serveurs de 10 a 35 en conservant le resume de chaque
+    replication dans un StockageBinaire, dans le dossier de la section STOCKAGE de config.ini nomme comme
+    nom_fichier sans extension. Les replications sont simulees par blocs de taille_bloc, chaque bloc etant reporte
+    sur le disque des qu'il est termine: si un stockage du meme balayage existe deja, seules les replications qui y
+    manquent sont simulees, et un balayage interrompu reprend donc la ou il s'est arrete. Les fichiers csv sont
+    ensuite ecrits a partir du stockage comme par ecrit_balayage_partage.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param nom_fichier: le nom du fichier csv des recettes
+    :type nom_fichier: str
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :param parallele: si vrai, les replications de chaque bloc sont reparties sur plusieurs processus
+    :type parallele: bool
+    :param graine: la graine maitre du balayage; si None, celle du stockage repris, ou une graine tiree au hasard
+    :type graine: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est simulee par une paire antithetique
+    :type antithetique: bool
+    :return: le stockage du balayage, ferme
+    :rtype: StockageBinaire
+    """
+    nbre_serveurs = list(range(10, 36))
+    parametres = parametres_simulation(config)
+    dossier, taille_bloc = options_stockage(config)
+    stockage = StockageBinaire(os.path.join(dossier, os.path.splitext(os.path.basename(nom_fichier))[0]),
+                               manifeste_balayage(classe, parametres, graine, nbre_serveurs, 100, communs,
+                                                  antithetique, CHAMPS_RESUME))
+    graine = stockage.manifeste['graine']
+    manquantes = stockage.manquantes()
+    for debut in range(0, len(manquantes), taille_bloc):
+        bloc = manquantes[debut:debut + taille_bloc]
+        cellules = [(nbre_serveurs[k], i) for k, i in bloc]
+        if parallele:
+            nb_processus, taille_paquet = options_parallele(config)
+            resumes = resume_cellules(classe, parametres, graine, cellules, nb_processus, taille_paquet, communs,
+                                      antithetique)
+        else:
+            resumes = [resume_cellule(classe, parametres, graine, cellule, communs, antithetique)
+                       for cellule in cellules]
+        stockage.ecrit(bloc, resumes)
+    ecrit_resumes(nom_fichier, nbre_serveurs, stockage.tableau, antithetique)
+    stockage.ferme()
+    return stockage
+
+
+def ecrit_resumes(nom_fichier, nbre_serveurs, tableau, antithetique=False):
+    """Ecrit les fichiers csv d'un balayage a partir de la matrice des resumes de ses replications: les recettes
+    dans nom_fichier comme ecrit_balayage, et, dans un fichier suffixe par _resume, une ligne par nombre de serveurs
+    avec la moyenne sur les replications de chaque grandeur de parallele.CHAMPS_RESUME. En mode antithetique, le
+    facteur de reduction de variance est de plus ecrit dans un fichier suffixe par _antithetique.
+
+    :param nom_fichier: le nom du fichier csv des recettes
+    :type nom_fichier: str
+    :param nbre_serveurs: les nombres de serveurs du balayage
+    :type nbre_serveurs: list
+    :param tableau: les resumes, de forme (nombres de serveurs, replications, membres, champs du resume)
+    :type tableau: numpy.ndarray
+    :param antithetique: si vrai, chaque replication est une paire antithetique
+    :type antithetique: bool
+    """
+    racine, extension = os.path.splitext(nom_fichier)
+    recettes = tableau[:, :, :, 0]
+    with open(nom_fichier, 'w') as myfile:
+        wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
+        for ligne in recettes:
+            wr.writerow(ligne.mean(axis=1).tolist() if antithetique else ligne[:, 0].tolist())
+    with open(racine + '_resume' + extension, 'w') as myfile:
+        wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
+        wr.writerow(('nombre_serveurs',) + CHAMPS_RESUME)
+        for a, resumes in zip(nbre_serveurs, tableau):
+            wr.writerow([a] + resumes.mean(axis=(0, 1)).tolist())
+    if antithetique:
+        with open(racine + '_antithetique' + extension, 'w') as myfile:
+            wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
+            for a, paires in zip(nbre_serveurs, recettes):
+                wr.writerow([a, facteur_antithetique(paires.tolist())])
+
+
+def verifie_binaire(lot, adaptatif, cache, partage):
+    """Verifie que les options d'un balayage sont compatibles avec le stockage binaire.
+    """
+    if lot or adaptatif or cache or partage:
+        raise ValueError("Le stockage binaire ne permet ni le mode lot, ni le mode adaptatif, ni le cache, ni la "
+                         "memoire partagee")
 
 
-def simulation_masse():
+def simulation_masse(lot=False, parallele=False, graine=None, adaptatif=False, communs=False, antithetique=False,
+                     cache=False, partage=False, binaire=False):
     """
     Fait des simulations un grand nombre de fois et crée un fichier csv avec les résultats.
+
+    :param lot: si vrai, toutes les replications sont simulees ensemble par simulation_lot
+    :type lot: bool
+    :param parallele: si vrai, les replications sont reparties sur plusieurs processus selon la section PARALLELE
+                      de config.ini
+    :type parallele: bool
+    :param graine: la graine maitre dont sont derivees les graines des replications, tiree au hasard si None
+    :type graine: int
+    :param adaptatif: si vrai, chaque nombre de serveurs est simule jusqu'a la precision demandee dans la section
+                      ADAPTATIF de config.ini (voir ecrit_balayage)
+    :type adaptatif: bool
+    :param communs: si vrai, la replication i utilise les memes arrivees, cadis, tolerances et temps de service pour
+                    tous les nombres de serveurs et pour les deux classes de simulation, les colonnes des fichiers
+                    peuvent alors etre comparees deux a deux
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est une paire antithetique dont la moyenne est ecrite, et le
+                         facteur de reduction de variance obtenu est ecrit dans un fichier suffixe par _antithetique
+                         (voir ecrit_balayage)
+    :type antithetique: bool
+    :param cache: si vrai, les replications deja simulees avec la meme graine sont lues dans le cache de la section
+                  CACHE de config.ini au lieu d'etre simulees, ce qui suppose de fixer graine
+    :type cache: bool
+    :param partage: si vrai, les replications sont reparties sur plusieurs processus qui ecrivent leurs resultats en
+                    memoire partagee, et un fichier de resume suffixe par _resume est ecrit (voir
+                    ecrit_balayage_partage)
+    :type partage: bool
+    :param binaire: si vrai, le resume de chaque replication est conserve dans un stockage binaire qui permet de
+                    reprendre un balayage interrompu, en gardant sa graine si graine est None (voir
+                    ecrit_balayage_binaire)
+    :type binaire: bool
     """
     CONFIG = load_config()
-    with open('simulation_normale1.csv', 'w') as myfile:
-        wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
-        for a in range(10, 36):
-            recettes = []
-            for i in range(100):
-                simulation = Simulation(float(CONFIG['CONSTANTE']['X']), float(CONFIG['CONSTANTE']['Y']),
-                                        float(CONFIG['CONSTANTE']['Z']),
-                                        float(CONFIG['CONSTANTE']['W']), float(CONFIG['VARIABLE']['lambda']),
-                                        float(CONFIG['VARIABLE']['mu']),
-                                        float(CONFIG['VARIABLE']['alpha']), float(CONFIG['VARIABLE']['beta']),
-                                        a,
-                                        float(CONFIG['SIMULATION']['temps_simulation']))
-
-                simulation.simulation_magasin()
-                recettes.append(simulation.recette)
-            wr.writerow(recettes)
-
-
-def simulation_originale_masse():
+    if binaire:
+        verifie_binaire(lot, adaptatif, cache, partage)
+        ecrit_balayage_binaire(Simulation, 'simulation_normale1.csv', CONFIG, parallele, graine, communs, antithetique)
+        return
+    graine = graine_maitre(graine)
+    if lot and (communs or antithetique or cache or partage):
+        raise ValueError("Le mode lot ne permet ni les nombres aleatoires communs, ni les paires antithetiques, ni le "
+                         "cache, ni la memoire partagee")
+    if lot:
+        with open('simulation_normale1.csv', 'w') as myfile:
+            wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
+            nbre_serveurs = list(range(10, 36))
+            recettes = simulation_lot(float(CONFIG['CONSTANTE']['X']), float(CONFIG['CONSTANTE']['Y']),
+                                      float(CONFIG['CONSTANTE']['Z']),
+                                      float(CONFIG['CONSTANTE']['W']), float(CONFIG['VARIABLE']['lambda']),
+                                      float(CONFIG['VARIABLE']['mu']),
+                                      float(CONFIG['VARIABLE']['alpha']),
+                                      [a for a in nbre_serveurs for i in range(100)],
+                                      float(CONFIG['SIMULATION']['temps_simulation']),
+                                      len(nbre_serveurs) * 100, graine)
+            for ligne in recettes.reshape(len(nbre_serveurs), 100):
+                wr.writerow(ligne.tolist())
+        return
+    cache = CacheResultats(*options_cache(CONFIG)) if cache else None
+    ecrit_balayage(Simulation, 'simulation_normale1.csv', CONFIG, parallele, graine, adaptatif, communs,
+                   antithetique, cache, partage)
+    if cache is not None:
+        cache.ferme()
+
+
+def simulation_originale_masse(parallele=False, graine=None, adaptatif=False, communs=False, antithetique=False,
+                               cache=False, partage=False, binaire=False):
     """
     Fait des simulations un grand nombre de fois et crée un fichier csv avec les résultats.
+
+    :param parallele: si vrai, les replications sont reparties sur plusieurs processus selon la section PARALLELE
+                      de config.ini
+    :type parallele: bool
+    :param graine: la graine maitre dont sont derivees les graines des replications, tiree au hasard si None
+    :type graine: int
+    :param adaptatif: si vrai, chaque nombre de serveurs est simule jusqu'a la precision demandee dans la section
+                      ADAPTATIF de config.ini (voir ecrit_balayage)
+    :type adaptatif: bool
+    :param communs: si vrai, la replication i utilise les memes arrivees, cadis, tolerances et temps de service pour
+                    tous les nombres de serveurs et pour les deux classes de simulation, les colonnes des fichiers
+                    peuvent alors etre comparees deux a deux
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est une paire antithetique dont la moyenne est ecrite, et le
+                         facteur de reduction de variance obtenu est ecrit dans un fichier suffixe par _antithetique
+                         (voir ecrit_balayage)
+    :type antithetique: bool
+    :param cache: si vrai, les replications deja simulees avec la meme graine sont lues dans le cache de la section
+                  CACHE de config.ini au lieu d'etre simulees, ce qui suppose de fixer graine
+    :type cache: bool
+    :param partage: si vrai, les replications sont reparties sur plusieurs processus qui ecrivent leurs resultats en
+                    memoire partagee, et un fichier de resume suffixe par _resume est ecrit (voir
+                    ecrit_balayage_partage)
+    :type partage: bool
+    :param binaire: si vrai, le resume de chaque replication est conserve dans un stockage binaire qui permet de
+                    reprendre un balayage interrompu, en gardant sa graine si graine est None (voir
+                    ecrit_balayage_binaire)
+    :type binaire: bool
     """
     CONFIG = load_config()
-    with open('simulation_originale1.csv', 'w') as myfile:
-        wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
-        for a in range(10, 36):
-            recettes = []
-            for i in range(100):
-                simulation = SimulationOriginale(float(CONFIG['CONSTANTE']['X']), float(CONFIG['CONSTANTE']['Y']),
-                                                 float(CONFIG['CONSTANTE']['Z']),
-                                                 float(CONFIG['CONSTANTE']['W']), float(CONFIG['VARIABLE']['lambda']),
-                                                 float(CONFIG['VARIABLE']['mu']),
-                                                 float(CONFIG['VARIABLE']['alpha']), float(CONFIG['VARIABLE']['beta']),
-                                                 a,
-                                                 float(CONFIG['SIMULATION']['temps_simulation']))
-
-                simulation.simulation_magasin()
-                recettes.append(simulation.recette)
-            wr.writerow(recettes)
+    if binaire:
+        verifie_binaire(False, adaptatif, cache, partage)
+        ecrit_balayage_binaire(SimulationOriginale, 'simulation_originale1.csv', CONFIG, parallele, graine, communs,
+                               antithetique)
+        return
+    cache = CacheResultats(*options_cache(CONFIG)) if cache else None
+    ecrit_balayage(SimulationOriginale, 'simulation_originale1.csv', CONFIG, parallele, graine_maitre(graine),
+                   adaptatif, communs, antithetique, cache, partage)
+    if cache is not None:
+        cache.ferme()
+
+
+def optimisation_serveurs(classe=Simulation, parallele=False, graine=None, communs=False, cache=False):
+    """Cherche le nombre de serveurs de 10 a 35 qui maximise la recette moyenne par une course (voir
+    optimiseur.course_serveurs) selon la section OPTIMISATION de config.ini, au lieu de simuler 100 fois chaque
+    nombre de serveurs. Pour Simulation, si ecart_relatif est strictement positif, seuls les nombres de serveurs
+    retenus par erlang_a.serveurs_candidats entrent dans la course.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parallele: si vrai, les replications sont reparties sur plusieurs processus selon la section PARALLELE
+                      de config.ini
+    :type parallele: bool
+    :param graine: la graine maitre dont sont derivees les graines des replications, tiree au hasard si None
+    :type graine: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+                    et les candidats sont compares replication par replication
+    :type communs: bool
+    :param cache: si vrai, les replications deja simulees avec la meme graine sont lues dans le cache de la section
+                  CACHE de config.ini au lieu d'etre simulees
+    :type cache: bool
+    :return: le meilleur nombre de serveurs, la liste des candidats encore en course, et le dictionnaire des
+             accumulateurs de recettes de tous les nombres de serveurs simules
+    :rtype: tuple
+    """
+    CONFIG = load_config()
+    niveau, replications_initiales, replications_max, ecart_relatif = options_optimisation(CONFIG)
+    nbre_serveurs = range(10, 36)
+    if classe is Simulation and ecart_relatif is not None:
+        nbre_serveurs = serveurs_candidats(CONFIG, nbre_serveurs, ecart_relatif)
+    cache = CacheResultats(*options_cache(CONFIG)) if cache else None
+    resultat = course_serveurs(partial(recettes_cellules, classe, CONFIG, parallele=parallele,
+                                       graine=graine_maitre(graine), communs=communs, cache=cache),
+                               nbre_serveurs, niveau, replications_initiales, replications_max, communs)
+    if cache is not None:
+        cache.ferme()
+    return resultat
+
+
+def instrumentation_masse(classe=Simulation, nb_replications=100, parallele=False, graine=None, communs=False):
+    """Simule nb_replications magasins instrumentes pour chaque nombre de serveurs de 10 a 35, avec les graines de
+    simulation_masse, et fusionne les instrumentations des replications de chaque nombre de serveurs.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param nb_replications: le nombre de replications par nombre de serveurs
+    :type nb_replications: int
+    :param parallele: si vrai, les replications sont reparties sur plusieurs processus selon la section PARALLELE
+                      de config.ini
+    :type parallele: bool
+    :param graine: la graine maitre dont sont derivees les graines des replications, tiree au hasard si None
+    :type graine: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+    :type communs: bool
+    :return: l'instrumentation fusionnee de chaque nombre de serveurs
+    :rtype: dict
+    """
+    CONFIG = load_config()
+    parametres = parametres_simulation(CONFIG)
+    graine = graine_maitre(graine)
+    nbre_serveurs = range(10, 36)
+    cellules = [(a, i) for a in nbre_serveurs for i in range(nb_replications)]
+    if parallele:
+        nb_processus, taille_paquet = options_parallele(CONFIG)
+        instrumentations = instrumente_cellules(classe, parametres, graine, cellules, nb_processus, taille_paquet,
+                                                communs)
+    else:
+        instrumentations = [instrumente_cellule(classe, parametres, graine, cellule, communs) for cellule in cellules]
+    resultat = {a: Instrumentation() for a in nbre_serveurs}
+    for (a, i), instrumentation in zip(cellules, instrumentations):
+        resultat[a].fusionne(instrumentation)
+    return resultat
+
+
+def distributions_masse(classe=Simulation, nb_replications=100, parallele=False, graine=None, communs=False):
+    """Simule nb_replications magasins pour chaque nombre de serveurs de 10 a 35, avec les graines de
+    simulation_masse, et fusionne les distributions de la longueur de la file et des temps d'attente des replications
+    de chaque nombre de serveurs (voir distributions).
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param nb_replications: le nombre de replications par nombre de serveurs
+    :type nb_replications: int
+    :param parallele: si vrai, les replications sont reparties sur plusieurs processus selon la section PARALLELE
+                      de config.ini
+    :type parallele: bool
+    :param graine: la graine maitre dont sont derivees les graines des replications, tiree au hasard si None
+    :type graine: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+    :type communs: bool
+    :return: le couple (distribution de la longueur de la file, histogramme des attentes) de chaque nombre de
+             serveurs
+    :rtype: dict
+    """
+    CONFIG = load_config()
+    parametres = parametres_simulation(CONFIG)
+    graine = graine_maitre(graine)
+    nbre_serveurs = range(10, 36)
+    cellules = [(a, i) for a in nbre_serveurs for i in range(nb_replications)]
+    if parallele:
+        nb_processus, taille_paquet = options_parallele(CONFIG)
+        distributions = distribue_cellules(classe, parametres, graine, cellules, nb_processus, taille_paquet,
+                                           communs)
+    else:
+        distributions = [distribue_cellule(classe, parametres, graine, cellule, communs) for cellule in cellules]
+    resultat = {a: (DistributionLongueur(), HistogrammeAttente()) for a in nbre_serveurs}
+    for (a, i), (distribution_file, attentes) in zip(cellules, distributions):
+        resultat[a][0].fusionne(distribution_file)
+        resultat[a][1].fusionne(attentes)
+    return resultat
+
+
+def simulation_stationnaire(nbre_serveurs=None, graine=None):
+    """Simule un seul magasin sur la duree de la section STATIONNAIRE de config.ini, sans conserver les clients, et
+    en estime les mesures stationnaires: la periode de chauffe est ecartee et les intervalles de confiance sont
+    calcules par moyennes par lots (voir regime_stationnaire.estime_regime).
+
+    :param nbre_serveurs: le nombre de serveurs, celui de la section SIMULATION de config.ini si None
+    :type nbre_serveurs: int
+    :param graine: la graine de la simulation, tiree au hasard si None
+    :type graine: int
+    :return: la duree de chauffe et les mesures stationnaires avec leurs demi-largeurs
+    :rtype: dict
+    """
+    CONFIG = load_config()
+    x, y, z, w, lam, mu, alpha, beta, temps_simulation = parametres_simulation(CONFIG)
+    duree, pas_releve, nb_lots, niveau = options_stationnaire(CONFIG)
+    if nbre_serveurs is None:
+        nbre_serveurs = int(CONFIG['SIMULATION']['nombre_serveurs'])
+    simulation = Simulation(x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, duree, graine, conserve_clients=False)
+    simulation.simulation_magasin(pas_releve=pas_releve)
+    return estime_regime(simulation.magasin.releves, pas_releve, nbre_serveurs * w, nb_lots, niveau)
+
+
+def simulation_horaires(nbre_serveurs=None, graine=None):
+    """Simule une journee dont le taux d'arrivee et le nombre de caisses suivent les horaires de la section HORAIRES
+    de config.ini (voir horaires.options_horaires), sans conserver les clients.
+
+    :param nbre_serveurs: le nombre de serveurs a l'ouverture, celui de la section SIMULATION de config.ini si None
+    :type nbre_serveurs: int
+    :param graine: la graine de la simulation, tiree au hasard si None
+    :type graine: int
+    :return: la simulation terminee
+    :rtype: Simulation
+    """
+    CONFIG = load_config()
+    x, y, z, w, lam, mu, alpha, beta, temps_simulation = parametres_simulation(CONFIG)
+    profil, planning = options_horaires(CONFIG)
+    if nbre_serveurs is None:
+        nbre_serveurs = int(CONFIG['SIMULATION']['nombre_serveurs'])
+    simulation = Simulation(x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation, graine,
+                            conserve_clients=False, profil_arrivees=profil, planning_serveurs=planning)
+    simulation.simulation_magasin()
+    return simulation
 
 
 def simulation_originale():
@@ -0,0 +1,89 @@
+from statistiques import Accumulateur
+
+
+def course_serveurs(simule, nbre_serveurs, niveau=0.95, replications_initiales=10, replications_max=640,
+                    apparie=False):
+    """Cherche le nombre de serveurs qui maximise la recette moyenne par une course: tous les candidats sont simules,
+    ceux dont la recette est nettement dominee sont elimines, et le nombre de replications des candidats restants est
+    double a chaque tour. Un candidat est domine lorsque la borne superieure de son intervalle de confiance est
+    inferieure a la plus grande borne inferieure parmi les candidats. Les replications se concentrent ainsi sur les
+    nombres de serveurs proches de l'optimum.
+
+    Lorsque la replication i de chaque candidat utilise les memes nombres aleatoires, les candidats peuvent etre
+    compares deux a deux: en mode apparie, un candidat est domine lorsque l'intervalle de confiance de ses ecarts de
+    recette avec le meilleur candidat, replication par replication, est entierement negatif.
+
+    :param simule: la fonction qui simule une liste de couples (nombre de serveurs, numero de replication) et renvoie
+                   leurs recettes dans le meme ordre
+    :type simule: callable
+    :param nbre_serveurs: les nombres de serveurs candidats
+    :type nbre_serveurs: list
+    :param niveau: le niveau de confiance des intervalles utilises pour eliminer les candidats
+    :type niveau: float
+    :param replications_initiales: le nombre de replications de chaque candidat au premier tour
+    :type replications_initiales: int
+    :param replications_max: le nombre de replications au dela duquel la course s'arrete
+    :type replications_max: int
+    :param apparie: si vrai, les candidats sont compares par les ecarts de recette de leurs replications de meme
+                    numero
+    :type apparie: bool
+    :return: le meilleur nombre de serveurs, la liste des candidats encore en course, et le dictionnaire des
+             accumulateurs de recettes de tous les nombres de serveurs
+    :rtype: tuple
+    """
+    candidats = list(nbre_serveurs)
+    accumulateurs = {a: Accumulateur() for a in candidats}
+    recettes = {a: [] for a in candidats}
+    replications = max(replications_initiales, 2)
+    while True:
+        cellules = [(a, i) for a in candidats for i in range(accumulateurs[a].n, replications)]
+        for (a, i), recette in zip(cellules, simule(cellules)):
+            accumulateurs[a].ajoute(recette)
+            recettes[a].append(recette)
+        if apparie:
+            meneur = max(candidats, key=lambda a: accumulateurs[a].moyenne)
+            candidats = [a for a in candidats if a == meneur
+                         or _borne_superieure_ecarts(recettes[a], recettes[meneur], niveau) >= 0]
+        else:
+            borne = max(accumulateurs[a].moyenne - accumulateurs[a].demi_largeur(niveau) for a in candidats)
+            candidats = [a for a in candidats
+                         if accumulateurs[a].moyenne + accumulateurs[a].demi_largeur(niveau) >= borne]
+        if len(candidats) == 1 or replications >= replications_max:
+            break
+        replications = min(2 * replications, replications_max)
+    meilleur = max(candidats, key=lambda a: accumulateurs[a].moyenne)
+    return meilleur, candidats, accumulateurs
+
+
+def _borne_superieure_ecarts(recettes, recettes_reference, niveau):
+    """Renvoie la borne superieure de l'intervalle de confiance sur l'ecart moyen entre deux series de recettes
+    appariees.
+
+    :param recettes: les recettes du candidat
+    :type recettes: list
+    :param recettes_reference: les recettes du candidat de reference, replication par replication
+    :type recettes_reference: list
+    :param niveau: le niveau de confiance de l'intervalle
+    :type niveau: float
+    :return: la borne superieure
+    :rtype: float
+    """
+    ecarts = Accumulateur()
+    for recette, reference in zip(recettes, recettes_reference):
+        ecarts.ajoute(recette - reference)
+    return ecarts.moyenne + ecarts.demi_largeur(niveau)
+
+
+def options_optimisation(config):
+    """Renvoie les parametres de la section OPTIMISATION de config.ini.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :return: le tuple (niveau, replications_initiales, replications_max, ecart_relatif), ecart_relatif valant None
+             si les candidats ne doivent pas etre preselectionnes par le modele d'Erlang-A
+    :rtype: tuple
+    """
+    section = config['OPTIMISATION']
+    ecart_relatif = float(section.get('ecart_relatif', 0))
+    return (float(section.get('niveau_confiance', 0.95)), int(section.get('replications_initiales', 10)),
+            int(section.get('replications_max', 640)), ecart_relatif if ecart_relatif > 0 else None)
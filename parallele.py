@@ -0,0 +1,363 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from aleatoire import graine_replication
+
+# Grandeurs du resume d'une replication renvoye par resume_cellule, dans l'ordre
+CHAMPS_RESUME = ('recette', 'nb_clients_total', 'nb_clients_traites', 'nb_clients_partis',
+                 'esperance_client_magasin', 'esperance_client_file', 'esperance_temps_magasin',
+                 'esperance_temps_file')
+
+
+def simule_cellule(classe, parametres, graine, cellule, communs=False, antithetique=False):
+    """Execute une replication d'une simulation pour un nombre de serveurs donne.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple (x, y, z, w, lam, mu, alpha, beta, temps_simulation) renvoye par
+                       parametres_simulation
+    :type parametres: tuple
+    :param graine: la graine maitre du balayage, la graine de la replication en est derivee avec la cellule
+    :type graine: int
+    :param cellule: le couple (nombre de serveurs, numero de la replication)
+    :type cellule: tuple
+    :param communs: si vrai, la graine ne depend que du numero de la replication: la replication i utilise les
+                    memes arrivees, cadis, tolerances et temps de service quel que soit le nombre de serveurs et la
+                    classe de simulation
+    :type communs: bool
+    :param antithetique: si vrai, la replication est simulee par une paire antithetique de magasins de meme graine
+    :type antithetique: bool
+    :return: la recette de la replication, ou le couple des recettes des deux membres de la paire antithetique
+    :rtype: float or tuple
+    """
+    cle = cellule[1:] if communs else cellule
+    if antithetique:
+        return tuple(_recette(classe, parametres, cellule[0], graine_replication(graine, *cle), membre)
+                     for membre in (False, True))
+    return _recette(classe, parametres, cellule[0], graine_replication(graine, *cle))
+
+
+def _recette(classe, parametres, nbre_serveurs, graine, antithetique=None):
+    """Simule un magasin et renvoie sa recette.
+    """
+    x, y, z, w, lam, mu, alpha, beta, temps_simulation = parametres
+    simulation = classe(x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation, graine,
+                        antithetique=antithetique)
+    simulation.simulation_magasin()
+    return simulation.recette
+
+
+def resume_cellule(classe, parametres, graine, cellule, communs=False, antithetique=False):
+    """Execute une replication d'une simulation comme simule_cellule, et en renvoie le resume: la recette, les
+    nombres de clients et les esperances du magasin, dans l'ordre de CHAMPS_RESUME.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple renvoye par parametres_simulation
+    :type parametres: tuple
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param cellule: le couple (nombre de serveurs, numero de la replication)
+    :type cellule: tuple
+    :param communs: si vrai, la graine ne depend que du numero de la replication (voir simule_cellule)
+    :type communs: bool
+    :param antithetique: si vrai, la replication est simulee par une paire antithetique
+    :type antithetique: bool
+    :return: le resume de la replication, ou le couple des resumes des deux membres de la paire antithetique
+    :rtype: tuple
+    """
+    cle = cellule[1:] if communs else cellule
+    if antithetique:
+        return tuple(_resume(classe, parametres, cellule[0], graine_replication(graine, *cle), membre)
+                     for membre in (False, True))
+    return _resume(classe, parametres, cellule[0], graine_replication(graine, *cle))
+
+
+def _resume(classe, parametres, nbre_serveurs, graine, antithetique=None):
+    """Simule un magasin et renvoie son resume.
+    """
+    x, y, z, w, lam, mu, alpha, beta, temps_simulation = parametres
+    simulation = classe(x, y, z, w, lam, mu, alpha, beta, nbre_serveurs, temps_simulation, graine,
+                        antithetique=antithetique)
+    simulation.simulation_magasin()
+    magasin = simulation.magasin
+    return (simulation.recette, magasin.nb_clients_total, magasin.nb_clients_traites,
+            magasin.nb_clients_partis) + tuple(magasin.donne_esperances())
+
+
+def instrumente_cellule(classe, parametres, graine, cellule, communs=False):
+    """Execute une replication instrumentee d'une simulation pour un nombre de serveurs donne, avec la meme graine
+    que simule_cellule.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple (x, y, z, w, lam, mu, alpha, beta, temps_simulation) renvoye par
+                       parametres_simulation
+    :type parametres: tuple
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param cellule: le couple (nombre de serveurs, numero de la replication)
+    :type cellule: tuple
+    :param communs: si vrai, la graine ne depend que du numero de la replication (voir simule_cellule)
+    :type communs: bool
+    :return: l'instrumentation de la replication
+    :rtype: Instrumentation
+    """
+    x, y, z, w, lam, mu, alpha, beta, temps_simulation = parametres
+    cle = cellule[1:] if communs else cellule
+    simulation = classe(x, y, z, w, lam, mu, alpha, beta, cellule[0], temps_simulation,
+                        graine_replication(graine, *cle), instrumente=True)
+    simulation.simulation_magasin()
+    return simulation.instrumentation
+
+
+def distribue_cellule(classe, parametres, graine, cellule, communs=False):
+    """Execute une replication d'une simulation pour un nombre de serveurs donne, avec la meme graine que
+    simule_cellule, et renvoie les distributions de la longueur de la file et des temps d'attente. Elles sont de
+    taille fixe, ou presque, quel que soit le nombre de clients, et se fusionnent d'une replication a l'autre.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple (x, y, z, w, lam, mu, alpha, beta, temps_simulation) renvoye par
+                       parametres_simulation
+    :type parametres: tuple
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param cellule: le couple (nombre de serveurs, numero de la replication)
+    :type cellule: tuple
+    :param communs: si vrai, la graine ne depend que du numero de la replication (voir simule_cellule)
+    :type communs: bool
+    :return: le couple (distribution_file, attentes) du magasin (voir moteur.MoteurMagasin)
+    :rtype: tuple
+    """
+    x, y, z, w, lam, mu, alpha, beta, temps_simulation = parametres
+    cle = cellule[1:] if communs else cellule
+    simulation = classe(x, y, z, w, lam, mu, alpha, beta, cellule[0], temps_simulation,
+                        graine_replication(graine, *cle), conserve_clients=False)
+    simulation.simulation_magasin()
+    return simulation.magasin.distribution_file, simulation.magasin.attentes
+
+
+def simule_cellules(classe, parametres, graine, cellules, nb_processus=None, taille_paquet=1, communs=False,
+                    antithetique=False):
+    """Execute une liste quelconque d'unites de travail sur plusieurs processus. Chaque couple (nombre de serveurs,
+    replication) est une unite de travail; les resultats sont rendus dans l'ordre des unites, quel que soit le
+    processus qui les termine en premier.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple (x, y, z, w, lam, mu, alpha, beta, temps_simulation) renvoye par
+                       parametres_simulation
+    :type parametres: tuple
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param cellules: les couples (nombre de serveurs, numero de la replication) a simuler
+    :type cellules: list
+    :param nb_processus: le nombre de processus, le nombre de coeurs de la machine si None
+    :type nb_processus: int
+    :param taille_paquet: le nombre d'unites de travail envoyees ensemble a un processus
+    :type taille_paquet: int
+    :param communs: si vrai, les replications de meme numero partagent leurs nombres aleatoires (voir simule_cellule)
+    :type communs: bool
+    :param antithetique: si vrai, chaque cellule est simulee par une paire antithetique (voir simule_cellule)
+    :type antithetique: bool
+    :return: la recette de chaque cellule, dans l'ordre de cellules
+    :rtype: list
+    """
+    return _repartit(partial(simule_cellule, classe, parametres, graine, communs=communs,
+                             antithetique=antithetique), cellules, nb_processus, taille_paquet)
+
+
+def resume_cellules(classe, parametres, graine, cellules, nb_processus=None, taille_paquet=1, communs=False,
+                    antithetique=False):
+    """Execute une liste d'unites de travail sur plusieurs processus et renvoie leurs resumes (voir
+    resume_cellule). Les parametres sont ceux de simule_cellules.
+
+    :return: le resume de chaque cellule, dans l'ordre de cellules
+    :rtype: list
+    """
+    return _repartit(partial(resume_cellule, classe, parametres, graine, communs=communs,
+                             antithetique=antithetique), cellules, nb_processus, taille_paquet)
+
+
+def instrumente_cellules(classe, parametres, graine, cellules, nb_processus=None, taille_paquet=1, communs=False):
+    """Execute une liste d'unites de travail instrumentees sur plusieurs processus (voir instrumente_cellule).
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple renvoye par parametres_simulation
+    :type parametres: tuple
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param cellules: les couples (nombre de serveurs, numero de la replication) a simuler
+    :type cellules: list
+    :param nb_processus: le nombre de processus, le nombre de coeurs de la machine si None
+    :type nb_processus: int
+    :param taille_paquet: le nombre d'unites de travail envoyees ensemble a un processus
+    :type taille_paquet: int
+    :param communs: si vrai, les replications de meme numero partagent leurs nombres aleatoires
+    :type communs: bool
+    :return: l'instrumentation de chaque cellule, dans l'ordre de cellules
+    :rtype: list
+    """
+    return _repartit(partial(instrumente_cellule, classe, parametres, graine, communs=communs), cellules,
+                     nb_processus, taille_paquet)
+
+
+def distribue_cellules(classe, parametres, graine, cellules, nb_processus=None, taille_paquet=1, communs=False):
+    """Execute une liste d'unites de travail sur plusieurs processus et renvoie leurs distributions (voir
+    distribue_cellule).
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple renvoye par parametres_simulation
+    :type parametres: tuple
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param cellules: les couples (nombre de serveurs, numero de la replication) a simuler
+    :type cellules: list
+    :param nb_processus: le nombre de processus, le nombre de coeurs de la machine si None
+    :type nb_processus: int
+    :param taille_paquet: le nombre d'unites de travail envoyees ensemble a un processus
+    :type taille_paquet: int
+    :param communs: si vrai, les replications de meme numero partagent leurs nombres aleatoires
+    :type communs: bool
+    :return: le couple (distribution_file, attentes) de chaque cellule, dans l'ordre de cellules
+    :rtype: list
+    """
+    return _repartit(partial(distribue_cellule, classe, parametres, graine, communs=communs), cellules,
+                     nb_processus, taille_paquet)
+
+
+def _repartit(fonction, cellules, nb_processus, taille_paquet):
+    """Applique fonction a chaque cellule dans un ProcessPoolExecutor et renvoie les resultats dans l'ordre des
+    cellules.
+    """
+    with ProcessPoolExecutor(max_workers=nb_processus) as executeur:
+        return list(executeur.map(fonction, cellules, chunksize=taille_paquet))
+
+
+class MatriceResultats:
+    """La classe MatriceResultats represente une matrice de resumes de replications (voir resume_cellule) placee en
+    memoire partagee, ou les processus de travail ecrivent directement leurs resultats. Elle doit etre fermee par le
+    processus qui l'a creee, ce qui libere la memoire partagee.
+
+    Attributs:
+    ---------
+    memoire: le segment de memoire partagee
+            :type: multiprocessing.shared_memory.SharedMemory
+    forme: la forme (nombres de serveurs, replications, membres, champs du resume) de la matrice, le membre etant
+           celui de la paire antithetique
+            :type: tuple
+    tableau: la matrice, NaN tant qu'une replication n'a pas ete ecrite
+            :type: numpy.ndarray
+    """
+
+    def __init__(self, nb_serveurs, nb_replications, nb_membres=1):
+        """Constructeur de la classe MatriceResultats. Alloue la memoire partagee.
+
+        :param nb_serveurs: le nombre de nombres de serveurs simules
+        :type nb_serveurs: int
+        :param nb_replications: le nombre de replications par nombre de serveurs
+        :type nb_replications: int
+        :param nb_membres: 2 si chaque replication est une paire antithetique, 1 sinon
+        :type nb_membres: int
+        """
+        self.forme = (nb_serveurs, nb_replications, nb_membres, len(CHAMPS_RESUME))
+        taille = nb_serveurs * nb_replications * nb_membres * len(CHAMPS_RESUME) * np.dtype(np.float64).itemsize
+        self.memoire = shared_memory.SharedMemory(create=True, size=max(taille, 1))
+        self.tableau = np.ndarray(self.forme, dtype=np.float64, buffer=self.memoire.buf)
+        self.tableau.fill(np.nan)
+
+    def ferme(self):
+        """Libere la memoire partagee. La matrice n'est plus utilisable ensuite.
+        """
+        self.tableau = None
+        self.memoire.close()
+        self.memoire.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.ferme()
+
+
+# La matrice partagee a laquelle le processus de travail est attache, pour ne s'y attacher qu'une fois
+_attachee = {}
+
+
+def _attache(nom, forme):
+    """Renvoie la matrice partagee de nom donne, en s'y attachant si le processus ne l'est pas encore.
+    """
+    if nom not in _attachee:
+        _attachee.clear()
+        memoire = shared_memory.SharedMemory(name=nom)
+        _attachee[nom] = (memoire, np.ndarray(forme, dtype=np.float64, buffer=memoire.buf))
+    return _attachee[nom][1]
+
+
+def _ecrit_resume(nom, forme, classe, parametres, graine, communs, antithetique, unite):
+    """Simule une unite (ligne, nombre de serveurs, replication) et ecrit son resume dans la matrice partagee.
+    """
+    ligne, nbre_serveurs, replication = unite
+    resume = resume_cellule(classe, parametres, graine, (nbre_serveurs, replication), communs, antithetique)
+    _attache(nom, forme)[ligne, replication] = resume if antithetique else (resume,)
+
+
+def resume_partage(classe, parametres, graine, nbre_serveurs, nb_replications, nb_processus=None, taille_paquet=1,
+                   communs=False, antithetique=False):
+    """Simule nb_replications replications pour chaque nombre de serveurs sur plusieurs processus. Chaque processus
+    ecrit le resume de ses replications dans une MatriceResultats partagee au lieu de le renvoyer: rien n'est
+    serialise au retour, et le processus principal lit les resultats sans les copier.
+
+    :param classe: la classe de simulation a utiliser (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple renvoye par parametres_simulation
+    :type parametres: tuple
+    :param graine: la graine maitre du balayage
+    :type graine: int
+    :param nbre_serveurs: les nombres de serveurs a simuler
+    :type nbre_serveurs: list
+    :param nb_replications: le nombre de replications par nombre de serveurs
+    :type nb_replications: int
+    :param nb_processus: le nombre de processus, le nombre de coeurs de la machine si None
+    :type nb_processus: int
+    :param taille_paquet: le nombre d'unites de travail envoyees ensemble a un processus
+    :type taille_paquet: int
+    :param communs: si vrai, les replications de meme numero partagent leurs nombres aleatoires (voir simule_cellule)
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est simulee par une paire antithetique
+    :type antithetique: bool
+    :return: la matrice des resumes, indexee par le rang du nombre de serveurs dans nbre_serveurs et le numero de
+             replication, a fermer par l'appelant
+    :rtype: MatriceResultats
+    """
+    nbre_serveurs = list(nbre_serveurs)
+    matrice = MatriceResultats(len(nbre_serveurs), nb_replications, 2 if antithetique else 1)
+    unites = [(k, a, i) for k, a in enumerate(nbre_serveurs) for i in range(nb_replications)]
+    try:
+        _repartit(partial(_ecrit_resume, matrice.memoire.name, matrice.forme, classe, parametres, graine, communs,
+                          antithetique), unites, nb_processus, taille_paquet)
+    except BaseException:
+        matrice.ferme()
+        raise
+    return matrice
+
+
+def options_parallele(config):
+    """Renvoie le nombre de processus et la taille des paquets definis dans la section PARALLELE de config.ini.
+    Un nombre de processus nul signifie un processus par coeur.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :return: le couple (nb_processus, taille_paquet)
+    :rtype: tuple
+    """
+    section = config['PARALLELE'] if config.has_section('PARALLELE') else {}
+    nb_processus = int(section.get('nombre_processus', 0)) or None
+    taille_paquet = int(section.get('taille_paquet', 1))
+    return nb_processus, taille_paquet
@@ -0,0 +1,112 @@
+from statistiques import Accumulateur
+
+# Taille des lots de l'heuristique MSER-5
+TAILLE_LOT_MSER = 5
+
+
+def troncature_mser(serie, taille_lot=TAILLE_LOT_MSER):
+    """Determine le nombre d'observations de la periode de chauffe a ecarter au debut d'une serie par l'heuristique
+    MSER (MSER-5 avec la taille de lot par defaut): la serie est regroupee en lots de taille_lot observations, et la
+    troncature retenue minimise l'erreur standard de la moyenne des lots restants. Seule la premiere moitie de la
+    serie peut etre ecartee.
+
+    :param serie: les observations, dans l'ordre chronologique
+    :type serie: list
+    :param taille_lot: le nombre d'observations par lot
+    :type taille_lot: int
+    :return: le nombre d'observations a ecarter, multiple de taille_lot
+    :rtype: int
+    """
+    nb_lots = len(serie) // taille_lot
+    lots = [sum(serie[k * taille_lot:(k + 1) * taille_lot]) / taille_lot for k in range(nb_lots)]
+    # Les lots restants sont accumules de la fin vers le debut, chaque troncature coute donc O(1)
+    restants = Accumulateur()
+    critere_min = None
+    meilleure = 0
+    for d in range(nb_lots - 1, -1, -1):
+        restants.ajoute(lots[d])
+        if d > nb_lots // 2 or restants.n < 2:
+            continue
+        critere = restants.m2 / restants.n ** 2
+        if critere_min is None or critere <= critere_min:
+            critere_min = critere
+            meilleure = d
+    return meilleure * taille_lot
+
+
+def moyennes_par_lots(numerateurs, denominateurs, nb_lots):
+    """Regroupe une serie en nb_lots lots consecutifs de meme taille et renvoie l'accumulateur des moyennes des
+    lots, dont la demi-largeur donne l'intervalle de confiance de la methode des moyennes par lots. La moyenne d'un
+    lot est le rapport de la somme de ses numerateurs a la somme de ses denominateurs. Les premieres observations
+    sont ecartees si la serie ne se divise pas exactement en nb_lots lots.
+
+    :param numerateurs: les numerateurs des observations, dans l'ordre chronologique
+    :type numerateurs: list
+    :param denominateurs: les denominateurs des observations
+    :type denominateurs: list
+    :param nb_lots: le nombre de lots
+    :type nb_lots: int
+    :return: l'accumulateur des moyennes des lots
+    :rtype: Accumulateur
+    """
+    taille = len(numerateurs) // nb_lots
+    if taille == 0:
+        raise ValueError("La serie compte moins d'observations que de lots")
+    debut = len(numerateurs) - taille * nb_lots
+    moyennes = Accumulateur()
+    for k in range(debut, len(numerateurs), taille):
+        denominateur = sum(denominateurs[k:k + taille])
+        if denominateur > 0:
+            moyennes.ajoute(sum(numerateurs[k:k + taille]) / denominateur)
+    return moyennes
+
+
+def estime_regime(releves, pas_releve, cout_caisses, nb_lots=20, niveau=0.95):
+    """Estime les mesures stationnaires d'une longue simulation a partir des cumuls releves par Magasin.releve. La
+    periode de chauffe est determinee par MSER-5 sur le nombre moyen de clients dans la file de chaque intervalle,
+    puis les intervalles restants sont regroupes en nb_lots lots pour les intervalles de confiance.
+
+    :param releves: les cumuls releves toutes les pas_releve minutes
+    :type releves: list
+    :param pas_releve: l'intervalle entre deux releves
+    :type pas_releve: float
+    :param cout_caisses: le cout de l'ensemble des caisses pour une minute de fonctionnement
+    :type cout_caisses: float
+    :param nb_lots: le nombre de lots de la methode des moyennes par lots
+    :type nb_lots: int
+    :param niveau: le niveau de confiance des intervalles
+    :type niveau: float
+    :return: la duree de chauffe ecartee, en minutes, et pour chacune des mesures clients_file (nombre moyen de
+             clients dans la file), attente_moyenne (temps d'attente moyen d'un client servi) et recette_par_minute,
+             le couple (moyenne, demi-largeur de l'intervalle de confiance)
+    :rtype: dict
+    :raise ValueError: si aucun releve n'a ete fait
+    """
+    if not releves:
+        raise ValueError("Aucun releve: la simulation doit durer au moins pas_releve minutes")
+    increments = [tuple(apres - avant for avant, apres in zip(precedent, releve))
+                  for precedent, releve in zip([(0,) * len(releves[0])] + releves[:-1], releves)]
+    troncature = troncature_mser([increment[0] for increment in increments])
+    increments = increments[troncature:]
+    durees = [pas_releve] * len(increments)
+    mesures = {'clients_file': moyennes_par_lots([increment[0] for increment in increments], durees, nb_lots),
+               'attente_moyenne': moyennes_par_lots([increment[1] for increment in increments],
+                                                    [increment[2] for increment in increments], nb_lots),
+               'recette_par_minute': moyennes_par_lots([increment[3] - increment[4] - cout_caisses * pas_releve
+                                                        for increment in increments], durees, nb_lots)}
+    resultat = {nom: (lots.moyenne, lots.demi_largeur(niveau)) for nom, lots in mesures.items()}
+    resultat['chauffe'] = troncature * pas_releve
+    return resultat
+
+
+def options_stationnaire(config):
+    """Renvoie les parametres de la section STATIONNAIRE de config.ini.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :return: le tuple (duree, pas_releve, nb_lots, niveau)
+    :rtype: tuple
+    """
+    section = config['STATIONNAIRE']
+    return (float(section['duree']), float(section.get('pas_releve', 10)), int(section.get('nombre_lots', 20)),
+            float(section.get('niveau_confiance', 0.95)))
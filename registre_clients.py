@@ -0,0 +1,160 @@
+import math
+from array import array
+
+
+class RegistreClients:
+    """La classe RegistreClients conserve les informations de tous les clients d'une simulation dans des colonnes
+    de flottants. Un client est designe par son numero, c'est-a-dire sa ligne dans les colonnes.
+
+    Attributs:
+    ---------
+    moment_arrivee: le moment ou chaque client arrive dans le magasin
+            :type: array
+    temps_service: le moment ou chaque client a ete servi, math.inf tant qu'il ne l'a pas ete
+            :type: array
+    cadi: le montant du cadi de chaque client
+            :type: array
+    tolerance: le temps maximum que chaque client peut attendre dans la file
+            :type: array
+    """
+
+    def __init__(self):
+        """Constructeur de la classe RegistreClients. Le registre est vide a sa creation.
+        """
+        self.moment_arrivee = array('d')
+        self.temps_service = array('d')
+        self.cadi = array('d')
+        self.tolerance = array('d')
+
+    def ajoute(self, arrivee, cadi, tolerance):
+        """Inscrit un nouveau client dans le registre.
+
+        :param arrivee: le moment ou le client est arrive dans le magasin
+        :type arrivee: float
+        :param cadi: le montant du cadi du client
+        :type cadi: float
+        :param tolerance: le temps maximum que le client peut attendre dans la file
+        :type tolerance: float
+        :return: le numero du client
+        :rtype: int
+        """
+        numero = len(self.moment_arrivee)
+        self.moment_arrivee.append(arrivee)
+        self.temps_service.append(math.inf)
+        self.cadi.append(cadi)
+        self.tolerance.append(tolerance)
+        return numero
+
+    def libere(self, numero):
+        """Signale que le client a quitte la file. Le registre conserve toutes ses lignes, il n'y a rien a faire.
+
+        :param numero: le numero du client
+        :type numero: int
+        """
+
+    def client(self, numero):
+        """Renvoie une vue sur un client du registre.
+
+        :param numero: le numero du client
+        :type numero: int
+        :return: la vue sur le client
+        :rtype: Client
+        """
+        return Client(self, numero)
+
+    def __len__(self):
+        return len(self.moment_arrivee)
+
+
+class Client:
+    """La classe des clients represente la presence d'un client dans la simulation. C'est une vue sur une ligne
+    d'un RegistreClients, elle ne stocke que le registre et le numero du client.
+
+    Attributs:
+    ---------
+    registre: le registre ou sont conservees les informations du client
+            :type: RegistreClients
+    numero: le numero du client dans le registre
+            :type: int
+    """
+
+    __slots__ = ('registre', 'numero')
+
+    def __init__(self, registre, numero):
+        """Constructeur de la méthode
+
+        :param registre: le registre ou sont conservees les informations du client
+        :type registre: RegistreClients
+        :param numero: le numero du client dans le registre
+        :type numero: int
+        """
+        self.registre = registre
+        self.numero = numero
+
+    @property
+    def moment_arrivee(self):
+        return self.registre.moment_arrivee[self.numero]
+
+    @property
+    def temps_service(self):
+        return self.registre.temps_service[self.numero]
+
+    @temps_service.setter
+    def temps_service(self, temps):
+        self.registre.temps_service[self.numero] = temps
+
+    @property
+    def cadi(self):
+        return self.registre.cadi[self.numero]
+
+    @property
+    def tolerance(self):
+        return self.registre.tolerance[self.numero]
+
+    def donne_arrivee(self):
+        """Donne le moment ou le client est arrive dans le magasin.
+
+        :return: Le moment ou le client est arrive
+        :rtype str
+        """
+        return str(self.moment_arrivee)
+
+    def donne_temps_attente(self):
+        """Donne le temps que le client a du attendre dans la file avant d'être à une caisse. En se basant sur la
+        différence entre le moment où il a été servi et le moment où il est entré dans le magasin.
+
+        :return: le temps que le client a attendu
+        :rtype: float
+        """
+        return float(self.temps_service - self.moment_arrivee)
+
+
+class RegistreRecyclable(RegistreClients):
+    """La classe RegistreRecyclable est un RegistreClients dont les lignes des clients partis sont reutilisees. Sa
+    taille ne depend que du nombre de clients presents en meme temps dans le magasin, et non de la duree de la
+    simulation. Les informations d'un client ne sont plus disponibles apres sa liberation.
+
+    Attributs:
+    ---------
+    lignes_libres: les numeros des lignes reutilisables
+            :type: list
+    """
+
+    def __init__(self):
+        """Constructeur de la classe RegistreRecyclable. Le registre est vide a sa creation.
+        """
+        RegistreClients.__init__(self)
+        self.lignes_libres = []
+
+    def ajoute(self, arrivee, cadi, tolerance):
+        if not self.lignes_libres:
+            return RegistreClients.ajoute(self, arrivee, cadi, tolerance)
+        numero = self.lignes_libres.pop()
+        self.moment_arrivee[numero] = arrivee
+        self.temps_service[numero] = math.inf
+        self.cadi[numero] = cadi
+        self.tolerance[numero] = tolerance
+        return numero
+
+    def libere(self, numero):
+        self.lignes_libres.append(numero)
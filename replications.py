@@ -0,0 +1,59 @@
+import math
+
+from statistiques import Accumulateur, quantile_student
+
+
+def recettes_adaptatives(simule, nbre_serveurs, demi_largeur, niveau=0.95, minimum=10, maximum=1000):
+    """Simule chaque nombre de serveurs jusqu'a ce que l'intervalle de confiance sur la recette moyenne ait une
+    demi-largeur inferieure a demi_largeur, ou que maximum replications aient ete faites. Les replications sont
+    lancees par tours: a chaque tour, le nombre de replications manquantes est estime a partir de la variance observee,
+    sans plus que doubler le nombre de replications deja faites.
+
+    :param simule: la fonction qui simule une liste de couples (nombre de serveurs, numero de replication) et renvoie
+                   leurs recettes dans le meme ordre
+    :type simule: callable
+    :param nbre_serveurs: les nombres de serveurs a simuler
+    :type nbre_serveurs: list
+    :param demi_largeur: la demi-largeur visee de l'intervalle de confiance
+    :type demi_largeur: float
+    :param niveau: le niveau de confiance de l'intervalle
+    :type niveau: float
+    :param minimum: le nombre de replications du premier tour
+    :type minimum: int
+    :param maximum: le nombre maximum de replications par nombre de serveurs
+    :type maximum: int
+    :return: pour chaque nombre de serveurs, dans l'ordre de nbre_serveurs, le couple (recettes, accumulateur des
+             recettes)
+    :rtype: list
+    """
+    nbre_serveurs = list(nbre_serveurs)
+    recettes = {a: [] for a in nbre_serveurs}
+    accumulateurs = {a: Accumulateur() for a in nbre_serveurs}
+    a_simuler = {a: min(max(minimum, 2), maximum) for a in nbre_serveurs}
+    while a_simuler:
+        cellules = [(a, i) for a, nombre in a_simuler.items()
+                    for i in range(len(recettes[a]), len(recettes[a]) + nombre)]
+        for (a, i), recette in zip(cellules, simule(cellules)):
+            recettes[a].append(recette)
+            accumulateurs[a].ajoute(recette)
+        a_simuler = {}
+        for a in nbre_serveurs:
+            accumulateur = accumulateurs[a]
+            if accumulateur.n < maximum and accumulateur.demi_largeur(niveau) > demi_largeur:
+                quantile = quantile_student(0.5 + niveau / 2, accumulateur.n - 1)
+                necessaires = math.ceil(accumulateur.variance() * (quantile / demi_largeur) ** 2)
+                a_simuler[a] = min(max(necessaires - accumulateur.n, 1), accumulateur.n, maximum - accumulateur.n)
+    return [(recettes[a], accumulateurs[a]) for a in nbre_serveurs]
+
+
+def options_adaptatives(config):
+    """Renvoie les parametres de la section ADAPTATIF de config.ini.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :return: le tuple (demi_largeur, niveau, minimum, maximum)
+    :rtype: tuple
+    """
+    section = config['ADAPTATIF']
+    return (float(section['demi_largeur']), float(section.get('niveau_confiance', 0.95)),
+            int(section.get('replications_min', 10)), int(section.get('replications_max', 1000)))
@@ -0,0 +1,149 @@
+import numpy as np
+
+
+def simulation_lot(x, y, z, w, lam, mu, alpha, nbre_serveurs, temps_simulation, nb_replications, graine=None):
+    """Simule en parallele nb_replications magasins independants, de la meme maniere que
+    Simulation.simulation_magasin, en faisant avancer toutes les replications d'un evenement a chaque pas. L'etat de
+    chaque replication (prochaine arrivee, fin de service de chaque caisse, file des clients) est conserve dans des
+    tableaux NumPy indexes par le numero de replication. Comme dans Magasin.simule, la file est servie dans l'ordre
+    d'arrivee et chaque client qui attend part a l'echeance de sa tolerance.
+
+    :param x: la valeur maximal que peut prendre un cadi lors de cette simulation
+    :type x: float
+    :param y: le pourcentage de benefice qui sera pris par cadi lors de la simulation
+    :type y: float
+    :param z: le cout fixe que coute au magasin le depart d'un client
+    :type z: float
+    :param w: le cout d'une caisse pour une minute de fonctionnement
+    :type w: float
+    :param lam: la variable aleatoire de type exponentielle negative pour determiner le moment d'arriver
+    :type lam: float
+    :param mu: la variable aleatoire de type exponentielle negative pour determiner le temps de traitement
+    :type mu: float
+    :param alpha: la variable aleatoire de type exponentielle negative pour determiner le temps d'attente maximum
+    :type alpha: float
+    :param nbre_serveurs: le nombre de serveurs de chaque replication, un entier commun a toutes les replications
+                          ou une sequence de nb_replications entiers
+    :type nbre_serveurs: int or list
+    :param temps_simulation: la duree de la simulation
+    :type temps_simulation: float
+    :param nb_replications: le nombre de replications a simuler
+    :type nb_replications: int
+    :param graine: la graine ou le generateur NumPy a utiliser, un generateur initialise par le systeme si None
+    :type graine: int or numpy.random.SeedSequence or numpy.random.Generator
+    :return: la recette de chaque replication
+    :rtype: numpy.ndarray
+    """
+    rng = np.random.default_rng(graine)
+    serveurs = np.broadcast_to(np.asarray(nbre_serveurs, dtype=np.int64), (nb_replications,))
+    nb_caisses = int(serveurs.max()) if nb_replications else 0
+
+    # Etat des replications. La file de chaque replication occupe les places [0, fin_file) dans l'ordre d'arrivee;
+    # la place d'un client servi ou parti a une echeance infinie, et les places sont tassees quand la file est pleine
+    temps = np.zeros(nb_replications)
+    prochaine_arrivee = rng.exponential(1 / lam, nb_replications)
+    fin_service = np.full((nb_replications, nb_caisses), np.inf)
+    caisse_ouverte = np.arange(nb_caisses) < serveurs[:, None]
+    capacite = 16
+    file_cadi = np.empty((nb_replications, capacite))
+    file_echeance = np.full((nb_replications, capacite), np.inf)
+    fin_file = np.zeros(nb_replications, dtype=np.int64)
+
+    # Statistiques
+    benefice = np.zeros(nb_replications)
+    couts_rearrangement = np.zeros(nb_replications)
+
+    while True:
+        actives = np.flatnonzero(temps < temps_simulation)
+        if actives.size == 0:
+            break
+
+        # Choix du prochain evenement de chaque replication active; a temps egal, une arrivee passe avant une fin
+        # de service, qui passe avant un abandon, comme dans l'echeancier de Magasin.simule
+        caisse = fin_service[actives].argmin(axis=1)
+        temps_prochain_service = fin_service[actives, caisse]
+        place_abandon = file_echeance[actives].argmin(axis=1)
+        temps_prochain_abandon = file_echeance[actives, place_abandon]
+        temps_prochaine_arrivee = prochaine_arrivee[actives]
+        arrivee = (temps_prochaine_arrivee <= temps_prochain_service) & (
+                temps_prochaine_arrivee <= temps_prochain_abandon)
+        fin = ~arrivee & (temps_prochain_service <= temps_prochain_abandon)
+        abandon = ~arrivee & ~fin
+        temps_prochain_evenement = np.where(arrivee, temps_prochaine_arrivee,
+                                            np.minimum(temps_prochain_service, temps_prochain_abandon))
+        temps[actives] = temps_prochain_evenement
+
+        # Arrivee d'un client
+        a = actives[arrivee & (temps_prochain_evenement < temps_simulation)]
+        if a.size:
+            cadi = rng.uniform(0, x, a.size)
+            tolerance = rng.exponential(1 / alpha, a.size)
+            suivante = temps[a] + rng.exponential(1 / lam, a.size)
+            continue_arriver = suivante < temps_simulation
+            prochaine_arrivee[a] = np.where(continue_arriver, suivante, np.inf)
+
+            libres = np.isinf(fin_service[a]) & caisse_ouverte[a]
+            caisse_libre = libres.argmax(axis=1)
+            servi = continue_arriver & libres.any(axis=1)
+            s = a[servi]
+            fin_service[s, caisse_libre[servi]] = temps[s] + rng.exponential(1 / mu, s.size)
+            benefice[s] += cadi[servi] * y
+
+            attend = continue_arriver & ~servi
+            f = a[attend]
+            if f.size:
+                pleines = f[fin_file[f] >= capacite]
+                if pleines.size:
+                    fin_file[pleines] = _tasse(file_cadi, file_echeance, pleines)
+                    if fin_file[f].max() >= capacite:
+                        capacite *= 2
+                        file_cadi = _agrandit(file_cadi, capacite, np.nan)
+                        file_echeance = _agrandit(file_echeance, capacite, np.inf)
+                position = fin_file[f]
+                file_cadi[f, position] = cadi[attend]
+                file_echeance[f, position] = temps[f] + tolerance[attend]
+                fin_file[f] += 1
+
+        # Fin de service, meme si elle a lieu apres la fin de la simulation: la caisse sert le premier arrive des
+        # clients qui attendent encore
+        c = actives[fin]
+        if c.size:
+            caisse_fin = caisse[fin]
+            en_attente = np.isfinite(file_echeance[c])
+            avec_file = en_attente.any(axis=1)
+            fin_service[c[~avec_file], caisse_fin[~avec_file]] = np.inf
+
+            p = c[avec_file]
+            position = en_attente[avec_file].argmax(axis=1)
+            file_echeance[p, position] = np.inf
+            fin_service[p, caisse_fin[avec_file]] = temps[p] + rng.exponential(1 / mu, p.size)
+            benefice[p] += file_cadi[p, position] * y
+
+        # Abandon d'un client a l'echeance de sa tolerance
+        d = actives[abandon]
+        if d.size:
+            file_echeance[d, place_abandon[abandon]] = np.inf
+            couts_rearrangement[d] += z
+
+    return benefice - couts_rearrangement - serveurs * w * temps_simulation
+
+
+def _tasse(file_cadi, file_echeance, lignes):
+    """Regroupe en tete de file, dans leur ordre d'arrivee, les clients qui attendent encore dans les lignes donnees.
+
+    :return: le nombre de clients en attente de chaque ligne
+    :rtype: numpy.ndarray
+    """
+    echeances = file_echeance[lignes]
+    ordre = np.argsort(np.isinf(echeances), axis=1, kind='stable')
+    file_echeance[lignes] = np.take_along_axis(echeances, ordre, axis=1)
+    file_cadi[lignes] = np.take_along_axis(file_cadi[lignes], ordre, axis=1)
+    return np.isfinite(echeances).sum(axis=1)
+
+
+def _agrandit(tableau, capacite, valeur):
+    """Renvoie une copie du tableau dont la deuxieme dimension est portee a capacite, completee par valeur.
+    """
+    nouveau = np.full((tableau.shape[0], capacite), valeur)
+    nouveau[:, :tableau.shape[1]] = tableau
+    return nouveau
@@ -0,0 +1,169 @@
+import math
+from statistics import NormalDist
+
+
+class Accumulateur:
+    """La classe Accumulateur calcule au fil de l'eau le nombre, la moyenne et la variance d'une serie de valeurs
+    (algorithme de Welford), sans conserver les valeurs elles-memes.
+
+    Attributs:
+    ---------
+    n: le nombre de valeurs ajoutees
+            :type: int
+    moyenne: la moyenne des valeurs ajoutees
+            :type: float
+    m2: la somme des carres des ecarts a la moyenne
+            :type: float
+    """
+
+    __slots__ = ('n', 'moyenne', 'm2')
+
+    def __init__(self):
+        """Constructeur de la classe Accumulateur. L'accumulateur est vide a sa creation.
+        """
+        self.n = 0
+        self.moyenne = 0.0
+        self.m2 = 0.0
+
+    def ajoute(self, valeur):
+        """Ajoute une valeur a la serie.
+
+        :param valeur: la valeur a ajouter
+        :type valeur: float
+        """
+        self.n += 1
+        ecart = valeur - self.moyenne
+        self.moyenne += ecart / self.n
+        self.m2 += ecart * (valeur - self.moyenne)
+
+    def remplace(self, ancienne, nouvelle):
+        """Remplace une valeur deja ajoutee a la serie par une autre, sans changer le nombre de valeurs.
+
+        :param ancienne: la valeur a remplacer
+        :type ancienne: float
+        :param nouvelle: la valeur qui la remplace
+        :type nouvelle: float
+        """
+        ecart = nouvelle - ancienne
+        moyenne = self.moyenne + ecart / self.n
+        self.m2 += ecart * (nouvelle - moyenne + ancienne - self.moyenne)
+        self.moyenne = moyenne
+
+    def fusionne(self, autre):
+        """Ajoute a cet accumulateur toutes les valeurs d'un autre accumulateur (formule de Chan).
+
+        :param autre: l'accumulateur a fusionner
+        :type autre: Accumulateur
+        """
+        if autre.n == 0:
+            return
+        n = self.n + autre.n
+        ecart = autre.moyenne - self.moyenne
+        self.moyenne += ecart * autre.n / n
+        self.m2 += autre.m2 + ecart * ecart * self.n * autre.n / n
+        self.n = n
+
+    def variance(self):
+        """Renvoie la variance empirique (non biaisee) des valeurs ajoutees.
+
+        :return: la variance, 0 s'il y a moins de deux valeurs
+        :rtype: float
+        """
+        if self.n < 2:
+            return 0.0
+        return self.m2 / (self.n - 1)
+
+    def ecart_type(self):
+        return math.sqrt(self.variance())
+
+    def demi_largeur(self, niveau=0.95):
+        """Renvoie la demi-largeur de l'intervalle de confiance de Student sur la moyenne.
+
+        :param niveau: le niveau de confiance de l'intervalle
+        :type niveau: float
+        :return: la demi-largeur, l'infini s'il y a moins de deux valeurs
+        :rtype: float
+        """
+        if self.n < 2:
+            return math.inf
+        return quantile_student(0.5 + niveau / 2, self.n - 1) * math.sqrt(self.variance() / self.n)
+
+
+def quantile_student(probabilite, ddl):
+    """Approche le quantile de la loi de Student a ddl degres de liberte par le developpement de Cornish-Fisher
+    autour du quantile normal (Abramowitz et Stegun 26.7.5), precis au millieme a partir de 5 degres de liberte.
+    En deca, ou le developpement sous-estime nettement le quantile (11,30 au lieu de 12,71 a 0,975 pour un degre de
+    liberte), il est corrige par la methode de Newton sur la fonction de repartition exacte (voir
+    _repartition_student).
+
+    :param probabilite: la probabilite dont on cherche le quantile
+    :type probabilite: float
+    :param ddl: le nombre de degres de liberte
+    :type ddl: int
+    :return: le quantile
+    :rtype: float
+    """
+    z = NormalDist().inv_cdf(probabilite)
+    z2 = z * z
+    t = z * (1 + (z2 + 1) / (4 * ddl) + (5 * z2 * z2 + 16 * z2 + 3) / (96 * ddl ** 2)
+             + (3 * z2 ** 3 + 19 * z2 * z2 + 17 * z2 - 15) / (384 * ddl ** 3)
+             + (79 * z2 ** 4 + 776 * z2 ** 3 + 1482 * z2 * z2 - 1920 * z2 - 945) / (92160 * ddl ** 4))
+    if ddl >= 5:
+        return t
+    # densite de la loi de Student en t: constante * (1 + t^2 / ddl)^(-(ddl + 1) / 2)
+    constante = math.exp(math.lgamma((ddl + 1) / 2) - math.lgamma(ddl / 2)) / math.sqrt(ddl * math.pi)
+    for _ in range(50):
+        pas = (_repartition_student(t, ddl) - probabilite) / (constante * (1 + t * t / ddl) ** (-(ddl + 1) / 2))
+        t -= pas
+        if abs(pas) <= 1e-12 * max(1.0, abs(t)):
+            break
+    return t
+
+
+def _repartition_student(t, ddl):
+    """Renvoie la fonction de repartition exacte de la loi de Student a ddl degres de liberte, ddl entier, par les
+    sommes finies d'Abramowitz et Stegun 26.7.3 et 26.7.4.
+
+    :param t: la valeur ou evaluer la fonction de repartition
+    :type t: float
+    :param ddl: le nombre de degres de liberte, entier strictement positif
+    :type ddl: int
+    :rtype: float
+    """
+    theta = math.atan(abs(t) / math.sqrt(ddl))
+    cos2 = math.cos(theta) ** 2
+    if ddl % 2:  # ddl impair
+        terme = somme = math.cos(theta) if ddl > 1 else 0.0
+        for k in range(3, ddl - 1, 2):
+            terme *= (k - 1) / k * cos2
+            somme += terme
+        probabilite = 2 / math.pi * (theta + math.sin(theta) * somme)
+    else:
+        terme = somme = 1.0
+        for k in range(2, ddl - 1, 2):
+            terme *= (k - 1) / k * cos2
+            somme += terme
+        probabilite = math.sin(theta) * somme
+    # probabilite est celle de |T| <= |t|
+    return 0.5 + math.copysign(probabilite / 2, t)
+
+
+def facteur_antithetique(paires):
+    """Estime le facteur de reduction de variance obtenu par des paires antithetiques: la variance de la moyenne de
+    deux replications independantes divisee par la variance de la moyenne d'une paire. Un facteur superieur a 1
+    signifie que les paires sont plus precises que des replications independantes de meme cout.
+
+    :param paires: les couples de valeurs des deux membres de chaque paire
+    :type paires: list
+    :return: le facteur de reduction de variance, l'infini si les moyennes des paires ne varient pas
+    :rtype: float
+    """
+    valeurs = Accumulateur()
+    moyennes = Accumulateur()
+    for valeur, valeur_antithetique in paires:
+        valeurs.ajoute(valeur)
+        valeurs.ajoute(valeur_antithetique)
+        moyennes.ajoute((valeur + valeur_antithetique) / 2)
+    if moyennes.variance() == 0:
+        return math.inf
+    return valeurs.variance() / (2 * moyennes.variance())
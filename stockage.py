@@ -0,0 +1,175 @@
+import json
+import os
+
+import numpy as np
+
+from aleatoire import graine_maitre
+
+# Noms des fichiers d'un stockage binaire
+MANIFESTE = 'manifeste.json'
+RESULTATS = 'resultats.npy'
+
+
+class StockageBinaire:
+    """La classe StockageBinaire conserve les resumes des replications d'un balayage (voir parallele.resume_cellule)
+    dans un dossier: un fichier .npy de flottants de forme (nombres de serveurs, replications, membres, champs du
+    resume), ouvert en memoire projetee et rempli au fur et a mesure, et un manifeste JSON des parametres du
+    balayage. Une replication non encore simulee a une recette NaN, un balayage interrompu peut donc etre repris la
+    ou il s'est arrete.
+
+    Attributs:
+    ---------
+    dossier: le dossier du stockage
+            :type: str
+    manifeste: les parametres du balayage, dont la graine maitre, les nombres de serveurs, le nombre de replications
+               et les champs du resume
+            :type: dict
+    tableau: les resumes des replications, en memoire projetee
+            :type: numpy.memmap
+    """
+
+    def __init__(self, dossier, manifeste):
+        """Constructeur de la classe StockageBinaire. Reprend le stockage du dossier s'il a ete cree pour le meme
+        balayage (voir est_reprise), et le cree sinon, en remplacant un eventuel stockage different. La graine du
+        manifeste peut etre None: celle du stockage repris est alors conservee, ou une graine est tiree au hasard.
+
+        :param dossier: le dossier du stockage
+        :type dossier: str
+        :param manifeste: les parametres du balayage (voir manifeste_balayage)
+        :type manifeste: dict
+        """
+        self.dossier = dossier
+        existant = lit_manifeste(dossier)
+        if existant is not None and est_reprise(existant, manifeste):
+            self.manifeste = existant
+            self.tableau = np.load(os.path.join(dossier, RESULTATS), mmap_mode='r+')
+            return
+        os.makedirs(dossier, exist_ok=True)
+        self.manifeste = dict(manifeste, graine=graine_maitre(manifeste['graine']))
+        forme = (len(manifeste['nombres_serveurs']), manifeste['replications'], 2 if manifeste['antithetique'] else 1,
+                 len(manifeste['champs']))
+        # Le manifeste est ecrit apres les resultats, un stockage sans manifeste complet n'est jamais repris
+        if existant is not None:
+            os.remove(os.path.join(dossier, MANIFESTE))
+        self.tableau = np.lib.format.open_memmap(os.path.join(dossier, RESULTATS), mode='w+', dtype=np.float64,
+                                                 shape=forme)
+        self.tableau.fill(np.nan)
+        self.tableau.flush()
+        chemin = os.path.join(dossier, MANIFESTE)
+        with open(chemin + '.tmp', 'w') as fichier:
+            json.dump(self.manifeste, fichier, indent=2)
+        os.replace(chemin + '.tmp', chemin)
+
+    def manquantes(self):
+        """Renvoie les replications qui n'ont pas encore ete ecrites.
+
+        :return: les couples (rang du nombre de serveurs, numero de replication), dans l'ordre du balayage
+        :rtype: list
+        """
+        manquantes = np.isnan(self.tableau[:, :, :, 0]).any(axis=2)
+        return [(int(k), int(i)) for k, i in zip(*np.nonzero(manquantes))]
+
+    def ecrit(self, unites, resumes):
+        """Ecrit les resumes de replications et les reporte sur le disque.
+
+        :param unites: les couples (rang du nombre de serveurs, numero de replication) des replications
+        :type unites: list
+        :param resumes: le resume de chaque replication, ou le couple des resumes d'une paire antithetique
+        :type resumes: list
+        """
+        for (k, i), resume in zip(unites, resumes):
+            self.tableau[k, i] = resume if self.manifeste['antithetique'] else (resume,)
+        self.tableau.flush()
+
+    def ferme(self):
+        """Reporte les resultats sur le disque et libere la memoire projetee.
+        """
+        self.tableau.flush()
+        self.tableau = None
+
+
+def manifeste_balayage(classe, parametres, graine, nbre_serveurs, nb_replications, communs, antithetique, champs):
+    """Construit le manifeste d'un balayage.
+
+    :param classe: la classe de simulation (Simulation ou SimulationOriginale)
+    :type classe: type
+    :param parametres: le tuple (x, y, z, w, lam, mu, alpha, beta, temps_simulation) renvoye par
+                       parametres_simulation
+    :type parametres: tuple
+    :param graine: la graine maitre du balayage, None pour reprendre celle d'un stockage existant
+    :type graine: int
+    :param nbre_serveurs: les nombres de serveurs du balayage
+    :type nbre_serveurs: list
+    :param nb_replications: le nombre de replications par nombre de serveurs
+    :type nb_replications: int
+    :param communs: si vrai, la replication i utilise les memes nombres aleatoires pour tous les nombres de serveurs
+    :type communs: bool
+    :param antithetique: si vrai, chaque replication est une paire antithetique
+    :type antithetique: bool
+    :param champs: les noms des grandeurs du resume d'une replication
+    :type champs: tuple
+    :return: le manifeste
+    :rtype: dict
+    """
+    return {'classe': classe.__name__,
+            'parametres': dict(zip(('X', 'Y', 'Z', 'W', 'lambda', 'mu', 'alpha', 'beta', 'temps_simulation'),
+                                   parametres)),
+            'graine': graine, 'nombres_serveurs': list(nbre_serveurs), 'replications': nb_replications,
+            'communs': communs, 'antithetique': antithetique, 'champs': list(champs)}
+
+
+def est_reprise(existant, manifeste):
+    """Indique si un stockage existant peut etre repris pour un balayage: tous les parametres doivent etre les
+    memes, sauf la graine si celle du balayage est None.
+
+    :param existant: le manifeste du stockage existant
+    :type existant: dict
+    :param manifeste: le manifeste du balayage
+    :type manifeste: dict
+    :rtype: bool
+    """
+    if manifeste['graine'] is not None and manifeste['graine'] != existant['graine']:
+        return False
+    return all(existant.get(cle) == valeur for cle, valeur in manifeste.items() if cle != 'graine')
+
+
+def lit_manifeste(dossier):
+    """Renvoie le manifeste du stockage d'un dossier.
+
+    :param dossier: le dossier du stockage
+    :type dossier: str
+    :return: le manifeste, None si le dossier n'en contient pas
+    :rtype: dict
+    """
+    try:
+        with open(os.path.join(dossier, MANIFESTE)) as fichier:
+            return json.load(fichier)
+    except FileNotFoundError:
+        return None
+
+
+def charge_resultats(dossier):
+    """Ouvre en lecture seule les resultats d'un stockage, sans les charger en memoire.
+
+    :param dossier: le dossier du stockage
+    :type dossier: str
+    :return: le manifeste et le tableau des resumes en memoire projetee (voir StockageBinaire)
+    :rtype: tuple
+    """
+    manifeste = lit_manifeste(dossier)
+    if manifeste is None:
+        raise FileNotFoundError("Aucun manifeste dans le dossier %s" % dossier)
+    return manifeste, np.load(os.path.join(dossier, RESULTATS), mmap_mode='r')
+
+
+def options_stockage(config):
+    """Renvoie le dossier des stockages et le nombre de replications simulees entre deux ecritures, definis dans la
+    section STOCKAGE de config.ini.
+
+    :param config: la configuration chargee par load_config
+    :type config: configparser.ConfigParser
+    :return: le couple (dossier, taille_bloc)
+    :rtype: tuple
+    """
+    section = config['STOCKAGE'] if config.has_section('STOCKAGE') else {}
+    return section.get('dossier', 'resultats'), int(section.get('taille_bloc', 100))
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Les modules de stocha sont a la racine du depot, ils ne forment pas un paquet installe
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
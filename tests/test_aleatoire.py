@@ -0,0 +1,40 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from aleatoire import TAILLE_BLOC, Variables, graine_replication
+
+FLUX = ('arrivee', 'service', 'cadi', 'tolerance')
+
+
+def uniforme(nom, valeur):
+    """Ramene une valeur d'un flux a l'uniforme U dont elle est tiree: les exponentielles valent -log(1 - U)."""
+    return valeur if nom == 'cadi' else -math.expm1(-valeur)
+
+
+@pytest.mark.parametrize('graine', [12, np.random.SeedSequence(12), graine_replication(12, 3)],
+                         ids=['entier', 'SeedSequence', 'replication'])
+def test_paire_antithetique_complementaire(graine):
+    premier = Variables(graine, antithetique=False)
+    second = Variables(graine, antithetique=True)
+    for nom in FLUX:
+        tire, tire_complement = getattr(premier, nom), getattr(second, nom)
+        # deux blocs, pour traverser un remplissage des flux
+        for _ in range(2 * TAILLE_BLOC):
+            assert uniforme(nom, tire()) + uniforme(nom, tire_complement()) == pytest.approx(1.0, abs=1e-9)
+
+
+def test_paire_antithetique_random():
+    premier = Variables(random.Random(5), antithetique=False)
+    second = Variables(random.Random(5), antithetique=True)
+    for _ in range(200):
+        for nom in FLUX:
+            assert (uniforme(nom, getattr(premier, nom)()) + uniforme(nom, getattr(second, nom)())
+                    == pytest.approx(1.0, abs=1e-9))
+
+
+def test_paire_antithetique_generator_refusee():
+    with pytest.raises(ValueError):
+        Variables(np.random.default_rng(12), antithetique=False)
@@ -0,0 +1,131 @@
+import configparser
+import os
+
+import numpy as np
+import pytest
+
+import main
+from cache_resultats import CacheResultats
+from main import Simulation, ecrit_balayage, ecrit_balayage_binaire
+from parallele import CHAMPS_RESUME
+from stockage import StockageBinaire, est_reprise, manifeste_balayage
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """La configuration du depot avec des simulations courtes, executee dans un dossier temporaire."""
+    config = configparser.ConfigParser()
+    config.read(os.path.join(RACINE, 'config.ini'))
+    config['SIMULATION']['temps_simulation'] = '60'
+    config['PARALLELE']['nombre_processus'] = '2'
+    monkeypatch.chdir(tmp_path)
+    return config
+
+
+def lit(nom_fichier):
+    with open(nom_fichier, 'rb') as fichier:
+        return fichier.read()
+
+
+def sequentiel(config, nom_fichier, communs, antithetique):
+    ecrit_balayage(Simulation, nom_fichier, config, False, 7, False, communs, antithetique)
+    return lit(nom_fichier)
+
+
+@pytest.mark.parametrize('communs, antithetique', [(False, False), (True, False), (False, True)])
+def test_balayage_parallele_identique(config, communs, antithetique):
+    attendu = sequentiel(config, 'sequentiel.csv', communs, antithetique)
+    ecrit_balayage(Simulation, 'parallele.csv', config, True, 7, False, communs, antithetique)
+    assert lit('parallele.csv') == attendu
+    if antithetique:
+        assert lit('parallele_antithetique.csv') == lit('sequentiel_antithetique.csv')
+
+
+@pytest.mark.parametrize('communs, antithetique', [(False, False), (False, True)])
+def test_balayage_partage_identique(config, communs, antithetique):
+    attendu = sequentiel(config, 'sequentiel.csv', communs, antithetique)
+    ecrit_balayage(Simulation, 'partage.csv', config, False, 7, False, communs, antithetique, partage=True)
+    assert lit('partage.csv') == attendu
+    if antithetique:
+        assert lit('partage_antithetique.csv') == lit('sequentiel_antithetique.csv')
+
+
+@pytest.mark.parametrize('parallele', [False, True])
+def test_balayage_binaire_identique(config, parallele):
+    attendu = sequentiel(config, 'sequentiel.csv', False, False)
+    ecrit_balayage_binaire(Simulation, 'binaire.csv', config, parallele, 7)
+    assert lit('binaire.csv') == attendu
+
+
+def test_balayage_binaire_reprise(config):
+    attendu = sequentiel(config, 'sequentiel.csv', False, True)
+    stockage = ecrit_balayage_binaire(Simulation, 'binaire.csv', config, False, 7, antithetique=True)
+    manifeste = stockage.manifeste
+    # un balayage interrompu laisse des replications a NaN
+    stockage = StockageBinaire(stockage.dossier, manifeste)
+    stockage.tableau[3, 40:] = np.nan
+    stockage.tableau[20, 7, 1] = np.nan
+    stockage.ferme()
+    stockage = StockageBinaire(stockage.dossier, manifeste)
+    assert stockage.manquantes() == [(3, i) for i in range(40, 100)] + [(20, 7)]
+    stockage.ferme()
+    # la reprise sans graine retrouve celle du stockage et ne simule que les replications manquantes
+    ecrit_balayage_binaire(Simulation, 'binaire.csv', config, False, None, antithetique=True)
+    assert lit('binaire.csv') == attendu
+    assert lit('binaire_antithetique.csv') == lit('sequentiel_antithetique.csv')
+
+
+def test_est_reprise():
+    parametres = (500, 0.2, 5, 0.3, 1.2, 0.1, 5, 0, 60)
+    existant = manifeste_balayage(Simulation, parametres, 7, [10, 11], 100, False, False, CHAMPS_RESUME)
+    assert est_reprise(existant, manifeste_balayage(Simulation, parametres, 7, [10, 11], 100, False, False,
+                                                    CHAMPS_RESUME))
+    assert est_reprise(existant, manifeste_balayage(Simulation, parametres, None, [10, 11], 100, False, False,
+                                                    CHAMPS_RESUME))
+    assert not est_reprise(existant, manifeste_balayage(Simulation, parametres, 8, [10, 11], 100, False, False,
+                                                        CHAMPS_RESUME))
+    assert not est_reprise(existant, manifeste_balayage(Simulation, parametres[:-1] + (600,), 7, [10, 11], 100,
+                                                        False, False, CHAMPS_RESUME))
+    assert not est_reprise(existant, manifeste_balayage(Simulation, parametres, 7, [10, 11], 100, False, True,
+                                                        CHAMPS_RESUME))
+
+
+def test_stockage_different_remplace(tmp_path):
+    parametres = (500, 0.2, 5, 0.3, 1.2, 0.1, 5, 0, 60)
+    dossier = str(tmp_path / 'stockage')
+    stockage = StockageBinaire(dossier, manifeste_balayage(Simulation, parametres, 7, [10], 2, False, False,
+                                                           CHAMPS_RESUME))
+    stockage.ecrit([(0, 0), (0, 1)], [(1.0,) * len(CHAMPS_RESUME)] * 2)
+    stockage.ferme()
+    stockage = StockageBinaire(dossier, manifeste_balayage(Simulation, parametres, 8, [10], 2, False, False,
+                                                           CHAMPS_RESUME))
+    assert stockage.manifeste['graine'] == 8
+    assert stockage.manquantes() == [(0, 0), (0, 1)]
+    stockage.ferme()
+
+
+@pytest.mark.parametrize('antithetique', [False, True])
+def test_balayage_cache_identique(config, monkeypatch, antithetique):
+    attendu = sequentiel(config, 'sequentiel.csv', False, antithetique)
+    # un cache trop petit pour le balayage: la seconde lecture melange replications lues et simulees
+    cache = CacheResultats('petit.sqlite', taille_max=1000)
+    for nom_fichier in ('froid.csv', 'partiel.csv'):
+        ecrit_balayage(Simulation, nom_fichier, config, False, 7, False, False, antithetique, cache)
+        assert lit(nom_fichier) == attendu
+    cache.ferme()
+    cache = CacheResultats('cache.sqlite')
+    ecrit_balayage(Simulation, 'froid.csv', config, True, 7, False, False, antithetique, cache)
+    assert lit('froid.csv') == attendu
+
+    def simule(*args, **kwargs):
+        raise AssertionError("replication simulee malgre le cache")
+
+    monkeypatch.setattr(main, 'resume_cellule', simule)
+    monkeypatch.setattr(main, 'resume_cellules', simule)
+    ecrit_balayage(Simulation, 'chaud.csv', config, False, 7, False, False, antithetique, cache)
+    assert lit('chaud.csv') == attendu
+    if antithetique:
+        assert lit('chaud_antithetique.csv') == lit('sequentiel_antithetique.csv')
+    cache.ferme()
@@ -0,0 +1,56 @@
+import cache_resultats
+from cache_resultats import CacheResultats
+from main import Simulation
+from parallele import CHAMPS_RESUME
+
+PARAMETRES = (500, 0.2, 5, 0.3, 1.2, 0.1, 5, 0, 600)
+
+
+def resume(valeur):
+    return (float(valeur),) * len(CHAMPS_RESUME)
+
+
+def test_eviction_moins_recemment_utilise(tmp_path):
+    cache = CacheResultats(str(tmp_path / 'cache.sqlite'), taille_max=3)
+    cache.ecrit({'a': resume(1), 'b': resume(2)})
+    cache.ecrit({'c': resume(3)})
+    # la lecture de a le rend plus recent que b et c
+    assert cache.lit(['a']) == {'a': resume(1)}
+    cache.ecrit({'d': resume(4)})
+    assert len(cache) == 3
+    assert set(cache.lit(['a', 'b', 'c', 'd'])) == {'a', 'c', 'd'}
+    cache.ferme()
+
+
+def test_dates_d_acces_conservees(tmp_path):
+    chemin = str(tmp_path / 'cache.sqlite')
+    cache = CacheResultats(chemin, taille_max=2)
+    cache.ecrit({'a': resume(1)})
+    cache.ecrit({'b': resume(2)})
+    cache.lit(['a'])
+    cache.ferme()
+    cache = CacheResultats(chemin, taille_max=2)
+    cache.ecrit({'c': resume(3)})
+    assert set(cache.lit(['a', 'b', 'c'])) == {'a', 'c'}
+    cache.ferme()
+
+
+def test_cle(monkeypatch):
+    cle = CacheResultats.cle(Simulation, PARAMETRES, 12, 7, (12, 3))
+    assert cle == CacheResultats.cle(Simulation, PARAMETRES, 12, 7, (12, 3))
+    # beta n'intervient pas dans la simulation
+    assert cle == CacheResultats.cle(Simulation, PARAMETRES[:7] + (1,) + PARAMETRES[8:], 12, 7, (12, 3))
+    assert cle != CacheResultats.cle(Simulation, PARAMETRES, 12, 7, (12, 4))
+    assert cle != CacheResultats.cle(Simulation, PARAMETRES, 12, 7, (12, 3), antithetique=False)
+    assert cle != CacheResultats.cle(Simulation, PARAMETRES[:8] + (60,), 12, 7, (12, 3))
+
+
+def test_changement_de_version_invalide(tmp_path, monkeypatch):
+    cache = CacheResultats(str(tmp_path / 'cache.sqlite'))
+    cle = CacheResultats.cle(Simulation, PARAMETRES, 12, 7, (12, 3))
+    cache.ecrit({cle: resume(1)})
+    monkeypatch.setattr(cache_resultats, 'VERSION_MODELE', cache_resultats.VERSION_MODELE + 1)
+    nouvelle = CacheResultats.cle(Simulation, PARAMETRES, 12, 7, (12, 3))
+    assert nouvelle != cle
+    assert cache.lit([nouvelle]) == {}
+    cache.ferme()
@@ -0,0 +1,43 @@
+import pytest
+
+from erlang_a import esperances_stationnaires, evalue
+from main import Simulation
+from statistiques import Accumulateur
+
+PARAMETRES = (500, 0.2, 5, 0.3)
+MU = 0.1
+TEMPS_SIMULATION = 5000
+REPLICATIONS = 8
+
+
+def test_probabilites_coherentes():
+    mesures = evalue(1.2, MU, 0.5, 12)
+    assert mesures['probabilite_servi_apres_attente'] + mesures['probabilite_abandon'] == pytest.approx(
+        mesures['probabilite_attente'], rel=1e-9)
+    assert mesures['debit_servis'] + mesures['debit_abandons'] == pytest.approx(1.2)
+
+
+def test_sans_abandon_tous_servis():
+    mesures = evalue(0.9, MU, 0, 10)
+    assert mesures['probabilite_abandon'] == 0
+    assert mesures['probabilite_servi_apres_attente'] == pytest.approx(mesures['probabilite_attente'])
+    assert mesures['attente_servis'] == pytest.approx(mesures['attente_moyenne'])
+
+
+@pytest.mark.parametrize('lam, alpha, nbre_serveurs', [(1.2, 5, 12), (1.2, 0.2, 12), (2.4, 0.5, 20)])
+def test_esperances_stationnaires_simulees(lam, alpha, nbre_serveurs):
+    esperances = [Accumulateur() for _ in range(4)]
+    abandons = Accumulateur()
+    for graine in range(REPLICATIONS):
+        simulation = Simulation(*PARAMETRES, lam, MU, alpha, 0, nbre_serveurs, TEMPS_SIMULATION, graine,
+                                conserve_clients=False)
+        simulation.simulation_magasin()
+        for accumulateur, valeur in zip(esperances, simulation.magasin.donne_esperances()):
+            accumulateur.ajoute(valeur)
+        abandons.ajoute(simulation.magasin.nb_clients_partis / simulation.magasin.nb_clients_total)
+    attendues = esperances_stationnaires(lam, MU, alpha, nbre_serveurs, TEMPS_SIMULATION)
+    # le magasin simule part vide: on tolere 2 % d'ecart en plus de l'intervalle de confiance
+    for accumulateur, attendue in zip(esperances, attendues):
+        assert abs(accumulateur.moyenne - attendue) <= accumulateur.demi_largeur(0.999) + 0.02 * attendue
+    probabilite_abandon = evalue(lam, MU, alpha, nbre_serveurs)['probabilite_abandon']
+    assert abs(abandons.moyenne - probabilite_abandon) <= abandons.demi_largeur(0.999) + 0.02 * probabilite_abandon
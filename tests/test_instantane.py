@@ -0,0 +1,79 @@
+import pytest
+
+from echeancier import ABANDON, ARRIVEE
+from extension import SimulationOriginale
+from horaires import ProfilArrivees
+from main import Simulation
+
+PARAMETRES = (500, 0.2, 5, 0.3, 1.2, 0.1, 5, 0)
+
+
+def resultats(simulation):
+    magasin = simulation.magasin
+    return (simulation.recette, magasin.nb_clients_total, magasin.nb_clients_traites, magasin.nb_clients_partis,
+            magasin.donne_esperances())
+
+
+def interrompue(classe, conserve_clients=True, arret=300, **options):
+    simulation = classe(*PARAMETRES, 12, 600, graine=3, conserve_clients=conserve_clients, **options)
+    assert simulation.simulation_magasin(arret=arret) is False
+    return simulation
+
+
+@pytest.mark.parametrize('conserve_clients', [True, False])
+@pytest.mark.parametrize('classe', [Simulation, SimulationOriginale])
+def test_fourche_sans_changement_reprend_la_simulation(classe, conserve_clients):
+    complete = classe(*PARAMETRES, 12, 600, graine=3, conserve_clients=conserve_clients)
+    complete.simulation_magasin()
+    instantane = interrompue(classe, conserve_clients, arret=123.4).instantane()
+    assert instantane.temps == 123.4
+    fourches = [instantane.fourche(), instantane.fourche()]
+    for fourche in fourches:
+        fourche.simulation_magasin()
+        assert resultats(fourche) == resultats(complete)
+
+
+@pytest.mark.parametrize('nbre_serveurs', [8, 16])
+@pytest.mark.parametrize('classe', [Simulation, SimulationOriginale])
+def test_fourche_nbre_serveurs_au_moment_de_l_instantane(classe, nbre_serveurs):
+    planifiee = classe(*PARAMETRES, 12, 600, graine=3, planning_serveurs=[(300, nbre_serveurs)])
+    planifiee.simulation_magasin()
+    fourche = interrompue(classe).instantane().fourche(nbre_serveurs=nbre_serveurs)
+    fourche.simulation_magasin()
+    assert resultats(fourche)[:4] == resultats(planifiee)[:4]
+    assert fourche.magasin.variations_caisses == planifiee.magasin.variations_caisses
+
+
+def test_fourche_lam_au_moment_de_l_instantane():
+    profil = Simulation(*PARAMETRES, 12, 600, graine=3, profil_arrivees=ProfilArrivees([(300, 2.0)]))
+    profil.simulation_magasin()
+    fourche = interrompue(Simulation).instantane().fourche(lam=2.0)
+    fourche.simulation_magasin()
+    assert resultats(fourche)[:4] == resultats(profil)[:4]
+
+
+def test_fourche_lam_refusee_avec_profil():
+    simulation = interrompue(Simulation, profil_arrivees=ProfilArrivees([(200, 2.0)]))
+    with pytest.raises(ValueError):
+        simulation.instantane().fourche(lam=2.0)
+
+
+def test_fourche_met_a_l_echelle_les_durees_restantes():
+    # un magasin sature de clients patients, pour que files et abandons planifies ne soient pas vides
+    simulation = Simulation(500, 0.2, 5, 0.3, 3.0, 0.1, 0.05, 0, 12, 600, graine=3)
+    simulation.simulation_magasin(arret=300)
+    instantane = simulation.instantane()
+    magasin = instantane.restaure().magasin
+    fourche = instantane.fourche(lam=2.0, mu=0.2, alpha=0.1).magasin
+    facteurs = {ARRIVEE: 3.0 / 2.0, ABANDON: 0.05 / 0.1}
+    assert magasin.groupes[0].file and len(magasin.groupes[0].occupees) == 12
+    for (fin, numero), (fin_fourche, numero_fourche) in zip(magasin.groupes[0].occupees,
+                                                             fourche.groupes[0].occupees):
+        assert numero_fourche == numero
+        assert fin_fourche - 300 == pytest.approx((fin - 300) * 0.1 / 0.2)
+    for client, echeance in magasin.groupes[0].file.items():
+        assert fourche.groupes[0].file[client] - 300 == pytest.approx((echeance - 300) * facteurs[ABANDON])
+    attendus = [(300 + (temps - 300) * facteurs.get(type_evenement, 1.0), type_evenement, identifiant)
+                for temps, type_evenement, identifiant in magasin.echeancier.evenements]
+    assert sorted(fourche.echeancier.evenements) == sorted(evenement for evenement in attendus
+                                                           if evenement[1] != ARRIVEE or evenement[0] < 600)
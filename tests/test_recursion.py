@@ -0,0 +1,29 @@
+import pytest
+
+from main import Simulation
+
+PARAMETRES = (500, 0.2, 5, 0.3)
+
+
+def simule(lam, nbre_serveurs, graine, recursion, conserve_clients):
+    simulation = Simulation(*PARAMETRES, lam, 0.1, 5, 0, nbre_serveurs, 600, graine,
+                            conserve_clients=conserve_clients)
+    simulation.simulation_magasin(recursion=recursion)
+    return simulation
+
+
+@pytest.mark.parametrize('conserve_clients', [True, False])
+@pytest.mark.parametrize('lam, nbre_serveurs', [(0.6, 1), (1.2, 3), (1.2, 12), (3.0, 25)])
+@pytest.mark.parametrize('graine', range(3))
+def test_recursion_identique_a_echeancier(lam, nbre_serveurs, graine, conserve_clients):
+    echeancier = simule(lam, nbre_serveurs, graine, False, conserve_clients)
+    recursion = simule(lam, nbre_serveurs, graine, True, conserve_clients)
+    a, b = echeancier.magasin, recursion.magasin
+    assert recursion.recette == echeancier.recette
+    assert (b.nb_clients_total, b.nb_clients_traites, b.nb_clients_partis) == (
+        a.nb_clients_total, a.nb_clients_traites, a.nb_clients_partis)
+    assert [caisse.nb_clients_servis for caisse in b.caisses] == [caisse.nb_clients_servis for caisse in a.caisses]
+    assert b.distribution_file.durees == a.distribution_file.durees
+    assert b.attentes.comptes == a.attentes.comptes
+    # les aires sous le nombre de clients sont sommees dans un autre ordre
+    assert b.donne_esperances() == pytest.approx(a.donne_esperances(), rel=1e-9, abs=1e-6)
@@ -0,0 +1,33 @@
+import math
+
+import pytest
+
+from aleatoire import graine_replication
+from main import Simulation
+from simulation_lot import simulation_lot
+from statistiques import Accumulateur
+
+PARAMETRES = (500, 0.2, 5, 0.3)
+NB_REPLICATIONS = 200
+
+
+@pytest.mark.parametrize('lam, alpha, nbre_serveurs', [(1.2, 5, 12), (1.2, 0.2, 10), (2.4, 0.5, 20)])
+def test_lot_accord_statistique_avec_simulation(lam, alpha, nbre_serveurs):
+    lot = Accumulateur()
+    for recette in simulation_lot(*PARAMETRES, lam, 0.1, alpha, nbre_serveurs, 600, NB_REPLICATIONS, graine=1):
+        lot.ajoute(recette)
+    sequentiel = Accumulateur()
+    for i in range(NB_REPLICATIONS):
+        simulation = Simulation(*PARAMETRES, lam, 0.1, alpha, 0, nbre_serveurs, 600, graine_replication(2, i),
+                                conserve_clients=False)
+        simulation.simulation_magasin()
+        sequentiel.ajoute(simulation.recette)
+    # les deux echantillons sont independants: l'ecart des moyennes est compare a 4 ecarts-types
+    ecart_type = math.sqrt(lot.variance() / lot.n + sequentiel.variance() / sequentiel.n)
+    assert abs(lot.moyenne - sequentiel.moyenne) <= 4 * ecart_type
+
+
+def test_lot_serveurs_par_replication():
+    recettes = simulation_lot(*PARAMETRES, 1.2, 0.1, 5, [10, 12, 14], 600, 3, graine=0)
+    assert recettes.shape == (3,)
+    assert all(math.isfinite(recette) for recette in recettes)
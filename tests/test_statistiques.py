@@ -0,0 +1,28 @@
+import pytest
+
+from statistiques import Accumulateur, quantile_student
+
+# quantiles de la loi de Student a 0,975 et 0,995, tables usuelles
+QUANTILES = {1: (12.706205, 63.656741), 2: (4.302653, 9.924843), 3: (3.182446, 5.840909), 4: (2.776445, 4.604095),
+             5: (2.570582, 4.032143), 10: (2.228139, 3.169273), 30: (2.042272, 2.749996)}
+
+
+@pytest.mark.parametrize('ddl', sorted(QUANTILES))
+def test_quantile_student(ddl):
+    for probabilite, quantile in zip((0.975, 0.995), QUANTILES[ddl]):
+        assert quantile_student(probabilite, ddl) == pytest.approx(quantile, rel=1e-3)
+        assert quantile_student(1 - probabilite, ddl) == pytest.approx(-quantile, rel=1e-3)
+
+
+def test_accumulateur_remplace():
+    valeurs = [0.5 * k * k - 3 * k for k in range(20)]
+    accumulateur = Accumulateur()
+    for valeur in valeurs:
+        accumulateur.ajoute(valeur)
+    accumulateur.remplace(valeurs[7], 42.0)
+    valeurs[7] = 42.0
+    attendu = Accumulateur()
+    for valeur in valeurs:
+        attendu.ajoute(valeur)
+    assert (accumulateur.n, accumulateur.moyenne) == (attendu.n, pytest.approx(attendu.moyenne))
+    assert accumulateur.variance() == pytest.approx(attendu.variance())